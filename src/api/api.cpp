@@ -162,8 +162,33 @@ bool equal(const T& x, const T& y)
 
 std::vector<argument> run(program& p, const parameter_map& params) { return p.eval(params); }
 
+std::vector<argument> run(execution_context& ctx, const parameter_map& params)
+{ return ctx.eval(params); }
+
 std::vector<shape> get_output_shapes(program& p) { return p.get_output_shapes(); }
 
+void add_eval_hook(program& p,
+                   migraphx_instruction_callback before,
+                   migraphx_instruction_callback after,
+                   void* data,
+                   bool outputs)
+{
+    // The info is passed as a reference to the handle, the same as other const references
+    auto wrap =
+        [=](migraphx_instruction_callback f) -> std::function<void(const instruction_info&)> {
+        if(f == nullptr)
+            return nullptr;
+        return [=](const instruction_info& info) {
+            f(reinterpret_cast<const migraphx_instruction_info*>(&info), data);
+        };
+    };
+    eval_hook h;
+    h.before  = wrap(before);
+    h.after   = wrap(after);
+    h.outputs = outputs;
+    p.add_eval_hook(h);
+}
+
 void print_program(const program& p) { std::cout << p << std::endl; }
 
 void print_module(const module& m) { std::cout << m << std::endl; }
@@ -273,6 +298,36 @@ struct migraphx_module
     migraphx::module object;
 };
 
+extern "C" struct migraphx_memory_report;
+struct migraphx_memory_report
+{
+    template <class... Ts>
+    migraphx_memory_report(Ts&&... xs) : object(std::forward<Ts>(xs)...)
+    {
+    }
+    migraphx::memory_report object;
+};
+
+extern "C" struct migraphx_instruction_info;
+struct migraphx_instruction_info
+{
+    template <class... Ts>
+    migraphx_instruction_info(Ts&&... xs) : object(std::forward<Ts>(xs)...)
+    {
+    }
+    migraphx::instruction_info object;
+};
+
+extern "C" struct migraphx_execution_context;
+struct migraphx_execution_context
+{
+    template <class... Ts>
+    migraphx_execution_context(Ts&&... xs) : object(std::forward<Ts>(xs)...)
+    {
+    }
+    migraphx::execution_context object;
+};
+
 extern "C" struct migraphx_program;
 struct migraphx_program
 {
@@ -634,6 +689,171 @@ extern "C" migraphx_status migraphx_module_print(const_migraphx_module_t module)
     });
 }
 
+extern "C" migraphx_status migraphx_memory_report_destroy(migraphx_memory_report_t memory_report)
+{
+    return migraphx::try_([&] { destroy((memory_report)); });
+}
+
+extern "C" migraphx_status
+migraphx_memory_report_literal_bytes(size_t* out, const_migraphx_memory_report_t memory_report)
+{
+    return migraphx::try_([&] {
+        if(memory_report == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter memory_report: Null pointer");
+        *out = (memory_report->object).total.literal_bytes;
+    });
+}
+
+extern "C" migraphx_status
+migraphx_memory_report_scratch_bytes(size_t* out, const_migraphx_memory_report_t memory_report)
+{
+    return migraphx::try_([&] {
+        if(memory_report == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter memory_report: Null pointer");
+        *out = (memory_report->object).total.scratch_bytes;
+    });
+}
+
+extern "C" migraphx_status
+migraphx_memory_report_parameter_bytes(size_t* out, const_migraphx_memory_report_t memory_report)
+{
+    return migraphx::try_([&] {
+        if(memory_report == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter memory_report: Null pointer");
+        *out = (memory_report->object).total.parameter_bytes;
+    });
+}
+
+extern "C" migraphx_status
+migraphx_memory_report_output_bytes(size_t* out, const_migraphx_memory_report_t memory_report)
+{
+    return migraphx::try_([&] {
+        if(memory_report == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter memory_report: Null pointer");
+        *out = (memory_report->object).total.output_bytes;
+    });
+}
+
+extern "C" migraphx_status
+migraphx_memory_report_peak_bytes(size_t* out, const_migraphx_memory_report_t memory_report)
+{
+    return migraphx::try_([&] {
+        if(memory_report == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter memory_report: Null pointer");
+        *out = (memory_report->object).total.peak_bytes;
+    });
+}
+
+extern "C" migraphx_status migraphx_instruction_info_name(
+    char* out, size_t out_size, const_migraphx_instruction_info_t instruction_info)
+{
+    return migraphx::try_([&] {
+        if(out == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter out: Null pointer");
+        if(instruction_info == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param,
+                           "Bad parameter instruction_info: Null pointer");
+        auto&& api_result = (instruction_info->object).name;
+        auto* it = std::copy_n(api_result.begin(), std::min(api_result.size(), out_size - 1), out);
+        *it      = '\0';
+    });
+}
+
+extern "C" migraphx_status
+migraphx_instruction_info_input_shapes(migraphx_shapes_t* out,
+                                       const_migraphx_instruction_info_t instruction_info)
+{
+    return migraphx::try_([&] {
+        if(instruction_info == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param,
+                           "Bad parameter instruction_info: Null pointer");
+        *out = allocate<migraphx_shapes_t>((instruction_info->object).input_shapes);
+    });
+}
+
+extern "C" migraphx_status
+migraphx_instruction_info_output_shape(const_migraphx_shape_t* out,
+                                       const_migraphx_instruction_info_t instruction_info)
+{
+    return migraphx::try_([&] {
+        if(instruction_info == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param,
+                           "Bad parameter instruction_info: Null pointer");
+        *out = object_cast<const_migraphx_shape_t>(&((instruction_info->object).output_shape));
+    });
+}
+
+extern "C" migraphx_status
+migraphx_instruction_info_time(double* out, const_migraphx_instruction_info_t instruction_info)
+{
+    return migraphx::try_([&] {
+        if(instruction_info == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param,
+                           "Bad parameter instruction_info: Null pointer");
+        *out = (instruction_info->object).time;
+    });
+}
+
+extern "C" migraphx_status
+migraphx_instruction_info_has_result(bool* out, const_migraphx_instruction_info_t instruction_info)
+{
+    return migraphx::try_([&] {
+        if(instruction_info == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param,
+                           "Bad parameter instruction_info: Null pointer");
+        *out = not(instruction_info->object).result.empty();
+    });
+}
+
+extern "C" migraphx_status
+migraphx_instruction_info_result(const_migraphx_argument_t* out,
+                                 const_migraphx_instruction_info_t instruction_info)
+{
+    return migraphx::try_([&] {
+        if(instruction_info == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param,
+                           "Bad parameter instruction_info: Null pointer");
+        *out = object_cast<const_migraphx_argument_t>(&((instruction_info->object).result));
+    });
+}
+
+extern "C" migraphx_status
+migraphx_execution_context_destroy(migraphx_execution_context_t execution_context)
+{
+    return migraphx::try_([&] { destroy((execution_context)); });
+}
+
+extern "C" migraphx_status
+migraphx_execution_context_bind(migraphx_execution_context_t execution_context,
+                                const char* name,
+                                const_migraphx_argument_t argument)
+{
+    return migraphx::try_([&] {
+        if(execution_context == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param,
+                           "Bad parameter execution_context: Null pointer");
+        if(argument == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter argument: Null pointer");
+        (execution_context->object).bind((name), (argument->object));
+    });
+}
+
+extern "C" migraphx_status
+migraphx_execution_context_run(migraphx_arguments_t* out,
+                               migraphx_execution_context_t execution_context,
+                               migraphx_program_parameters_t params)
+{
+    return migraphx::try_([&] {
+        if(execution_context == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param,
+                           "Bad parameter execution_context: Null pointer");
+        if(params == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter params: Null pointer");
+        *out = allocate<migraphx_arguments_t>(
+            migraphx::run((execution_context->object), (params->object)));
+    });
+}
+
 extern "C" migraphx_status migraphx_program_destroy(migraphx_program_t program)
 {
     return migraphx::try_([&] { destroy((program)); });
@@ -696,6 +916,49 @@ extern "C" migraphx_status migraphx_program_print(const_migraphx_program_t progr
     });
 }
 
+extern "C" migraphx_status migraphx_program_memory_report(migraphx_memory_report_t* out,
+                                                          const_migraphx_program_t program)
+{
+    return migraphx::try_([&] {
+        if(program == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter program: Null pointer");
+        *out = allocate<migraphx_memory_report_t>((program->object).get_memory_report());
+    });
+}
+
+extern "C" migraphx_status
+migraphx_program_create_execution_context(migraphx_execution_context_t* out,
+                                          const_migraphx_program_t program)
+{
+    return migraphx::try_([&] {
+        if(program == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter program: Null pointer");
+        *out = allocate<migraphx_execution_context_t>((program->object).create_execution_context());
+    });
+}
+
+extern "C" migraphx_status migraphx_program_add_eval_hook(migraphx_program_t program,
+                                                          migraphx_instruction_callback before,
+                                                          migraphx_instruction_callback after,
+                                                          void* data,
+                                                          bool outputs)
+{
+    return migraphx::try_([&] {
+        if(program == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter program: Null pointer");
+        migraphx::add_eval_hook((program->object), (before), (after), (data), (outputs));
+    });
+}
+
+extern "C" migraphx_status migraphx_program_clear_eval_hooks(migraphx_program_t program)
+{
+    return migraphx::try_([&] {
+        if(program == nullptr)
+            MIGRAPHX_THROW(migraphx_status_bad_param, "Bad parameter program: Null pointer");
+        (program->object).clear_eval_hooks();
+    });
+}
+
 extern "C" migraphx_status migraphx_program_sort(migraphx_program_t program)
 {
     return migraphx::try_([&] {
@@ -50,6 +50,10 @@ typedef struct
     const char* format;
 } migraphx_file_options;
 
+/// Callback that runs before or after an instruction when a program is evaluated
+typedef void (*migraphx_instruction_callback)(const struct migraphx_instruction_info* info,
+                                              void* data);
+
 typedef struct migraphx_shape* migraphx_shape_t;
 typedef const struct migraphx_shape* const_migraphx_shape_t;
 
@@ -74,6 +78,15 @@ typedef const struct migraphx_shapes* const_migraphx_shapes_t;
 typedef struct migraphx_module* migraphx_module_t;
 typedef const struct migraphx_module* const_migraphx_module_t;
 
+typedef struct migraphx_memory_report* migraphx_memory_report_t;
+typedef const struct migraphx_memory_report* const_migraphx_memory_report_t;
+
+typedef struct migraphx_instruction_info* migraphx_instruction_info_t;
+typedef const struct migraphx_instruction_info* const_migraphx_instruction_info_t;
+
+typedef struct migraphx_execution_context* migraphx_execution_context_t;
+typedef const struct migraphx_execution_context* const_migraphx_execution_context_t;
+
 typedef struct migraphx_program* migraphx_program_t;
 typedef const struct migraphx_program* const_migraphx_program_t;
 
@@ -179,6 +192,55 @@ migraphx_shapes_get(const_migraphx_shape_t* out, migraphx_shapes_t shapes, size_
 
 migraphx_status migraphx_module_print(const_migraphx_module_t module);
 
+migraphx_status migraphx_memory_report_destroy(migraphx_memory_report_t memory_report);
+
+migraphx_status migraphx_memory_report_literal_bytes(size_t* out,
+                                                     const_migraphx_memory_report_t memory_report);
+
+migraphx_status migraphx_memory_report_scratch_bytes(size_t* out,
+                                                     const_migraphx_memory_report_t memory_report);
+
+migraphx_status
+migraphx_memory_report_parameter_bytes(size_t* out, const_migraphx_memory_report_t memory_report);
+
+migraphx_status migraphx_memory_report_output_bytes(size_t* out,
+                                                    const_migraphx_memory_report_t memory_report);
+
+migraphx_status migraphx_memory_report_peak_bytes(size_t* out,
+                                                  const_migraphx_memory_report_t memory_report);
+
+migraphx_status migraphx_instruction_info_name(char* out,
+                                               size_t out_size,
+                                               const_migraphx_instruction_info_t instruction_info);
+
+migraphx_status
+migraphx_instruction_info_input_shapes(migraphx_shapes_t* out,
+                                       const_migraphx_instruction_info_t instruction_info);
+
+migraphx_status
+migraphx_instruction_info_output_shape(const_migraphx_shape_t* out,
+                                       const_migraphx_instruction_info_t instruction_info);
+
+migraphx_status migraphx_instruction_info_time(double* out,
+                                               const_migraphx_instruction_info_t instruction_info);
+
+migraphx_status
+migraphx_instruction_info_has_result(bool* out, const_migraphx_instruction_info_t instruction_info);
+
+migraphx_status
+migraphx_instruction_info_result(const_migraphx_argument_t* out,
+                                 const_migraphx_instruction_info_t instruction_info);
+
+migraphx_status migraphx_execution_context_destroy(migraphx_execution_context_t execution_context);
+
+migraphx_status migraphx_execution_context_bind(migraphx_execution_context_t execution_context,
+                                                const char* name,
+                                                const_migraphx_argument_t argument);
+
+migraphx_status migraphx_execution_context_run(migraphx_arguments_t* out,
+                                               migraphx_execution_context_t execution_context,
+                                               migraphx_program_parameters_t params);
+
 migraphx_status migraphx_program_destroy(migraphx_program_t program);
 
 migraphx_status migraphx_program_get_main_module(migraphx_module_t* out,
@@ -196,6 +258,20 @@ migraphx_status migraphx_program_get_output_shapes(migraphx_shapes_t* out,
 
 migraphx_status migraphx_program_print(const_migraphx_program_t program);
 
+migraphx_status migraphx_program_memory_report(migraphx_memory_report_t* out,
+                                               const_migraphx_program_t program);
+
+migraphx_status migraphx_program_create_execution_context(migraphx_execution_context_t* out,
+                                                          const_migraphx_program_t program);
+
+migraphx_status migraphx_program_add_eval_hook(migraphx_program_t program,
+                                               migraphx_instruction_callback before,
+                                               migraphx_instruction_callback after,
+                                               void* data,
+                                               bool outputs);
+
+migraphx_status migraphx_program_clear_eval_hooks(migraphx_program_t program);
+
 migraphx_status migraphx_program_sort(migraphx_program_t program);
 
 migraphx_status migraphx_program_run(migraphx_arguments_t* out,
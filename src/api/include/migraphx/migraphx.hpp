@@ -2,7 +2,9 @@
 #define MIGRAPHX_GUARD_API_RTGLIB_MIGRAPHX_HPP
 
 #include <migraphx/migraphx.h>
+#include <array>
 #include <memory>
+#include <string>
 #include <exception>
 #include <vector>
 #include <cassert>
@@ -494,6 +496,135 @@ struct module
     void print() const { call(&migraphx_module_print, mm); }
 };
 
+/// The memory used by a compiled program
+struct memory_report : MIGRAPHX_HANDLE_BASE(memory_report)
+{
+    memory_report(migraphx_memory_report* p, own) { this->set_handle(p, own{}); }
+
+    memory_report(migraphx_memory_report* p, borrow) { this->set_handle(p, borrow{}); }
+
+    /// Bytes of all the literals
+    size_t literal_bytes() const
+    {
+        size_t pout;
+        call(&migraphx_memory_report_literal_bytes, &pout, this->get_handle_ptr());
+        return pout;
+    }
+
+    /// Bytes of the scratch memory allocated for the intermediate results
+    size_t scratch_bytes() const
+    {
+        size_t pout;
+        call(&migraphx_memory_report_scratch_bytes, &pout, this->get_handle_ptr());
+        return pout;
+    }
+
+    /// Bytes of the input parameters
+    size_t parameter_bytes() const
+    {
+        size_t pout;
+        call(&migraphx_memory_report_parameter_bytes, &pout, this->get_handle_ptr());
+        return pout;
+    }
+
+    /// Bytes of the outputs
+    size_t output_bytes() const
+    {
+        size_t pout;
+        call(&migraphx_memory_report_output_bytes, &pout, this->get_handle_ptr());
+        return pout;
+    }
+
+    /// The most bytes allocated at once while running the program
+    size_t peak_bytes() const
+    {
+        size_t pout;
+        call(&migraphx_memory_report_peak_bytes, &pout, this->get_handle_ptr());
+        return pout;
+    }
+};
+
+/// An instruction passed to the callbacks of the eval hooks
+struct instruction_info
+{
+    const_migraphx_instruction_info_t info;
+    instruction_info(const_migraphx_instruction_info_t i) : info(i) {}
+
+    /// The name of the operator
+    std::string name() const
+    {
+        std::array<char, 1024> out_name;
+        call(&migraphx_instruction_info_name, out_name.data(), 1024, info);
+        return std::string(out_name.data());
+    }
+
+    shapes input_shapes() const
+    {
+        migraphx_shapes_t pout;
+        call(&migraphx_instruction_info_input_shapes, &pout, info);
+        return shapes(pout, own{});
+    }
+
+    shape output_shape() const
+    {
+        const_migraphx_shape_t pout;
+        call(&migraphx_instruction_info_output_shape, &pout, info);
+        return shape(pout);
+    }
+
+    /// Milliseconds spent running the instruction, which is zero before it runs
+    double time() const
+    {
+        double pout;
+        call(&migraphx_instruction_info_time, &pout, info);
+        return pout;
+    }
+
+    /// Whether the output of the instruction was asked for and is available
+    bool has_result() const
+    {
+        bool pout;
+        call(&migraphx_instruction_info_has_result, &pout, info);
+        return pout;
+    }
+
+    /// The output of the instruction in host memory
+    argument result() const
+    {
+        const_migraphx_argument_t pout;
+        call(&migraphx_instruction_info_result, &pout, info);
+        return argument(pout);
+    }
+};
+
+/// The state needed to run a compiled program, so several threads can run the same program
+struct execution_context : MIGRAPHX_HANDLE_BASE(execution_context)
+{
+    execution_context(migraphx_execution_context* p, own) { this->set_handle(p, own{}); }
+
+    execution_context(migraphx_execution_context* p, borrow) { this->set_handle(p, borrow{}); }
+
+    /// Bind an argument to a parameter for every run
+    void bind(const char* pname, const argument& pargument) const
+    {
+        call(&migraphx_execution_context_bind,
+             this->get_handle_ptr(),
+             pname,
+             pargument.get_handle_ptr());
+    }
+
+    /// Run the program using the inputs passed in
+    arguments eval(const program_parameters& pparams) const
+    {
+        migraphx_arguments_t pout;
+        call(&migraphx_execution_context_run,
+             &pout,
+             this->get_handle_ptr(),
+             pparams.get_handle_ptr());
+        return arguments(pout, own{});
+    }
+};
+
 /// A program represents the all computation graphs to be compiled and executed
 struct program : MIGRAPHX_HANDLE_BASE(program)
 {
@@ -542,6 +673,33 @@ struct program : MIGRAPHX_HANDLE_BASE(program)
 
     void print() const { call(&migraphx_program_print, this->get_handle_ptr()); }
 
+    /// Return the memory used by the program
+    memory_report get_memory_report() const
+    {
+        migraphx_memory_report_t pout;
+        call(&migraphx_program_memory_report, &pout, this->get_handle_ptr());
+        return memory_report(pout, own{});
+    }
+
+    /// Create a new context to run the program independently of other contexts
+    execution_context create_execution_context() const
+    {
+        migraphx_execution_context_t pout;
+        call(&migraphx_program_create_execution_context, &pout, this->get_handle_ptr());
+        return execution_context(pout, own{});
+    }
+
+    /// Add callbacks that run before and after each instruction when the program is run
+    void add_eval_hook(migraphx_instruction_callback before,
+                       migraphx_instruction_callback after,
+                       void* data   = nullptr,
+                       bool outputs = false) const
+    { call(&migraphx_program_add_eval_hook, this->get_handle_ptr(), before, after, data, outputs); }
+
+    /// Remove all the eval hooks
+    void clear_eval_hooks() const
+    { call(&migraphx_program_clear_eval_hooks, this->get_handle_ptr()); }
+
     program sort()
     {
         call(&migraphx_program_sort, this->get_handle_ptr());
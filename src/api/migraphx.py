@@ -172,6 +172,70 @@ def module(h):
     h.method('print', invoke='migraphx::print_module($@)', const=True)
 
 
+@auto_handle()
+def memory_report(h):
+    h.method('literal_bytes',
+             invoke='${memory_report}.total.literal_bytes',
+             returns='size_t',
+             const=True)
+    h.method('scratch_bytes',
+             invoke='${memory_report}.total.scratch_bytes',
+             returns='size_t',
+             const=True)
+    h.method('parameter_bytes',
+             invoke='${memory_report}.total.parameter_bytes',
+             returns='size_t',
+             const=True)
+    h.method('output_bytes',
+             invoke='${memory_report}.total.output_bytes',
+             returns='size_t',
+             const=True)
+    h.method('peak_bytes',
+             invoke='${memory_report}.total.peak_bytes',
+             returns='size_t',
+             const=True)
+
+
+@auto_handle(ref=True)
+def instruction_info(h):
+    h.method('name',
+             invoke='${instruction_info}.name',
+             returns='std::string',
+             const=True)
+    h.method('input_shapes',
+             invoke='${instruction_info}.input_shapes',
+             returns='std::vector<migraphx::shape>',
+             const=True)
+    h.method('output_shape',
+             invoke='${instruction_info}.output_shape',
+             returns='const migraphx::shape&',
+             const=True)
+    h.method('time',
+             invoke='${instruction_info}.time',
+             returns='double',
+             const=True)
+    h.method('has_result',
+             invoke='not ${instruction_info}.result.empty()',
+             returns='bool',
+             const=True)
+    h.method('result',
+             invoke='${instruction_info}.result',
+             returns='const migraphx::argument&',
+             const=True)
+
+
+@auto_handle()
+def execution_context(h):
+    h.method(
+        'bind',
+        api.params(name='const char*', argument='const migraphx::argument&'))
+    h.method('run',
+             api.params(
+                 params='std::unordered_map<std::string, migraphx::argument>'),
+             invoke='migraphx::run($@)',
+             returns='std::vector<migraphx::argument>')
+
+
 @auto_handle()
 def program(h):
     h.method('get_main_module', returns='migraphx::module*')
@@ -185,6 +249,20 @@ def program(h):
              invoke='migraphx::get_output_shapes($@)',
              returns='std::vector<migraphx::shape>')
     h.method('print', invoke='migraphx::print_program($@)', const=True)
+    h.method('memory_report',
+             fname='get_memory_report',
+             returns='migraphx::memory_report',
+             const=True)
+    h.method('create_execution_context',
+             returns='migraphx::execution_context',
+             const=True)
+    h.method('add_eval_hook',
+             api.params(before='migraphx_instruction_callback',
+                        after='migraphx_instruction_callback',
+                        data='void*',
+                        outputs='bool'),
+             invoke='migraphx::add_eval_hook($@)')
+    h.method('clear_eval_hooks')
     h.method('sort')
     h.method('run',
              api.params(
@@ -2,6 +2,7 @@
 #include "command.hpp"
 #include "verify.hpp"
 #include "perf.hpp"
+#include "numpy.hpp"
 #include "models.hpp"
 
 #include <migraphx/tf.hpp>
@@ -9,6 +10,10 @@
 #include <migraphx/stringutils.hpp>
 #include <migraphx/load_save.hpp>
 #include <migraphx/json.hpp>
+#include <migraphx/file_buffer.hpp>
+#include <migraphx/filesystem.hpp>
+#include <migraphx/time.hpp>
+#include <migraphx/trace_file.hpp>
 
 #include <migraphx/dead_code_elimination.hpp>
 #include <migraphx/eliminate_identity.hpp>
@@ -17,13 +22,17 @@
 #include <migraphx/pass_manager.hpp>
 #include <migraphx/propagate_constant.hpp>
 #include <migraphx/quantization.hpp>
+#include <migraphx/ranges.hpp>
 #include <migraphx/register_op.hpp>
 #include <migraphx/rewrite_batchnorm.hpp>
 #include <migraphx/simplify_algebra.hpp>
 #include <migraphx/simplify_reshapes.hpp>
 #include <migraphx/register_target.hpp>
 
+#include <chrono>
 #include <fstream>
+#include <iomanip>
+#include <limits>
 
 namespace migraphx {
 namespace driver {
@@ -245,22 +254,105 @@ struct program_params
 {
     std::vector<std::string> fill0{};
     std::vector<std::string> fill1{};
+    std::vector<std::string> inputs{};
+    std::string dataset;
     void parse(argument_parser& ap)
     {
         ap(fill0, {"--fill0"}, ap.help("Fill parameter with 0s"), ap.append(), ap.nargs(2));
         ap(fill1, {"--fill1"}, ap.help("Fill parameter with 1s"), ap.append(), ap.nargs(2));
+        ap(inputs,
+           {"--input"},
+           ap.help("Load parameter from a .npy file"),
+           ap.append(),
+           ap.metavar("name=file.npy"));
+        ap(dataset, {"--inputs"}, ap.help("Load parameters from the arrays in a .npz file"));
+    }
+
+    std::unordered_map<std::string, argument> load_inputs() const
+    {
+        std::unordered_map<std::string, argument> result;
+        if(not dataset.empty())
+            result = load_npz(dataset);
+        for(auto&& input : inputs)
+        {
+            auto pos = input.find('=');
+            if(pos == std::string::npos)
+                MIGRAPHX_THROW("Expected name=file.npy for --input: " + input);
+            result[input.substr(0, pos)] = load_npy(input.substr(pos + 1));
+        }
+        return result;
+    }
+
+    // Split an array into the samples for a parameter. The array is either a
+    // single sample with the shape of the parameter, or has an extra leading
+    // dimension with one sample for each index.
+    static std::vector<argument>
+    split_samples(const std::string& name, const argument& arg, const shape& s)
+    {
+        const auto& as = arg.get_shape();
+        if(as == s)
+            return {arg};
+        const auto& lens = as.lens();
+        if(as.type() != s.type() or not as.standard() or lens.size() != s.lens().size() + 1 or
+           not std::equal(lens.begin() + 1, lens.end(), s.lens().begin()) or lens.front() == 0)
+            MIGRAPHX_THROW("Incorrect shape {" + to_string(as) + "} for parameter " + name +
+                           ", expected {" + to_string(s) + "} or a batch of it");
+        std::vector<argument> result;
+        for(std::size_t i = 0; i < lens.front(); i++)
+        {
+            auto offset = i * s.bytes();
+            result.emplace_back(s, [arg, offset] { return arg.data() + offset; });
+        }
+        return result;
     }
 
-    auto generate(const program& p, const target& t, bool offload)
+    // Create a parameter map for every sample of the loaded inputs, up to
+    // max_count maps. Inputs with fewer samples are reused cyclically, and
+    // parameters that are not loaded are generated.
+    std::vector<parameter_map>
+    generate_samples(const program& p,
+                     const target& t,
+                     bool offload,
+                     std::size_t max_count = std::numeric_limits<std::size_t>::max()) const
     {
-        parameter_map m;
+        auto shapes = p.get_parameter_shapes();
+        parameter_map base;
         for(auto&& s : fill0)
-            m[s] = fill_argument(p.get_parameter_shape(s), 0);
+            base[s] = fill_argument(p.get_parameter_shape(s), 0);
         for(auto&& s : fill1)
-            m[s] = fill_argument(p.get_parameter_shape(s), 1);
-        fill_param_map(m, p, t, offload);
-        return m;
+            base[s] = fill_argument(p.get_parameter_shape(s), 1);
+        std::unordered_map<std::string, std::vector<argument>> samples;
+        std::size_t count = 1;
+        for(auto&& x : load_inputs())
+        {
+            if(not contains(shapes, x.first))
+                MIGRAPHX_THROW("Parameter not found: " + x.first);
+            auto split = split_samples(x.first, x.second, shapes.at(x.first));
+            // The fill options take precedence over the loaded inputs
+            if(contains(base, x.first))
+                continue;
+            base[x.first] = split.front();
+            count         = std::max(count, split.size());
+            if(split.size() > 1)
+                samples[x.first] = std::move(split);
+        }
+        // Generate the parameters and copy them to the target once, then only
+        // replace the loaded inputs for each sample
+        fill_param_map(base, p, t, offload);
+        std::vector<parameter_map> result(std::min(count, max_count), base);
+        for(std::size_t i = 1; i < result.size(); i++)
+        {
+            for(auto&& x : samples)
+            {
+                const auto& arg    = x.second[i % x.second.size()];
+                result[i][x.first] = offload ? arg : t.copy_to(arg);
+            }
+        }
+        return result;
     }
+
+    auto generate(const program& p, const target& t, bool offload) const
+    { return generate_samples(p, t, offload, 1).front(); }
 };
 
 struct compiler_target
@@ -294,6 +386,9 @@ struct compiler
     bool offload_copy = false;
     bool fast_math    = true;
     int quantize      = 0;
+    std::string trace_file;
+    bool profile_passes = false;
+    bool memory         = false;
 
     std::vector<std::string> fill0;
     std::vector<std::string> fill1;
@@ -312,16 +407,68 @@ struct compiler
            ap.set_value(false));
         ap(quantize, {"--fp16"}, ap.help("Quantize for fp16"), ap.set_value(q_fp16));
         ap(quantize, {"--int8"}, ap.help("Quantize for int8"), ap.set_value(q_int8));
+        ap(trace_file,
+           {"--trace"},
+           ap.help("Write a chrome trace of every run of the program to this file"));
+        ap(profile_passes,
+           {"--profile-passes"},
+           ap.help("Print the time taken by each compiler pass"),
+           ap.set_value(true));
+        ap(memory,
+           {"--memory"},
+           ap.help("Print the memory used by the compiled program"),
+           ap.set_value(true));
+    }
+
+    static void print_memory_usage(const std::string& name, const memory_usage& usage)
+    {
+        std::cout << name << ":" << std::endl;
+        std::cout << "    Literals: " << usage.literal_bytes << " bytes" << std::endl;
+        std::cout << "    Scratch: " << usage.scratch_bytes << " bytes" << std::endl;
+        std::cout << "    Parameters: " << usage.parameter_bytes << " bytes" << std::endl;
+        std::cout << "    Outputs: " << usage.output_bytes << " bytes" << std::endl;
+        std::cout << "    Peak: " << usage.peak_bytes << " bytes" << std::endl;
+        for(auto&& p : usage.op_bytes)
+            std::cout << "    " << p.first << ": " << p.second << " bytes" << std::endl;
+    }
+
+    static void print_memory_report(const memory_report& report)
+    {
+        for(auto&& p : report.modules)
+            print_memory_usage("Module " + p.first, p.second);
+        if(report.modules.size() > 1)
+            print_memory_usage("Total", report.total);
+    }
+
+    static void print_pass_profile(const pass_profile& prof)
+    {
+        auto v = prof.to_value();
+        std::cout << std::setw(40) << "Pass" << std::setw(8) << "Runs" << std::setw(14)
+                  << "Time(ms)" << std::setw(16) << "Instructions" << std::endl;
+        for(auto&& x : v.at("summary"))
+        {
+            std::cout << std::setw(40) << x.get_key() << std::setw(8)
+                      << x.at("runs").to<std::int64_t>() << std::setw(14)
+                      << x.at("time").to<double>() << std::setw(16)
+                      << x.at("instructions_delta").to<std::int64_t>() << std::endl;
+        }
+        std::cout << "Total time: " << prof.total_time() << "ms" << std::endl;
     }
 
     auto params(const program& p) { return parameters.generate(p, ct.get_target(), offload_copy); }
 
-    program compile()
+    auto samples(const program& p)
+    { return parameters.generate_samples(p, ct.get_target(), offload_copy); }
+
+    void enable_trace() const
     {
-        auto p = l.load();
-        // Dont compile if its already been compiled
-        if(p.is_compiled())
-            return p;
+        if(not trace_file.empty())
+            set_trace_file(trace_file);
+    }
+
+    void compile(program& p)
+    {
+        enable_trace();
         auto t = ct.get_target();
         if(quantize == q_fp16)
         {
@@ -334,7 +481,26 @@ struct compiler
         compile_options options;
         options.offload_copy = offload_copy;
         options.fast_math    = fast_math;
+        pass_profile prof;
+        if(profile_passes)
+            options.profile = &prof;
         p.compile(t, options);
+        if(profile_passes)
+            print_pass_profile(prof);
+        if(memory)
+            print_memory_report(p.get_memory_report());
+    }
+
+    program compile()
+    {
+        auto p = l.load();
+        // Dont compile if its already been compiled
+        if(p.is_compiled())
+        {
+            enable_trace();
+            return p;
+        }
+        compile(p);
         l.save(p);
         return p;
     }
@@ -373,6 +539,7 @@ struct verify : command<verify>
     double tolerance     = 80;
     bool per_instruction = false;
     bool reduce          = false;
+    std::size_t jobs     = 0;
     bool offload_copy    = false;
     bool fast_math       = true;
     void parse(argument_parser& ap)
@@ -393,6 +560,9 @@ struct verify : command<verify>
            {"-i", "--per-instruction"},
            ap.help("Verify each instruction"),
            ap.set_value(true));
+        ap(jobs,
+           {"-j", "--jobs"},
+           ap.help("Number of threads to verify instructions with, 0 uses one for each core"));
         ap(reduce, {"-r", "--reduce"}, ap.help("Reduce program and verify"), ap.set_value(true));
     }
 
@@ -410,7 +580,7 @@ struct verify : command<verify>
 
         if(per_instruction)
         {
-            verify_instructions(p, t, options, tolerance);
+            verify_instructions(p, t, options, tolerance, jobs);
         }
         else if(reduce)
         {
@@ -454,21 +624,408 @@ struct run_cmd : command<run_cmd>
 struct perf : command<perf>
 {
     compiler c;
-    unsigned n = 100;
+    unsigned n           = 100;
+    unsigned concurrency = 0;
+    double duration      = 10;
+    std::string format   = "text";
+    perf_options options;
     void parse(argument_parser& ap)
     {
         c.parse(ap);
         ap(n, {"--iterations", "-n"}, ap.help("Number of iterations to run for perf report"));
+        ap(options.warmup, {"--warmup"}, ap.help("Number of runs before timings are recorded"));
+        ap(options.time_budget,
+           {"--time-budget"},
+           ap.help("Stop the perf report after this many seconds of timed runs, not counting "
+                   "the warmup, 0 disables the limit"));
+        ap(options.ci_width,
+           {"--ci-width"},
+           ap.help("Stop the perf report once the 95% confidence interval is within this "
+                   "fraction of the mean, 0 disables the check"));
+        ap(options.outlier_threshold,
+           {"--outlier-threshold"},
+           ap.help("Drop samples with a modified z-score above this threshold, 0 keeps every "
+                   "sample"));
+        ap(concurrency,
+           {"--concurrency"},
+           ap.help("Measure throughput and latency running the program on this many threads"));
+        ap(duration,
+           {"--duration"},
+           ap.help("Number of seconds to run each thread count for with --concurrency"));
+        ap(format,
+           {"--format"},
+           ap.help("Output format of the perf report"),
+           ap.type("text|json|csv"));
+    }
+
+    static void print_csv(std::ostream& os, const value& v)
+    {
+        os << "type,name,op,time,mean,min,max,stddev" << std::endl;
+        auto print_stats = [&](const value& x) {
+            os << x.at("time").to<double>() << "," << x.at("mean").to<double>() << ","
+               << x.at("min").to<double>() << "," << x.at("max").to<double>() << ","
+               << x.at("stddev").to<double>() << std::endl;
+        };
+        for(auto&& ins : v.at("instructions"))
+        {
+            os << "instruction," << ins.at("name").to<std::string>() << ","
+               << ins.at("op").to<std::string>() << ",";
+            print_stats(ins);
+        }
+        for(auto&& op : v.at("operators"))
+            os << "operator,," << op.get_key() << "," << op.to<double>() << ",,,," << std::endl;
+        os << "program,total,,";
+        print_stats(v.at("total"));
+        for(auto&& key : {"rate",
+                          "total_time",
+                          "total_instructions_time",
+                          "overhead_time",
+                          "calculated_overhead_time"})
+            os << "summary," << key << ",," << v.at(key).to<double>() << ",,,," << std::endl;
+    }
+
+    void run_concurrent_report(const program& p)
+    {
+        // Copies of a gpu program share the same streams
+        if(c.ct.target_name == "gpu")
+            MIGRAPHX_THROW("--concurrency is only supported on the cpu and ref targets");
+        std::vector<program> progs(concurrency, p);
+        std::vector<std::vector<parameter_map>> samples;
+        samples.reserve(concurrency);
+        for(auto&& prog : progs)
+        {
+            samples.push_back(c.samples(prog));
+            prog.eval(samples.back().front());
+        }
+
+        std::vector<std::size_t> thread_counts;
+        for(std::size_t i = 1; i < concurrency; i *= 2)
+            thread_counts.push_back(i);
+        thread_counts.push_back(concurrency);
+
+        std::cout << "Running concurrent performance report ... " << std::endl;
+        std::cout << std::setw(8) << "Threads" << std::setw(14) << "Rate(/sec)" << std::setw(12)
+                  << "p50(ms)" << std::setw(12) << "p90(ms)" << std::setw(12) << "p99(ms)"
+                  << std::setw(12) << "p999(ms)" << std::setw(10) << "Scaling" << std::endl;
+        double base_rate = 0;
+        for(auto k : thread_counts)
+        {
+            auto r = run_concurrent(progs, samples, k, duration);
+            if(k == 1)
+                base_rate = r.rate();
+            std::cout << std::setw(8) << k << std::setw(14) << r.rate() << std::setw(12)
+                      << r.percentile(50) << std::setw(12) << r.percentile(90) << std::setw(12)
+                      << r.percentile(99) << std::setw(12) << r.percentile(99.9) << std::setw(10)
+                      << (base_rate > 0 ? r.rate() / base_rate : 0) << std::endl;
+        }
     }
 
     void run()
     {
         std::cout << "Compiling ... " << std::endl;
         auto p = c.compile();
+        if(concurrency > 0)
+        {
+            run_concurrent_report(p);
+            return;
+        }
         std::cout << "Allocating params ... " << std::endl;
-        auto m = c.params(p);
+        auto samples = c.samples(p);
+        auto m       = samples.front();
         std::cout << "Running performance report ... " << std::endl;
-        p.perf_report(std::cout, n, m);
+        if(format == "json")
+            std::cout << to_json_string(p.perf_report_data(n, m, options)) << std::endl;
+        else if(format == "csv")
+            print_csv(std::cout, p.perf_report_data(n, m, options));
+        else if(format == "text")
+            p.perf_report(std::cout, n, m, options);
+        else
+            MIGRAPHX_THROW("Unknown perf report format: " + format);
+        if(samples.size() > 1 and format == "text")
+        {
+            std::cout << "Running " << n << " iterations over " << samples.size() << " samples ... "
+                      << std::endl;
+            auto r = run_samples(p, samples, n);
+            std::cout << "Rate: " << r.rate() << "/sec" << std::endl;
+            std::cout << "Latency p50: " << r.percentile(50) << "ms, p90: " << r.percentile(90)
+                      << "ms, p99: " << r.percentile(99) << "ms" << std::endl;
+        }
+    }
+};
+
+struct sweep : command<sweep>
+{
+    compiler c;
+    std::string batches = "1,2,4,8,16,32,64";
+    unsigned n          = 100;
+    std::string format  = "text";
+    void parse(argument_parser& ap)
+    {
+        // Registered before the loader so the list is not parsed as a single batch size
+        ap(batches, {"--batch"}, ap.help("Comma separated list of batch sizes to sweep"));
+        c.parse(ap);
+        ap(n, {"--iterations", "-n"}, ap.help("Number of iterations to run for each batch size"));
+        ap(format, {"--format"}, ap.help("Output format of the results"), ap.type("text|json"));
+    }
+
+    // Set the leading dimension of each parameter that has the batch size
+    // of the reference program to the batch size
+    std::vector<std::string> batch_dims(const program& ref, std::size_t batch) const
+    {
+        auto result = c.l.param_dims;
+        auto dims   = loader::parse_param_dims(c.l.param_dims);
+        for(auto&& x : ref.get_parameter_shapes())
+        {
+            auto lens = x.second.lens();
+            if(contains(dims, x.first) or lens.empty() or lens.front() != 1)
+                continue;
+            lens.front() = batch;
+            result.push_back("@" + x.first);
+            std::transform(lens.begin(), lens.end(), std::back_inserter(result), [](auto d) {
+                return std::to_string(d);
+            });
+        }
+        return result;
+    }
+
+    value measure(std::size_t batch, const program& ref)
+    {
+        using milliseconds = std::chrono::duration<double, std::milli>;
+        auto l             = c.l;
+        l.batch            = batch;
+        if(l.model.empty())
+            l.param_dims = batch_dims(ref, batch);
+        auto p = l.load();
+
+        value result           = value::object{};
+        result["batch"]        = batch;
+        result["compile_time"] = time<milliseconds>([&] { c.compile(p); });
+        std::size_t scratch    = 0;
+        if(contains(p.get_parameter_names(), "scratch"))
+            scratch = p.get_parameter_shape("scratch").bytes();
+        result["scratch"] = scratch;
+        auto m            = c.params(p);
+        p.eval(m);
+        double total      = time<milliseconds>([&] {
+            for(unsigned i = 0; i < n; i++)
+                p.eval(m);
+        });
+        double latency    = total / n;
+        result["latency"] = latency;
+        result["rate"]    = 1000.0 * batch / latency;
+        return result;
+    }
+
+    void run()
+    {
+        std::vector<std::size_t> sizes;
+        for(auto&& b : split_string(batches, ','))
+            sizes.push_back(value_parser<std::size_t>::apply(b));
+        if(format != "text" and format != "json")
+            MIGRAPHX_THROW("Unknown sweep format: " + format);
+        // The model is parsed once with a batch size of 1 to find which
+        // parameters have a batch dimension
+        program p;
+        if(c.l.model.empty())
+        {
+            auto ref  = c.l;
+            ref.batch = 1;
+            p         = ref.load();
+        }
+
+        value results = value::array{};
+        if(format == "text")
+            std::cout << std::setw(8) << "Batch" << std::setw(14) << "Compile(ms)" << std::setw(14)
+                      << "Latency(ms)" << std::setw(16) << "Rate(samples/s)" << std::setw(14)
+                      << "Scratch(MB)" << std::endl;
+        for(auto batch : sizes)
+        {
+            auto r = measure(batch, p);
+            if(format == "text")
+                std::cout << std::setw(8) << batch << std::setw(14)
+                          << r.at("compile_time").to<double>() << std::setw(14)
+                          << r.at("latency").to<double>() << std::setw(16)
+                          << r.at("rate").to<double>() << std::setw(14)
+                          << r.at("scratch").to<double>() / (1024.0 * 1024.0) << std::endl;
+            results.push_back(r);
+        }
+        if(format == "json")
+            std::cout << to_json_string(results) << std::endl;
+    }
+};
+
+struct bench : command<bench>
+{
+    std::vector<std::string> files;
+    std::vector<std::string> models;
+    std::vector<std::string> targets;
+    unsigned batch   = 1;
+    unsigned n       = 100;
+    double tolerance = 10;
+    std::string baseline;
+    std::string output;
+
+    void parse(argument_parser& ap)
+    {
+        ap(files, {}, ap.metavar("<onnx files or directories>"), ap.append());
+        ap(models,
+           {"--model"},
+           ap.help("Built-in model to benchmark, all of them are used if none are given"),
+           ap.type("resnet50|inceptionv3|alexnet"),
+           ap.append());
+        ap(targets,
+           {"--target"},
+           ap.help("Target to benchmark on, cpu and ref are used if none are given"),
+           ap.append());
+        ap(batch, {"--batch"}, ap.help("Set batch size for the models"));
+        ap(n, {"--iterations", "-n"}, ap.help("Number of iterations to measure throughput"));
+        ap(baseline, {"--baseline"}, ap.help("Compare against the results stored in this file"));
+        ap(tolerance,
+           {"--tolerance"},
+           ap.help("Percent a result can be slower than the baseline before it is a regression"));
+        ap(output, {"--output", "-o"}, ap.help("Write the results to this file"));
+    }
+
+    std::vector<std::pair<std::string, std::function<program()>>> get_programs() const
+    {
+        std::vector<std::pair<std::string, std::function<program()>>> result;
+        auto b = batch;
+        for(auto&& model : models)
+        {
+            if(model == "resnet50")
+                result.emplace_back(model, [=] { return resnet50(b); });
+            else if(model == "inceptionv3")
+                result.emplace_back(model, [=] { return inceptionv3(b); });
+            else if(model == "alexnet")
+                result.emplace_back(model, [=] { return alexnet(b); });
+            else
+                MIGRAPHX_THROW("Unknown model: " + model);
+        }
+        std::vector<std::string> onnx_files;
+        for(auto&& file : files)
+        {
+            if(fs::is_directory(file))
+            {
+                for(auto&& entry : fs::directory_iterator(file))
+                {
+                    if(entry.path().extension() == ".onnx")
+                        onnx_files.push_back(entry.path().string());
+                }
+            }
+            else
+            {
+                onnx_files.push_back(file);
+            }
+        }
+        std::sort(onnx_files.begin(), onnx_files.end());
+        for(auto&& file : onnx_files)
+        {
+            result.emplace_back(fs::path(file).filename().string(), [=] {
+                onnx_options options;
+                options.default_dim_value = b;
+                return parse_onnx(file, options);
+            });
+        }
+        return result;
+    }
+
+    value measure(const std::function<program()>& load, const std::string& target_name) const
+    {
+        using milliseconds     = std::chrono::duration<double, std::milli>;
+        auto p                 = load();
+        auto t                 = make_target(target_name);
+        value result           = value::object{};
+        result["compile_time"] = time<milliseconds>([&] { p.compile(t); });
+        auto m                 = create_param_map(p, t);
+        result["first_run"]    = time<milliseconds>([&] { p.eval(m); });
+        double total           = time<milliseconds>([&] {
+            for(unsigned i = 0; i < n; i++)
+                p.eval(m);
+        });
+        result["latency"]      = total / n;
+        result["rate"]         = 1000.0 * n / total;
+        return result;
+    }
+
+    // Returns true if the result is slower than the baseline
+    bool is_regression(const value& result, const value& base, const std::string& key) const
+    {
+        if(not base.contains(key))
+            return false;
+        if(not result.contains(key))
+            return true;
+        return result.at(key).to<double>() > base.at(key).to<double>() * (1.0 + tolerance / 100.0);
+    }
+
+    void run()
+    {
+        if(models.empty() and files.empty())
+            models = {"resnet50", "inceptionv3", "alexnet"};
+        if(targets.empty())
+        {
+#ifdef HAVE_CPU
+            targets = {"cpu", "ref"};
+#else
+            targets = {"ref"};
+#endif
+        }
+        value base = value::object{};
+        if(not baseline.empty())
+        {
+            auto buffer = read_buffer(baseline);
+            base        = from_json_string(buffer.data(), buffer.size());
+        }
+
+        value results = value::object{};
+        std::vector<std::string> regressions;
+        std::cout << std::setw(32) << "Model" << std::setw(8) << "Target" << std::setw(14)
+                  << "Compile(ms)" << std::setw(14) << "First(ms)" << std::setw(14) << "Latency(ms)"
+                  << std::setw(14) << "Rate(/sec)" << std::endl;
+        for(auto&& prog : get_programs())
+        {
+            for(auto&& target_name : targets)
+            {
+                auto key     = prog.first + ":" + target_name;
+                value result = value::object{};
+                try
+                {
+                    result = measure(prog.second, target_name);
+                    std::cout << std::setw(32) << prog.first << std::setw(8) << target_name
+                              << std::setw(14) << result.at("compile_time").to<double>()
+                              << std::setw(14) << result.at("first_run").to<double>()
+                              << std::setw(14) << result.at("latency").to<double>() << std::setw(14)
+                              << result.at("rate").to<double>() << std::endl;
+                }
+                catch(const std::exception& e)
+                {
+                    std::cout << std::setw(32) << prog.first << std::setw(8) << target_name
+                              << "  failed: " << e.what() << std::endl;
+                    result["error"] = std::string(e.what());
+                }
+                results[key] = result;
+                if(not base.contains(key))
+                    continue;
+                for(auto&& metric : {"compile_time", "latency"})
+                {
+                    if(is_regression(result, base.at(key), metric))
+                        regressions.push_back(key + " " + metric);
+                }
+            }
+        }
+
+        if(not output.empty())
+        {
+            auto s = to_json_string(results);
+            write_buffer(output, s.data(), s.size());
+        }
+        if(not regressions.empty())
+        {
+            std::cout << std::endl << "Regressions:" << std::endl;
+            for(auto&& r : regressions)
+                std::cout << "    " << r << std::endl;
+            MIGRAPHX_THROW("Regressions found compared to the baseline: " +
+                           join_strings(regressions, ", "));
+        }
     }
 };
 
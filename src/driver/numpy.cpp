@@ -0,0 +1,222 @@
+#include "numpy.hpp"
+
+#include <migraphx/errors.hpp>
+#include <migraphx/stringutils.hpp>
+#include <algorithm>
+#include <cstdint>
+#include <cstring>
+#include <memory>
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+namespace migraphx {
+namespace driver {
+inline namespace MIGRAPHX_INLINE_NS {
+
+struct mapped_file
+{
+    char* data       = nullptr;
+    std::size_t size = 0;
+
+    mapped_file(const std::string& filename)
+    {
+        int fd = open(filename.c_str(), O_RDONLY);
+        if(fd < 0)
+            MIGRAPHX_THROW("Failed to open file: " + filename);
+        struct stat st;
+        if(fstat(fd, &st) != 0)
+        {
+            close(fd);
+            MIGRAPHX_THROW("Failed to stat file: " + filename);
+        }
+        size = st.st_size;
+        if(size > 0)
+        {
+            // The arguments are given to the program as writable, so the
+            // mapping is private to keep the file unchanged
+            auto* p = mmap(nullptr, size, PROT_READ | PROT_WRITE, MAP_PRIVATE, fd, 0);
+            if(p == MAP_FAILED)
+            {
+                close(fd);
+                MIGRAPHX_THROW("Failed to map file: " + filename);
+            }
+            data = static_cast<char*>(p);
+        }
+        close(fd);
+    }
+
+    mapped_file(const mapped_file&)            = delete;
+    mapped_file& operator=(const mapped_file&) = delete;
+
+    ~mapped_file()
+    {
+        if(data != nullptr)
+            munmap(data, size);
+    }
+};
+
+static shape::type_t parse_npy_type(const std::string& descr)
+{
+    if(descr.size() < 3 or descr[0] == '>')
+        MIGRAPHX_THROW("Unsupported npy type: " + descr);
+    auto t = descr.substr(1);
+    if(t == "b1")
+        return shape::bool_type;
+    if(t == "f2")
+        return shape::half_type;
+    if(t == "f4")
+        return shape::float_type;
+    if(t == "f8")
+        return shape::double_type;
+    if(t == "u1")
+        return shape::uint8_type;
+    if(t == "i1")
+        return shape::int8_type;
+    if(t == "u2")
+        return shape::uint16_type;
+    if(t == "i2")
+        return shape::int16_type;
+    if(t == "i4")
+        return shape::int32_type;
+    if(t == "i8")
+        return shape::int64_type;
+    if(t == "u4")
+        return shape::uint32_type;
+    if(t == "u8")
+        return shape::uint64_type;
+    MIGRAPHX_THROW("Unsupported npy type: " + descr);
+}
+
+// Find the value for key in the python dict literal of the npy header
+static std::string header_value(const std::string& header, const std::string& key)
+{
+    auto pos = header.find("'" + key + "'");
+    if(pos == std::string::npos)
+        MIGRAPHX_THROW("Missing " + key + " in npy header");
+    pos = header.find(':', pos);
+    if(pos == std::string::npos)
+        MIGRAPHX_THROW("Invalid npy header");
+    pos = header.find_first_not_of(' ', pos + 1);
+    if(header[pos] == '(')
+        return header.substr(pos + 1, header.find(')', pos) - pos - 1);
+    auto end = header.find_first_of(",}", pos);
+    return trim(header.substr(pos, end - pos), [](char c) { return c == ' ' or c == '\''; });
+}
+
+static argument parse_npy(std::shared_ptr<mapped_file> file, std::size_t offset, std::size_t size)
+{
+    const char* magic = "\x93NUMPY";
+    char* start       = file->data + offset;
+    if(size < 10 or std::memcmp(start, magic, 6) != 0)
+        MIGRAPHX_THROW("Invalid npy file");
+    auto major              = static_cast<std::uint8_t>(start[6]);
+    std::size_t header_size = 0;
+    std::size_t header_pos  = 0;
+    if(major == 1)
+    {
+        header_size = static_cast<std::uint8_t>(start[8]) |
+                      (static_cast<std::size_t>(static_cast<std::uint8_t>(start[9])) << 8u);
+        header_pos  = 10;
+    }
+    else
+    {
+        if(size < 12)
+            MIGRAPHX_THROW("Invalid npy file");
+        for(std::size_t i = 0; i < 4; i++)
+            header_size |= static_cast<std::size_t>(static_cast<std::uint8_t>(start[8 + i]))
+                           << (8 * i);
+        header_pos = 12;
+    }
+    if(header_pos + header_size > size)
+        MIGRAPHX_THROW("Invalid npy header");
+    std::string header(start + header_pos, header_size);
+
+    auto type = parse_npy_type(header_value(header, "descr"));
+    std::vector<std::size_t> lens;
+    for(auto&& d : split_string(header_value(header, "shape"), ','))
+    {
+        auto x = trim(d);
+        if(not x.empty())
+            lens.push_back(std::stoul(x));
+    }
+    shape s{type, lens};
+    if(header_value(header, "fortran_order") == "True" and lens.size() > 1)
+    {
+        std::vector<std::size_t> strides(lens.size(), 1);
+        for(std::size_t i = 1; i < lens.size(); i++)
+            strides[i] = strides[i - 1] * lens[i - 1];
+        s = shape{type, lens, strides};
+    }
+    auto data_pos = header_pos + header_size;
+    if(data_pos + s.bytes() > size)
+        MIGRAPHX_THROW("Truncated npy data");
+    char* data = start + data_pos;
+    return {s, [file, data] { return data; }};
+}
+
+argument load_npy(const std::string& filename)
+{
+    auto file = std::make_shared<mapped_file>(filename);
+    return parse_npy(file, 0, file->size);
+}
+
+template <class T>
+static T read_le(const char* p)
+{
+    T result = 0;
+    for(std::size_t i = 0; i < sizeof(T); i++)
+        result |= static_cast<T>(static_cast<std::uint8_t>(p[i])) << (8 * i);
+    return result;
+}
+
+std::unordered_map<std::string, argument> load_npz(const std::string& filename)
+{
+    std::unordered_map<std::string, argument> result;
+    auto file       = std::make_shared<mapped_file>(filename);
+    std::size_t pos = 0;
+    // Walk the local file headers of the zip archive
+    while(pos + 30 <= file->size and read_le<std::uint32_t>(file->data + pos) == 0x04034b50)
+    {
+        const char* h        = file->data + pos;
+        auto flags           = read_le<std::uint16_t>(h + 6);
+        auto method          = read_le<std::uint16_t>(h + 8);
+        std::size_t size     = read_le<std::uint32_t>(h + 18);
+        std::size_t name_len = read_le<std::uint16_t>(h + 26);
+        std::size_t extra    = read_le<std::uint16_t>(h + 28);
+        std::string name(h + 30, name_len);
+        if(method != 0)
+            MIGRAPHX_THROW("Compressed npz files are not supported, save " + filename +
+                           " with numpy.savez: " + name);
+        if((flags & 0x8u) != 0)
+            MIGRAPHX_THROW("Unsupported zip data descriptor in " + filename);
+        // Large files use the zip64 extra field for the size
+        if(size == 0xFFFFFFFF)
+        {
+            const char* e = h + 30 + name_len;
+            for(std::size_t i = 0; i + 4 <= extra;)
+            {
+                auto id  = read_le<std::uint16_t>(e + i);
+                auto len = read_le<std::uint16_t>(e + i + 2);
+                if(id == 0x0001 and len >= 16)
+                    size = read_le<std::uint64_t>(e + i + 12);
+                i += 4 + len;
+            }
+        }
+        auto data_pos = pos + 30 + name_len + extra;
+        if(data_pos + size > file->size)
+            MIGRAPHX_THROW("Truncated npz file: " + filename);
+        if(ends_with(name, ".npy"))
+            name = name.substr(0, name.size() - 4);
+        result[name] = parse_npy(file, data_pos, size);
+        pos          = data_pos + size;
+    }
+    if(result.empty())
+        MIGRAPHX_THROW("No arrays found in npz file: " + filename);
+    return result;
+}
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace driver
+} // namespace migraphx
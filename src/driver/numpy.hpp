@@ -0,0 +1,25 @@
+#ifndef MIGRAPHX_GUARD_RTGLIB_DRIVER_NUMPY_HPP
+#define MIGRAPHX_GUARD_RTGLIB_DRIVER_NUMPY_HPP
+
+#include <migraphx/argument.hpp>
+#include <string>
+#include <unordered_map>
+
+namespace migraphx {
+namespace driver {
+inline namespace MIGRAPHX_INLINE_NS {
+
+// Load an array from a .npy file. The file is memory mapped and the
+// returned argument refers to the mapped data.
+argument load_npy(const std::string& filename);
+
+// Load every array from an uncompressed .npz file, such as one written by
+// numpy.savez. The file is memory mapped and the returned arguments refer
+// to the mapped data.
+std::unordered_map<std::string, argument> load_npz(const std::string& filename);
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace driver
+} // namespace migraphx
+
+#endif
@@ -2,6 +2,12 @@
 
 #include <migraphx/generate.hpp>
 #include <migraphx/register_target.hpp>
+#include <migraphx/time.hpp>
+#include <algorithm>
+#include <cassert>
+#include <chrono>
+#include <cmath>
+#include <thread>
 #ifdef HAVE_GPU
 #include <migraphx/gpu/hip.hpp>
 #endif
@@ -87,6 +93,79 @@ target get_target(bool gpu)
 
 void compile_program(program& p, bool gpu) { p.compile(get_target(gpu)); }
 
+double concurrent_report::rate() const
+{
+    if(seconds <= 0)
+        return 0;
+    return latencies.size() / seconds;
+}
+
+double concurrent_report::percentile(double p) const
+{
+    if(latencies.empty())
+        return 0;
+    auto rank = static_cast<std::size_t>(std::ceil(p * latencies.size() / 100.0));
+    return latencies[std::min(std::max<std::size_t>(rank, 1), latencies.size()) - 1];
+}
+
+concurrent_report run_concurrent(const std::vector<program>& progs,
+                                 const std::vector<std::vector<parameter_map>>& samples,
+                                 std::size_t n,
+                                 double duration)
+{
+    using milliseconds = std::chrono::duration<double, std::milli>;
+    using seconds      = std::chrono::duration<double>;
+    assert(n <= progs.size() and n <= samples.size());
+    concurrent_report r;
+    r.threads = n;
+    std::vector<std::vector<double>> results(n);
+    std::vector<std::thread> threads;
+    threads.reserve(n);
+    auto start = std::chrono::steady_clock::now();
+    auto deadline =
+        start + std::chrono::duration_cast<std::chrono::steady_clock::duration>(seconds{duration});
+    for(std::size_t i = 0; i < n; i++)
+    {
+        threads.emplace_back([&, i] {
+            const auto& params = samples[i];
+            for(std::size_t j = 0; std::chrono::steady_clock::now() < deadline; j++)
+            {
+                const auto& m = params[j % params.size()];
+                results[i].push_back(time<milliseconds>([&] { progs[i].eval(m); }));
+            }
+        });
+    }
+    for(auto&& t : threads)
+        t.join();
+    r.seconds =
+        std::chrono::duration_cast<seconds>(std::chrono::steady_clock::now() - start).count();
+    for(auto&& v : results)
+        r.latencies.insert(r.latencies.end(), v.begin(), v.end());
+    std::sort(r.latencies.begin(), r.latencies.end());
+    return r;
+}
+
+concurrent_report
+run_samples(const program& p, const std::vector<parameter_map>& samples, std::size_t n)
+{
+    using milliseconds = std::chrono::duration<double, std::milli>;
+    using seconds      = std::chrono::duration<double>;
+    assert(not samples.empty());
+    concurrent_report r;
+    r.threads = 1;
+    r.latencies.reserve(n);
+    auto start = std::chrono::steady_clock::now();
+    for(std::size_t i = 0; i < n; i++)
+    {
+        const auto& m = samples[i % samples.size()];
+        r.latencies.push_back(time<milliseconds>([&] { p.eval(m); }));
+    }
+    r.seconds =
+        std::chrono::duration_cast<seconds>(std::chrono::steady_clock::now() - start).count();
+    std::sort(r.latencies.begin(), r.latencies.end());
+    return r;
+}
+
 } // namespace MIGRAPHX_INLINE_NS
 } // namespace driver
 } // namespace migraphx
@@ -2,6 +2,7 @@
 #define MIGRAPHX_GUARD_RTGLIB_PERF_HPP
 
 #include <migraphx/program.hpp>
+#include <vector>
 
 namespace migraphx {
 namespace driver {
@@ -16,6 +17,29 @@ parameter_map create_param_map(const program& p, bool gpu = true);
 target get_target(bool gpu);
 void compile_program(program& p, bool gpu = true);
 
+struct concurrent_report
+{
+    std::size_t threads = 0;
+    double seconds      = 0;
+    // Latency of every run in milliseconds, sorted
+    std::vector<double> latencies;
+
+    double rate() const;
+    double percentile(double p) const;
+};
+
+// Run progs[i] on its own thread, for the first n programs, until duration
+// seconds have passed. Each thread cycles through the parameter maps in
+// samples[i].
+concurrent_report run_concurrent(const std::vector<program>& progs,
+                                 const std::vector<std::vector<parameter_map>>& samples,
+                                 std::size_t n,
+                                 double duration);
+
+// Run the program n times, cycling through the parameter maps in samples
+concurrent_report
+run_samples(const program& p, const std::vector<parameter_map>& samples, std::size_t n);
+
 } // namespace MIGRAPHX_INLINE_NS
 } // namespace driver
 } // namespace migraphx
@@ -6,21 +6,35 @@
 #include <migraphx/verify_args.hpp>
 #include <migraphx/instruction.hpp>
 #include <migraphx/compile_options.hpp>
+#include <migraphx/stringutils.hpp>
+
+#include <algorithm>
+#include <atomic>
+#include <exception>
+#include <future>
+#include <iostream>
+#include <mutex>
+#include <sstream>
+#include <thread>
+#include <unordered_map>
 
 namespace migraphx {
 namespace driver {
 inline namespace MIGRAPHX_INLINE_NS {
 
-std::vector<argument> run_ref(program p, const parameter_map& inputs)
+std::vector<argument> run_ref(program p, const parameter_map& inputs, std::ostream& os = std::cout)
 {
     p.compile(ref::target{});
     auto out = p.eval(inputs);
-    std::cout << p << std::endl;
+    os << p << std::endl;
     return out;
 }
 
-std::vector<argument>
-run_target(program p, const target& t, const compile_options& options, const parameter_map& inputs)
+std::vector<argument> run_target(program p,
+                                 const target& t,
+                                 const compile_options& options,
+                                 const parameter_map& inputs,
+                                 std::ostream& os = std::cout)
 {
     p.compile(t, options);
 
@@ -32,7 +46,7 @@ run_target(program p, const target& t, const compile_options& options, const par
     }
     auto gpu_out = p.eval(m);
     std::vector<argument> output(gpu_out.size());
-    std::cout << p << std::endl;
+    os << p << std::endl;
     std::transform(gpu_out.begin(), gpu_out.end(), output.begin(), [&](auto& argu) {
         return options.offload_copy ? argu : t.copy_from(argu);
     });
@@ -58,11 +72,20 @@ void verify_program(const std::string& name,
     // std::cout << "gpu: " << y << std::endl;
 }
 
+static bool has_literal_inputs(const program& p)
+{
+    const auto* mm = p.get_main_module();
+    return std::any_of(
+        mm->begin(), mm->end(), [](const auto& ins) { return ins.name() == "@literal"; });
+}
+
 void verify_instructions(const program& prog,
                          const target& t,
                          compile_options options,
-                         double tolerance)
+                         double tolerance,
+                         std::size_t jobs)
 {
+    std::vector<std::pair<std::string, program>> programs;
     const auto* mm_prog = prog.get_main_module();
     for(auto&& ins : (*mm_prog))
     {
@@ -88,18 +111,107 @@ void verify_instructions(const program& prog,
                     mm_p->add_parameter(std::to_string(inputs.size()), arg->get_shape()));
         }
         mm_p->add_instruction(ins.get_operator(), inputs);
-        try
+        programs.emplace_back(ins.name(), p);
+    }
+
+    if(jobs == 0)
+        jobs = std::max(1u, std::thread::hardware_concurrency());
+    jobs = std::min(jobs, programs.size());
+
+    // The inputs are generated from the parameter names, so instructions
+    // with the same operator and input shapes share a single ref run. Each
+    // result is dropped once every instruction that uses it has a reference.
+    struct ref_result
+    {
+        std::shared_future<std::vector<argument>> future;
+        std::size_t consumers = 0;
+    };
+    std::vector<std::string> ref_keys(programs.size());
+    std::unordered_map<std::string, ref_result> ref_results;
+    for(std::size_t i = 0; i < programs.size(); i++)
+    {
+        if(has_literal_inputs(programs[i].second))
+            continue;
+        ref_keys[i] = to_string(programs[i].second);
+        ref_results[ref_keys[i]].consumers++;
+    }
+    std::mutex ref_mutex;
+    std::mutex output_mutex;
+    std::exception_ptr error = nullptr;
+    std::atomic<std::size_t> next{0};
+    std::atomic<bool> stop{false};
+
+    auto get_ref = [&](std::size_t i, const parameter_map& m, std::ostream& os) {
+        const auto& key = ref_keys[i];
+        if(key.empty())
+            return run_ref(programs[i].second, m, os);
+        std::promise<std::vector<argument>> promise;
+        std::shared_future<std::vector<argument>> future;
+        bool compute = false;
         {
-            std::cout << "Verify: " << ins.name() << std::endl;
-            std::cout << p << std::endl;
-            verify_program(ins.name(), p, t, options, create_param_map(p, false), tolerance);
+            std::lock_guard<std::mutex> lock(ref_mutex);
+            auto it = ref_results.find(key);
+            if(not it->second.future.valid())
+            {
+                it->second.future = promise.get_future().share();
+                compute           = true;
+            }
+            future = it->second.future;
+            // The local future keeps the result alive for this instruction
+            if(--it->second.consumers == 0)
+                ref_results.erase(it);
         }
-        catch(...)
+        if(compute)
         {
-            std::cout << "Instruction " << ins.name() << " threw an exception." << std::endl;
-            throw;
+            try
+            {
+                promise.set_value(run_ref(programs[i].second, m, os));
+            }
+            catch(...)
+            {
+                promise.set_exception(std::current_exception());
+            }
         }
-    }
+        return future.get();
+    };
+
+    auto worker = [&] {
+        for(auto i = next++; i < programs.size() and not stop; i = next++)
+        {
+            const auto& name = programs[i].first;
+            const auto& p    = programs[i].second;
+            std::stringstream ss;
+            try
+            {
+                auto m = create_param_map(p, false);
+                auto x = get_ref(i, m, ss);
+                auto y = run_target(p, t, options, m, ss);
+                std::lock_guard<std::mutex> lock(output_mutex);
+                std::cout << "Verify: " << name << std::endl;
+                std::cout << p << std::endl;
+                std::cout << ss.str();
+                for(std::size_t j = 0; j < x.size(); ++j)
+                    verify_args(name, x[j], y[j], tolerance);
+            }
+            catch(...)
+            {
+                std::lock_guard<std::mutex> lock(output_mutex);
+                std::cout << "Instruction " << name << " threw an exception." << std::endl;
+                if(error == nullptr)
+                    error = std::current_exception();
+                stop = true;
+            }
+        }
+    };
+
+    std::vector<std::thread> threads;
+    threads.reserve(jobs);
+    for(std::size_t i = 0; i < jobs; i++)
+        threads.emplace_back(worker);
+    for(auto&& thread : threads)
+        thread.join();
+    if(error != nullptr)
+        std::rethrow_exception(error);
 }
 
 void verify_reduced(program p,
@@ -13,10 +13,13 @@ void verify_program(const std::string& name,
                     compile_options options     = compile_options{},
                     const parameter_map& inputs = {},
                     double tolerance            = 100);
+// Verify each instruction on its own, using jobs threads or one for each
+// core when jobs is 0
 void verify_instructions(const program& prog,
                          const target& t,
                          compile_options options = compile_options{},
-                         double tolerance        = 80);
+                         double tolerance        = 80,
+                         std::size_t jobs        = 0);
 void verify_reduced_program(const program& p,
                             const target& t,
                             compile_options options     = compile_options{},
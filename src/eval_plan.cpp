@@ -0,0 +1,275 @@
+#include <migraphx/eval_plan.hpp>
+#include <migraphx/module.hpp>
+#include <migraphx/instruction.hpp>
+#include <migraphx/iterator_for.hpp>
+#include <migraphx/builtin.hpp>
+#include <migraphx/context.hpp>
+#include <migraphx/errors.hpp>
+#include <migraphx/stringutils.hpp>
+#include <algorithm>
+#include <condition_variable>
+#include <exception>
+#include <functional>
+#include <mutex>
+#include <thread>
+#include <unordered_map>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+argument eval_step::eval(context& ctx,
+                         const std::vector<argument>& results,
+                         const std::unordered_map<std::string, argument>& params,
+                         std::vector<argument>& args) const
+{
+    switch(kind)
+    {
+    case literal:
+    case outline: return value;
+    case param: {
+        auto it = params.find(parameter);
+        if(it == params.end())
+            MIGRAPHX_THROW("Parameter not found: " + parameter);
+        if(it->second.get_shape() != ins->get_shape())
+            MIGRAPHX_THROW("Incorrect shape {" + to_string(it->second.get_shape()) +
+                           "} for parameter: " + parameter);
+        return it->second;
+    }
+    case compute:
+        args.resize(inputs.size());
+        std::transform(
+            inputs.begin(), inputs.end(), args.begin(), [&](std::size_t i) { return results[i]; });
+        return op.compute(ctx, ins->get_shape(), args);
+    }
+    MIGRAPHX_THROW("Unknown step");
+}
+
+// Threads shared by every plan to run the lanes. The threads are only
+// started when a plan with more than one lane is evaluated, and more threads
+// are added when a plan has more lanes than any plan before it.
+struct lane_executor
+{
+    lane_executor() = default;
+
+    lane_executor(const lane_executor&)            = delete;
+    lane_executor& operator=(const lane_executor&) = delete;
+
+    ~lane_executor()
+    {
+        {
+            std::lock_guard<std::mutex> lock(m);
+            stop = true;
+        }
+        start.notify_all();
+        for(auto&& t : threads)
+            t.join();
+    }
+
+    // Run f(i) on thread i for the first n threads and wait for them to
+    // finish. Returns false when another call is already using the threads.
+    bool try_run(std::size_t n, std::function<void(std::size_t)> f)
+    {
+        std::unique_lock<std::mutex> run_lock(run_mutex, std::try_to_lock);
+        if(not run_lock.owns_lock())
+            return false;
+        // Only the caller holding run_mutex changes the threads
+        while(threads.size() < n)
+        {
+            auto i = threads.size();
+            threads.emplace_back([this, i, seen = generation] { this->work(i, seen); });
+        }
+        std::unique_lock<std::mutex> lock(m);
+        task      = std::move(f);
+        active    = n;
+        remaining = n;
+        generation++;
+        start.notify_all();
+        done.wait(lock, [&] { return remaining == 0; });
+        task = nullptr;
+        return true;
+    }
+
+    private:
+    // The thread starts with the generation before its first task
+    void work(std::size_t i, std::size_t seen)
+    {
+        for(;;)
+        {
+            {
+                std::unique_lock<std::mutex> lock(m);
+                start.wait(lock, [&] { return stop or generation != seen; });
+                if(stop)
+                    return;
+                seen = generation;
+                if(i >= active)
+                    continue;
+            }
+            task(i);
+            std::lock_guard<std::mutex> lock(m);
+            remaining--;
+            if(remaining == 0)
+                done.notify_one();
+        }
+    }
+
+    std::mutex run_mutex;
+    std::mutex m;
+    std::condition_variable start;
+    std::condition_variable done;
+    std::function<void(std::size_t)> task;
+    std::size_t generation = 0;
+    std::size_t active     = 0;
+    std::size_t remaining  = 0;
+    bool stop              = false;
+    std::vector<std::thread> threads;
+};
+
+static lane_executor& get_lane_executor()
+{
+    static lane_executor e;
+    return e;
+}
+
+eval_plan make_eval_plan(const module& m)
+{
+    eval_plan plan;
+    std::unordered_map<instruction_ref, std::size_t> slots;
+    plan.steps.reserve(m.size());
+    auto get_inputs = [&](instruction_ref ins) {
+        std::vector<std::size_t> result(ins->inputs().size());
+        std::transform(ins->inputs().begin(),
+                       ins->inputs().end(),
+                       result.begin(),
+                       [&](instruction_ref i) { return slots.at(i); });
+        return result;
+    };
+    std::size_t lane = 0;
+    bool has_return  = false;
+    for(auto ins : iterator_for(m))
+    {
+        const auto& name = ins->name();
+        if(name == "@return")
+        {
+            plan.outputs = get_inputs(ins);
+            has_return   = true;
+            break;
+        }
+        eval_step step;
+        step.ins = ins;
+        if(name == "@literal")
+        {
+            step.kind  = eval_step::literal;
+            step.value = ins->get_literal().get_argument();
+        }
+        else if(name == "@param")
+        {
+            step.kind      = eval_step::param;
+            step.parameter = any_cast<builtin::param>(ins->get_operator()).parameter;
+        }
+        else if(name == "@outline")
+        {
+            step.kind  = eval_step::outline;
+            step.value = argument{ins->get_shape(), nullptr};
+        }
+        else
+        {
+            step.kind   = eval_step::compute;
+            step.op     = ins->normalized_operator();
+            step.inputs = get_inputs(ins);
+            step.info.name         = name;
+            step.info.input_shapes = to_shapes(ins->inputs());
+            step.info.output_shape = ins->get_shape();
+            auto attributes = step.op.attributes();
+            if(attributes.contains("stream"))
+                lane = attributes.at("stream").to<std::size_t>();
+        }
+        step.lane = lane;
+        slots.emplace(ins, plan.steps.size());
+        plan.steps.push_back(std::move(step));
+    }
+    if(not has_return and not plan.steps.empty())
+        plan.outputs = {plan.steps.size() - 1};
+
+    // Record the inputs that each step needs from other lanes
+    for(std::size_t i = 0; i < plan.steps.size(); i++)
+    {
+        auto& step = plan.steps[i];
+        if(step.lane >= plan.lanes.size())
+            plan.lanes.resize(step.lane + 1);
+        plan.lanes[step.lane].push_back(i);
+        auto inputs = step.inputs;
+        std::sort(inputs.begin(), inputs.end());
+        inputs.erase(std::unique(inputs.begin(), inputs.end()), inputs.end());
+        for(auto j : inputs)
+        {
+            if(plan.steps[j].lane == step.lane)
+                continue;
+            step.waits++;
+            plan.steps[j].signals.push_back(i);
+        }
+    }
+    return plan;
+}
+
+std::vector<argument> eval_lanes(const eval_plan& plan,
+                                 context& ctx,
+                                 const std::unordered_map<std::string, argument>& params)
+{
+    std::vector<argument> results(plan.steps.size());
+    std::vector<std::size_t> waits(plan.steps.size());
+    std::transform(plan.steps.begin(), plan.steps.end(), waits.begin(), [](const auto& step) {
+        return step.waits;
+    });
+    std::mutex m;
+    std::condition_variable cv;
+    std::exception_ptr error = nullptr;
+    auto run_lane            = [&](std::size_t lane) {
+        std::vector<argument> args;
+        try
+        {
+            for(auto i : plan.lanes[lane])
+            {
+                const auto& step = plan.steps[i];
+                if(step.waits > 0)
+                {
+                    std::unique_lock<std::mutex> lock(m);
+                    cv.wait(lock, [&] { return error != nullptr or waits[i] == 0; });
+                    if(error != nullptr)
+                        return;
+                }
+                results[i] = step.eval(ctx, results, params, args);
+                if(step.signals.empty())
+                    continue;
+                {
+                    std::lock_guard<std::mutex> lock(m);
+                    for(auto j : step.signals)
+                        waits[j]--;
+                }
+                cv.notify_all();
+            }
+        }
+        catch(...)
+        {
+            std::lock_guard<std::mutex> lock(m);
+            if(error == nullptr)
+                error = std::current_exception();
+            cv.notify_all();
+        }
+    };
+    if(plan.lanes.size() < 2 or not get_lane_executor().try_run(plan.lanes.size(), run_lane))
+    {
+        std::vector<argument> args;
+        for(std::size_t i = 0; i < plan.steps.size(); i++)
+            results[i] = plan.steps[i].eval(ctx, results, params, args);
+    }
+    if(error != nullptr)
+        std::rethrow_exception(error);
+    std::vector<argument> outputs(plan.outputs.size());
+    std::transform(plan.outputs.begin(), plan.outputs.end(), outputs.begin(), [&](std::size_t j) {
+        return results[j];
+    });
+    return outputs;
+}
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
@@ -0,0 +1,43 @@
+#include <migraphx/execution_context.hpp>
+#include <migraphx/program.hpp>
+#include <migraphx/errors.hpp>
+#include <migraphx/ranges.hpp>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+execution_context::execution_context(const program& p,
+                                     context c,
+                                     std::unordered_map<std::string, argument> b)
+    : prog(&p), ctx(std::move(c)), bindings(std::move(b))
+{
+}
+
+void execution_context::bind(const std::string& name, argument arg)
+{ bindings[name] = std::move(arg); }
+
+const std::unordered_map<std::string, argument>& execution_context::get_bindings() const
+{ return bindings; }
+
+context& execution_context::get_context() { return ctx; }
+
+std::vector<argument>
+execution_context::eval(const std::unordered_map<std::string, argument>& params)
+{
+    if(prog == nullptr)
+        MIGRAPHX_THROW("Execution context is not created from a program");
+    auto m = bindings;
+    for(auto&& p : params)
+    {
+        // Keep the scratch memory of the context, since callers usually pass
+        // every parameter and sharing their scratch across contexts would
+        // corrupt the results
+        if(p.first == "scratch" and contains(bindings, p.first))
+            continue;
+        m[p.first] = p.second;
+    }
+    return prog->eval(ctx, std::move(m));
+}
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
@@ -3,6 +3,7 @@
 
 #include <migraphx/config.hpp>
 #include <migraphx/tracer.hpp>
+#include <migraphx/pass_profile.hpp>
 
 namespace migraphx {
 inline namespace MIGRAPHX_INLINE_NS {
@@ -12,6 +13,8 @@ struct compile_options
     bool offload_copy = false;
     bool fast_math    = true;
     tracer trace{};
+    // When set, the time of each pass is recorded here
+    pass_profile* profile = nullptr;
 };
 
 } // namespace MIGRAPHX_INLINE_NS
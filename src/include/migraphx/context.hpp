@@ -22,6 +22,9 @@ struct context
 {
     /// Wait for any tasks in the context to complete
     void finish() const;
+    /// Whether copies of the context can evaluate a program at the same time,
+    /// which is only possible when the copies do not share any state
+    bool concurrent_copies() const;
 };
 
 #else
@@ -37,6 +40,12 @@ void from_value_context(T&, const value&)
 {
 }
 
+template <class T>
+bool concurrent_copies_context(const T&)
+{
+    return false;
+}
+
 /*
  * Type-erased interface for:
  *
@@ -45,6 +54,7 @@ void from_value_context(T&, const value&)
  *      value to_value() const;
  *      void from_value(const value& v) ;
  *      void finish() const;
+ *      bool concurrent_copies() const;
  * };
  *
  */
@@ -130,6 +140,12 @@ struct context
         (*this).private_detail_te_get_handle().finish();
     }
 
+    bool concurrent_copies() const
+    {
+        assert((*this).private_detail_te_handle_mem_var);
+        return (*this).private_detail_te_get_handle().concurrent_copies();
+    }
+
     friend bool is_shared(const context& private_detail_x, const context& private_detail_y)
     {
         return private_detail_x.private_detail_te_handle_mem_var ==
@@ -146,6 +162,7 @@ struct context
         virtual value to_value() const          = 0;
         virtual void from_value(const value& v) = 0;
         virtual void finish() const             = 0;
+        virtual bool concurrent_copies() const  = 0;
     };
 
     template <class T>
@@ -176,6 +193,19 @@ struct context
         from_value_context(private_detail_te_self, v);
     }
 
+    template <class T>
+    static auto private_detail_te_default_concurrent_copies(char, T&& private_detail_te_self)
+        -> decltype(private_detail_te_self.concurrent_copies())
+    {
+        return private_detail_te_self.concurrent_copies();
+    }
+
+    template <class T>
+    static bool private_detail_te_default_concurrent_copies(float, T&& private_detail_te_self)
+    {
+        return concurrent_copies_context(private_detail_te_self);
+    }
+
     template <typename PrivateDetailTypeErasedT>
     struct private_detail_te_handle_type : private_detail_te_handle_base_type
     {
@@ -218,6 +248,12 @@ struct context
 
         void finish() const override { private_detail_te_value.finish(); }
 
+        bool concurrent_copies() const override
+        {
+
+            return private_detail_te_default_concurrent_copies(char(0), private_detail_te_value);
+        }
+
         PrivateDetailTypeErasedT private_detail_te_value;
     };
 
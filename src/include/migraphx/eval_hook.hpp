@@ -0,0 +1,39 @@
+#ifndef MIGRAPHX_GUARD_MIGRAPHX_EVAL_HOOK_HPP
+#define MIGRAPHX_GUARD_MIGRAPHX_EVAL_HOOK_HPP
+
+#include <migraphx/config.hpp>
+#include <migraphx/argument.hpp>
+#include <migraphx/shape.hpp>
+#include <functional>
+#include <string>
+#include <vector>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+/// The instruction being evaluated, which is passed to the eval hooks
+struct instruction_info
+{
+    std::string name;
+    std::vector<shape> input_shapes;
+    shape output_shape;
+    /// Milliseconds spent running the instruction, which is zero before it runs
+    double time = 0;
+    /// The output of the instruction in host memory, which is only set after
+    /// it runs for hooks that asked for it
+    argument result;
+};
+
+/// Callbacks that run before and after each instruction when a program is evaluated
+struct eval_hook
+{
+    std::function<void(const instruction_info&)> before = nullptr;
+    std::function<void(const instruction_info&)> after  = nullptr;
+    /// Pass the output of each instruction to the after callback
+    bool outputs = false;
+};
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
+
+#endif
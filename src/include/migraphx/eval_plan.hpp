@@ -0,0 +1,91 @@
+#ifndef MIGRAPHX_GUARD_RTGLIB_EVAL_PLAN_HPP
+#define MIGRAPHX_GUARD_RTGLIB_EVAL_PLAN_HPP
+
+#include <migraphx/config.hpp>
+#include <migraphx/argument.hpp>
+#include <migraphx/eval_hook.hpp>
+#include <migraphx/instruction_ref.hpp>
+#include <migraphx/operation.hpp>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+struct module;
+struct context;
+
+/**
+ * @brief A single instruction of an eval_plan
+ */
+struct eval_step
+{
+    enum kind_t
+    {
+        literal,
+        param,
+        outline,
+        compute
+    };
+
+    instruction_ref ins;
+    kind_t kind = compute;
+    // Operator with its attributes already normalized, used by compute steps
+    operation op;
+    // Slots of the inputs to the instruction
+    std::vector<std::size_t> inputs;
+    // Name of the parameter for param steps
+    std::string parameter;
+    // Result of literal and outline steps
+    argument value;
+    // Lane the step runs on, which is changed by operators with a "stream"
+    // attribute
+    std::size_t lane = 0;
+    // Number of inputs computed on other lanes
+    std::size_t waits = 0;
+    // Steps on other lanes that use the result of this step
+    std::vector<std::size_t> signals;
+    // Information passed to the eval hooks by compute steps, which is built
+    // once with the plan
+    instruction_info info;
+
+    // Compute the result of the step from the results of the previous steps.
+    // The args vector is used to hold the inputs to the operator.
+    argument eval(context& ctx,
+                  const std::vector<argument>& results,
+                  const std::unordered_map<std::string, argument>& params,
+                  std::vector<argument>& args) const;
+};
+
+/**
+ * @brief A flat list of steps to evaluate a module
+ *
+ * The result of step i is stored in slot i, so evaluation does not need to
+ * look up instructions in a map.
+ */
+struct eval_plan
+{
+    std::vector<eval_step> steps;
+    // Slots of the outputs of the module
+    std::vector<std::size_t> outputs;
+    // Steps of each lane in order
+    std::vector<std::vector<std::size_t>> lanes;
+};
+
+eval_plan make_eval_plan(const module& m);
+
+// Evaluate the plan with each lane running on its own thread. A step waits
+// for its inputs from other lanes to finish, and the steps of a lane run in
+// order. The threads are shared by every plan and started on the first call,
+// one for each lane, which is the number of inter-op threads on the cpu. Falls
+// back to running the steps in order on the calling thread when another
+// evaluation is using the threads.
+std::vector<argument> eval_lanes(const eval_plan& plan,
+                                 context& ctx,
+                                 const std::unordered_map<std::string, argument>& params);
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
+
+#endif
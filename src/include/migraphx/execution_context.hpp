@@ -0,0 +1,54 @@
+#ifndef MIGRAPHX_GUARD_RTGLIB_EXECUTION_CONTEXT_HPP
+#define MIGRAPHX_GUARD_RTGLIB_EXECUTION_CONTEXT_HPP
+
+#include <migraphx/config.hpp>
+#include <migraphx/argument.hpp>
+#include <migraphx/context.hpp>
+#include <string>
+#include <unordered_map>
+#include <vector>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+struct program;
+
+/**
+ * @brief The state used to evaluate a compiled program
+ *
+ * Each execution context has its own copy of the target context, its own
+ * scratch memory and its own parameter bindings, while the instructions and
+ * literals are shared with the program. This allows a program to be
+ * evaluated concurrently from several threads, with one execution context
+ * for each thread. The program must outlive its execution contexts, and the
+ * target context must support concurrent copies.
+ */
+struct execution_context
+{
+    execution_context() = default;
+    execution_context(const program& p,
+                      context c,
+                      std::unordered_map<std::string, argument> b = {});
+
+    /// Bind the argument to the parameter for every evaluation
+    void bind(const std::string& name, argument arg);
+
+    const std::unordered_map<std::string, argument>& get_bindings() const;
+
+    context& get_context();
+
+    /// Evaluate the program with the bound parameters, which are overridden
+    /// by the parameters in params except for the scratch memory of the
+    /// context
+    std::vector<argument> eval(const std::unordered_map<std::string, argument>& params = {});
+
+    private:
+    const program* prog = nullptr;
+    context ctx;
+    std::unordered_map<std::string, argument> bindings;
+};
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
+
+#endif
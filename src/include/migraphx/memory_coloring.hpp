@@ -1,6 +1,7 @@
 #ifndef MIGRAPHX_GUARD_RTGLIB_MEMORY_COLORING_HPP
 #define MIGRAPHX_GUARD_RTGLIB_MEMORY_COLORING_HPP
 
+#include <cstddef>
 #include <string>
 #include <migraphx/instruction_ref.hpp>
 #include <migraphx/config.hpp>
@@ -16,6 +17,9 @@ struct memory_coloring
 {
     std::string allocation_op{};
     bool verify = false;
+    // Alignment in bytes of the offset of each allocation. When int8 is used
+    // an unaligned offset can crash the miopen int8 convolution.
+    std::size_t alignment = 4;
     std::string name() const { return "memory coloring"; }
     void apply(module& p) const;
 };
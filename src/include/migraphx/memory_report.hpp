@@ -0,0 +1,43 @@
+#ifndef MIGRAPHX_GUARD_RTGLIB_MEMORY_REPORT_HPP
+#define MIGRAPHX_GUARD_RTGLIB_MEMORY_REPORT_HPP
+
+#include <migraphx/config.hpp>
+#include <migraphx/value.hpp>
+#include <map>
+#include <string>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+struct module;
+
+struct memory_usage
+{
+    std::size_t literal_bytes   = 0;
+    std::size_t scratch_bytes   = 0;
+    std::size_t parameter_bytes = 0;
+    std::size_t output_bytes    = 0;
+    // The most memory allocated at once while evaluating, including the
+    // scratch memory but not the literals or parameters
+    std::size_t peak_bytes = 0;
+    // Bytes of the results of each operator
+    std::map<std::string, std::size_t> op_bytes;
+
+    memory_usage& operator+=(const memory_usage& x);
+    value to_value() const;
+};
+
+struct memory_report
+{
+    memory_usage total;
+    std::map<std::string, memory_usage> modules;
+
+    value to_value() const;
+};
+
+memory_usage get_memory_usage(const module& m);
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
+
+#endif
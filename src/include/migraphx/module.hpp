@@ -20,6 +20,7 @@ inline namespace MIGRAPHX_INLINE_NS {
 const operation& get_operation(instruction_ref ins);
 
 struct module_impl;
+struct eval_plan;
 
 using parameter_map = std::unordered_map<std::string, argument>;
 
@@ -109,6 +110,10 @@ struct module
 
     void finalize(context& ctx);
 
+    // Plan to evaluate the module built by finalize, or nullptr when the
+    // module has been modified since it was finalized
+    const eval_plan* get_eval_plan() const;
+
     value to_value() const;
     void from_value(const value& v);
 
@@ -9,6 +9,7 @@
 #include <migraphx/instruction_ref.hpp>
 #include <migraphx/target.hpp>
 #include <migraphx/tracer.hpp>
+#include <migraphx/pass_profile.hpp>
 #include <migraphx/env.hpp>
 #include <migraphx/config.hpp>
 #include <algorithm>
@@ -17,7 +18,10 @@
 namespace migraphx {
 inline namespace MIGRAPHX_INLINE_NS {
 
-void run_passes(module& modl, const std::vector<pass>& passes, tracer trace = tracer{});
+void run_passes(module& modl,
+                const std::vector<pass>& passes,
+                tracer trace          = tracer{},
+                pass_profile* profile = nullptr);
 
 } // namespace MIGRAPHX_INLINE_NS
 } // namespace migraphx
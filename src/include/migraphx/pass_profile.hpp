@@ -0,0 +1,44 @@
+#ifndef MIGRAPHX_GUARD_RTGLIB_PASS_PROFILE_HPP
+#define MIGRAPHX_GUARD_RTGLIB_PASS_PROFILE_HPP
+
+#include <migraphx/config.hpp>
+#include <migraphx/value.hpp>
+#include <string>
+#include <vector>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+/**
+ * @brief Records the time taken by each pass run during compilation
+ */
+struct pass_profile
+{
+    struct entry
+    {
+        std::string pass;
+        std::string module;
+        // Time in milliseconds
+        double time                     = 0;
+        std::size_t instructions_before = 0;
+        std::size_t instructions_after  = 0;
+    };
+
+    // Every pass that was run, in order
+    std::vector<entry> entries;
+
+    void clear();
+
+    // Total time in milliseconds of all the passes
+    double total_time() const;
+
+    /// Returns an object with every run of a pass in "passes", and the number
+    /// of runs, total time and total change in instructions of each pass in
+    /// "summary"
+    value to_value() const;
+};
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
+
+#endif
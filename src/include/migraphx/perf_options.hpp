@@ -0,0 +1,28 @@
+#ifndef MIGRAPHX_GUARD_RTGLIB_PERF_OPTIONS_HPP
+#define MIGRAPHX_GUARD_RTGLIB_PERF_OPTIONS_HPP
+
+#include <migraphx/config.hpp>
+#include <cstddef>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+struct perf_options
+{
+    // Number of runs before any timings are recorded
+    std::size_t warmup = 1;
+    // Stop sampling once this many seconds have passed, counting every timed
+    // run but not the warmup, 0 disables the limit
+    double time_budget = 0;
+    // Stop sampling once the 95% confidence interval of the total time is
+    // within this fraction of the mean, 0 disables the check
+    double ci_width = 0;
+    // Drop samples whose modified z-score, based on the median absolute
+    // deviation, is above this threshold, 0 keeps every sample
+    double outlier_threshold = 3.5;
+};
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
+
+#endif
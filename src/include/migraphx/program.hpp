@@ -10,6 +10,10 @@
 #include <migraphx/instruction_ref.hpp>
 #include <migraphx/target.hpp>
 #include <migraphx/compile_options.hpp>
+#include <migraphx/perf_options.hpp>
+#include <migraphx/memory_report.hpp>
+#include <migraphx/execution_context.hpp>
+#include <migraphx/eval_hook.hpp>
 #include <migraphx/env.hpp>
 #include <migraphx/config.hpp>
 #include <algorithm>
@@ -51,6 +55,15 @@ struct program
 
     std::vector<argument> eval(parameter_map params) const;
 
+    /// Create a context to evaluate the compiled program with its own
+    /// scratch memory and parameter bindings
+    execution_context create_execution_context() const;
+
+    /// Add callbacks that run around each instruction when the program is
+    /// evaluated. This should not be called while the program is evaluated.
+    void add_eval_hook(eval_hook h);
+    void clear_eval_hooks();
+
     std::size_t size() const;
 
     std::vector<shape> get_output_shapes() const;
@@ -65,7 +78,15 @@ struct program
 
     void finalize();
 
-    void perf_report(std::ostream& os, std::size_t n, parameter_map params) const;
+    void perf_report(std::ostream& os,
+                     std::size_t n,
+                     parameter_map params,
+                     const perf_options& options = perf_options{}) const;
+    value perf_report_data(std::size_t n,
+                           parameter_map params,
+                           const perf_options& options = perf_options{}) const;
+
+    memory_report get_memory_report() const;
 
     value to_value() const;
     void from_value(const value& v);
@@ -93,6 +114,8 @@ struct program
     const module* get_main_module() const;
 
     private:
+    friend struct execution_context;
+    std::vector<argument> eval(context& ctx, parameter_map params) const;
     void assign(const program& p);
     std::unique_ptr<program_impl> impl;
 };
@@ -0,0 +1,63 @@
+#ifndef MIGRAPHX_GUARD_RTGLIB_TRACE_FILE_HPP
+#define MIGRAPHX_GUARD_RTGLIB_TRACE_FILE_HPP
+
+#include <migraphx/config.hpp>
+#include <migraphx/value.hpp>
+#include <chrono>
+#include <cstdint>
+#include <fstream>
+#include <mutex>
+#include <string>
+#include <vector>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+struct trace_event
+{
+    std::string name;
+    std::string category;
+    std::chrono::steady_clock::time_point start;
+    std::chrono::steady_clock::time_point finish;
+    std::size_t tid = 0;
+    value args      = value::object{};
+};
+
+/**
+ * @brief Writes events to a file in the chrome trace event format, which
+ * can be loaded into chrome://tracing or perfetto
+ */
+struct trace_file
+{
+    trace_file(const std::string& filename);
+
+    void write(const std::vector<trace_event>& events);
+
+    trace_file(trace_file const&)            = delete;
+    trace_file& operator=(trace_file const&) = delete;
+
+    ~trace_file();
+
+    private:
+    std::ofstream os;
+    std::mutex m;
+    std::chrono::steady_clock::time_point epoch;
+    std::int64_t pid = 0;
+};
+
+// Write a trace of every program evaluation to filename, or stop tracing
+// if filename is empty. This overrides the MIGRAPHX_TRACE_FILE variable, and
+// should not be called while a program is being evaluated.
+void set_trace_file(const std::string& filename);
+
+// Returns the file set with set_trace_file or MIGRAPHX_TRACE_FILE, or nullptr
+// when evaluations are not traced
+trace_file* get_trace_file();
+
+// Returns a small id for the calling thread to use in trace events
+std::size_t get_thread_trace_id();
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
+
+#endif
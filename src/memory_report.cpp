@@ -0,0 +1,140 @@
+#include <migraphx/memory_report.hpp>
+#include <migraphx/module.hpp>
+#include <migraphx/instruction.hpp>
+#include <migraphx/iterator_for.hpp>
+#include <migraphx/builtin.hpp>
+#include <migraphx/ranges.hpp>
+#include <algorithm>
+#include <unordered_map>
+#include <vector>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+memory_usage& memory_usage::operator+=(const memory_usage& x)
+{
+    literal_bytes += x.literal_bytes;
+    scratch_bytes += x.scratch_bytes;
+    parameter_bytes += x.parameter_bytes;
+    output_bytes += x.output_bytes;
+    peak_bytes += x.peak_bytes;
+    for(auto&& p : x.op_bytes)
+        op_bytes[p.first] += p.second;
+    return *this;
+}
+
+value memory_usage::to_value() const
+{
+    value ops = value::object{};
+    for(auto&& p : op_bytes)
+        ops[p.first] = p.second;
+    return {{"literal_bytes", literal_bytes},
+            {"scratch_bytes", scratch_bytes},
+            {"parameter_bytes", parameter_bytes},
+            {"output_bytes", output_bytes},
+            {"peak_bytes", peak_bytes},
+            {"op_bytes", ops}};
+}
+
+value memory_report::to_value() const
+{
+    value result = total.to_value();
+    value mods   = value::object{};
+    for(auto&& p : modules)
+        mods[p.first] = p.second.to_value();
+    result["modules"] = mods;
+    return result;
+}
+
+// Find the most bytes of instruction results that are alive at the same time
+static std::size_t peak_allocation(const module& m)
+{
+    std::unordered_map<instruction_ref, std::size_t> position;
+    std::unordered_map<instruction_ref, std::size_t> last_use;
+    std::vector<instruction_ref> allocations;
+    for(auto ins : iterator_for(m))
+    {
+        position.emplace(ins, position.size());
+        if(ins->name().front() != '@' and instruction::get_output_alias(ins) == ins)
+        {
+            allocations.push_back(ins);
+            last_use[ins] = position.at(ins);
+        }
+    }
+    auto end = position.size();
+    for(auto ins : iterator_for(m))
+    {
+        // The returned results stay alive after the module finishes
+        auto pos = ins->name() == "@return" ? end : position.at(ins);
+        for(auto input : ins->inputs())
+        {
+            auto root = instruction::get_output_alias(input);
+            if(contains(last_use, root))
+                last_use[root] = std::max(last_use[root], pos);
+        }
+    }
+    auto last = std::prev(m.end());
+    if(last->name() != "@return")
+    {
+        auto root = instruction::get_output_alias(last);
+        if(contains(last_use, root))
+            last_use[root] = end;
+    }
+
+    // Bytes allocated and freed at each position
+    std::vector<std::ptrdiff_t> delta(end + 2, 0);
+    for(auto ins : allocations)
+    {
+        auto bytes = ins->get_shape().bytes();
+        delta[position.at(ins)] += bytes;
+        delta[last_use.at(ins) + 1] -= bytes;
+    }
+    std::ptrdiff_t live = 0;
+    std::ptrdiff_t peak = 0;
+    for(auto d : delta)
+    {
+        live += d;
+        peak = std::max(peak, live);
+    }
+    return peak;
+}
+
+memory_usage get_memory_usage(const module& m)
+{
+    memory_usage result;
+    if(m.size() == 0)
+        return result;
+    for(auto ins : iterator_for(m))
+    {
+        const auto& name = ins->name();
+        auto bytes       = ins->get_shape().bytes();
+        if(name == "@literal")
+        {
+            result.literal_bytes += bytes;
+        }
+        else if(name == "@param")
+        {
+            if(any_cast<builtin::param>(ins->get_operator()).parameter == "scratch")
+                result.scratch_bytes += bytes;
+            else
+                result.parameter_bytes += bytes;
+        }
+        else if(name == "@return")
+        {
+            for(auto input : ins->inputs())
+                result.output_bytes += input->get_shape().bytes();
+        }
+        else if(name.front() != '@')
+        {
+            result.op_bytes[name] += bytes;
+        }
+    }
+    auto last = std::prev(m.end());
+    if(last->name() != "@return")
+        result.output_bytes = last->get_shape().bytes();
+    result.peak_bytes = result.scratch_bytes + peak_allocation(m);
+    return result;
+}
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
@@ -1,4 +1,5 @@
 #include <migraphx/module.hpp>
+#include <migraphx/eval_plan.hpp>
 #include <migraphx/stringutils.hpp>
 #include <migraphx/instruction.hpp>
 #include <migraphx/target.hpp>
@@ -26,6 +27,8 @@ struct module_impl
     std::list<instruction> instructions;
     std::vector<std::string> input_names;
     std::string name;
+    // Discarded whenever the instructions are changed
+    std::shared_ptr<const eval_plan> plan;
 };
 
 const operation& get_operation(instruction_ref ins) { return ins->get_operator(); }
@@ -63,6 +66,7 @@ void module::assign(const module& m)
     }
     impl->input_names = m.impl->input_names;
     impl->name        = m.impl->name;
+    impl->plan        = nullptr;
 
     std::unordered_map<instruction_ref, instruction_ref> ins_map;
     for(auto ins : iterator_for(m))
@@ -109,6 +113,9 @@ void module::assign(const module& m)
 
         ins_map[ins] = copy_ins;
     }
+    // The plan refers to the instructions, so it is rebuilt for the copy
+    if(m.impl->plan)
+        impl->plan = std::make_shared<eval_plan>(make_eval_plan(*this));
 }
 
 instruction_ref module::add_instruction(const operation& op, std::vector<instruction_ref> args)
@@ -119,6 +126,7 @@ instruction_ref module::insert_instruction(instruction_ref ins,
                                            const operation& op,
                                            std::vector<instruction_ref> args)
 {
+    impl->plan = nullptr;
     assert(std::all_of(
                args.begin(), args.end(), [&](instruction_ref x) { return has_instruction(x); }) &&
            "Argument is not an exisiting instruction");
@@ -134,6 +142,7 @@ instruction_ref module::replace_instruction(instruction_ref ins,
                                             const operation& op,
                                             std::vector<instruction_ref> args) MIGRAPHX_TIDY_CONST
 {
+    impl->plan = nullptr;
     assert(std::all_of(
                args.begin(), args.end(), [&](instruction_ref x) { return has_instruction(x); }) &&
            "Argument is not an exisiting instruction");
@@ -147,6 +156,7 @@ instruction_ref module::replace_instruction(instruction_ref ins,
 
 instruction_ref module::replace_instruction(instruction_ref ins, instruction_ref rep)
 {
+    impl->plan = nullptr;
     assert(has_instruction(ins));
     assert(has_instruction(rep));
     assert(ins != rep);
@@ -185,6 +195,7 @@ instruction_ref module::replace_instruction(instruction_ref ins, instruction_ref
 
 instruction_ref module::remove_instruction(instruction_ref ins)
 {
+    impl->plan = nullptr;
     assert(has_instruction(ins));
     assert(ins->outputs().empty());
     ins->clear_arguments();
@@ -193,6 +204,7 @@ instruction_ref module::remove_instruction(instruction_ref ins)
 
 instruction_ref module::remove_instructions(instruction_ref first, instruction_ref last)
 {
+    impl->plan = nullptr;
     if(first == last)
         return first;
     // TODO: Check every element
@@ -204,6 +216,7 @@ instruction_ref module::remove_instructions(instruction_ref first, instruction_r
 
 instruction_ref module::move_instruction(instruction_ref src, instruction_ref dst)
 {
+    impl->plan = nullptr;
     impl->instructions.splice(dst, impl->instructions, src);
     return src;
 }
@@ -218,18 +231,21 @@ instruction_ref module::move_instructions(instruction_ref src, instruction_ref d
 
 instruction_ref module::add_literal(literal l)
 {
+    impl->plan = nullptr;
     impl->instructions.emplace_front(std::move(l));
     return impl->instructions.begin();
 }
 
 instruction_ref module::add_outline(const shape& s)
 {
+    impl->plan = nullptr;
     impl->instructions.push_front({builtin::outline{s}, s, {}});
     return impl->instructions.begin();
 }
 
 instruction_ref module::add_parameter(std::string name, shape s)
 {
+    impl->plan = nullptr;
     assert(get_parameter_shape(name) == shape{});
     impl->input_names.push_back(name);
 
@@ -239,6 +255,7 @@ instruction_ref module::add_parameter(std::string name, shape s)
 
 instruction_ref module::add_return(std::vector<instruction_ref> args)
 {
+    impl->plan = nullptr;
     assert(std::all_of(
                args.begin(), args.end(), [&](instruction_ref x) { return has_instruction(x); }) &&
            "Argument is not an exisiting instruction");
@@ -364,6 +381,7 @@ void module::finalize(context& ctx)
     {
         ins->finalize(ctx);
     }
+    impl->plan = std::make_shared<eval_plan>(make_eval_plan(*this));
     // Warn when an instruction is not normalized
     auto ins = std::find_if(begin(), end(), [](auto& i) { return i.need_normalization(); });
     if(ins != end())
@@ -371,6 +389,8 @@ void module::finalize(context& ctx)
                   << std::endl;
 }
 
+const eval_plan* module::get_eval_plan() const { return impl->plan.get(); }
+
 value module::to_value() const
 {
     value result;
@@ -83,14 +83,14 @@ bool memory_coloring_impl::allocate(interval_ptr interval)
             }
             offset = iter_offset + range->size;
         }
-        // alignment
+        // alignment, which is applied before looking for the next gap so the
+        // aligned offset can never overlap the next range
         if((offset % element_size) != 0)
             offset += (element_size - (offset % element_size));
+        if((offset % alignment) != 0)
+            offset += (alignment - (offset % alignment));
         conflict_queue.pop();
     }
-    // when int8 type is used, the offset could be any number
-    // if not 4-byte aligned, miopen int8 convolution can crash
-    offset         = (offset + 3) / 4 * 4;
     segment.offset = offset;
     MIGRAPHX_DEBUG(segment.dump());
     required_bytes = std::max(required_bytes, offset + segment.size);
@@ -67,8 +67,11 @@ using interval_ptr = live_interval*;
 
 struct memory_coloring_impl
 {
-    memory_coloring_impl(module* p, std::string alloc_op, bool p_verify)
-        : p_program(p), allocation_op(std::move(alloc_op)), enable_verify(p_verify)
+    memory_coloring_impl(module* p, std::string alloc_op, bool p_verify, std::size_t p_alignment)
+        : p_program(p),
+          allocation_op(std::move(alloc_op)),
+          enable_verify(p_verify),
+          alignment(p_alignment)
     {
         instr2_live.clear();
         live_ranges.clear();
@@ -167,6 +170,7 @@ struct memory_coloring_impl
     bool unify_literals;
     std::string allocation_op{};
     bool enable_verify;
+    std::size_t alignment;
 };
 
 } // namespace MIGRAPHX_INLINE_NS
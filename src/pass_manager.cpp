@@ -11,16 +11,75 @@
 #include <sstream>
 #include <algorithm>
 #include <utility>
+#include <chrono>
+#include <cstdint>
+#include <numeric>
+#include <unordered_map>
 
 namespace migraphx {
 inline namespace MIGRAPHX_INLINE_NS {
 
-void run_passes(module& modl, const std::vector<pass>& passes, tracer trace)
+void pass_profile::clear() { entries.clear(); }
+
+double pass_profile::total_time() const
+{
+    return std::accumulate(
+        entries.begin(), entries.end(), 0.0, [](double x, const entry& e) { return x + e.time; });
+}
+
+value pass_profile::to_value() const
 {
+    value passes = value::array{};
+    std::vector<std::string> names;
+    std::unordered_map<std::string, value> summary;
+    for(auto&& e : entries)
+    {
+        auto delta = std::int64_t(e.instructions_after) - std::int64_t(e.instructions_before);
+        passes.push_back({{"pass", e.pass},
+                          {"module", e.module},
+                          {"time", e.time},
+                          {"instructions_before", e.instructions_before},
+                          {"instructions_after", e.instructions_after}});
+        if(not contains(summary, e.pass))
+        {
+            names.push_back(e.pass);
+            summary[e.pass] = {{"runs", 0}, {"time", 0.0}, {"instructions_delta", 0}};
+        }
+        auto& s                 = summary[e.pass];
+        s["runs"]               = s.at("runs").to<std::int64_t>() + 1;
+        s["time"]               = s.at("time").to<double>() + e.time;
+        s["instructions_delta"] = s.at("instructions_delta").to<std::int64_t>() + delta;
+    }
+    value result      = value::object{};
+    result["passes"]  = passes;
+    result["summary"] = value::object{};
+    // Keep the summary in the order the passes first ran
+    for(auto&& name : names)
+        result["summary"][name] = summary.at(name);
+    result["total_time"] = total_time();
+    return result;
+}
+
+void run_passes(module& modl, const std::vector<pass>& passes, tracer trace, pass_profile* profile)
+{
+    using milliseconds = std::chrono::duration<double, std::milli>;
     for(const auto& p : passes)
     {
         trace("Pass: ", p.name());
-        p.apply(modl);
+        if(profile == nullptr)
+        {
+            p.apply(modl);
+        }
+        else
+        {
+            pass_profile::entry e;
+            e.pass                = p.name();
+            e.module              = modl.name();
+            e.instructions_before = modl.size();
+            e.time                = time<milliseconds>([&] { p.apply(modl); });
+            e.instructions_after  = modl.size();
+            profile->entries.push_back(e);
+        }
         trace(modl);
 
 #ifndef NDEBUG
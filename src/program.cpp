@@ -6,9 +6,11 @@
 #include <migraphx/env.hpp>
 #include <migraphx/ranges.hpp>
 #include <migraphx/time.hpp>
+#include <migraphx/trace_file.hpp>
 #include <migraphx/pass_manager.hpp>
 #include <migraphx/register_target.hpp>
 #include <migraphx/iterator_for.hpp>
+#include <migraphx/eval_plan.hpp>
 #include <iostream>
 #include <sstream>
 #include <algorithm>
@@ -18,6 +20,8 @@
 #include <unordered_set>
 #include <map>
 #include <cassert>
+#include <cmath>
+#include <numeric>
 
 namespace migraphx {
 inline namespace MIGRAPHX_INLINE_NS {
@@ -28,6 +32,7 @@ struct program_impl
     std::map<std::string, module> modules;
     context ctx;
     std::string target_name;
+    std::vector<eval_hook> hooks;
 };
 
 program::program() : impl(std::make_unique<program_impl>()) { impl->modules["main"] = {"main"}; }
@@ -58,6 +63,7 @@ void program::assign(const program& p)
     impl->ctx         = p.impl->ctx;
     impl->target_name = p.impl->target_name;
     impl->modules     = p.impl->modules;
+    impl->hooks       = p.impl->hooks;
 }
 
 shape program::get_parameter_shape(std::string name) const
@@ -84,6 +90,10 @@ std::unordered_map<std::string, shape> program::get_parameter_shapes() const
     return mm->get_parameter_shapes();
 }
 
+void program::add_eval_hook(eval_hook h) { impl->hooks.push_back(std::move(h)); }
+
+void program::clear_eval_hooks() { impl->hooks.clear(); }
+
 std::size_t program::size() const { return impl->modules.size(); }
 
 std::vector<shape> program::get_output_shapes() const
@@ -118,7 +128,7 @@ void program::compile(const target& t, compile_options options)
     {
         auto& modl = mp.second;
         assert(modl.validate() == modl.end());
-        run_passes(modl, passes, options.trace);
+        run_passes(modl, passes, options.trace, options.profile);
         auto invalid = this->validate();
         if(invalid != modl.end())
         {
@@ -138,6 +148,27 @@ void program::finalize()
     }
 }
 
+template <class F>
+std::vector<argument> generic_eval(const eval_plan& plan,
+                                   context& ctx,
+                                   const std::unordered_map<std::string, argument>& params,
+                                   F trace)
+{
+    std::vector<argument> results(plan.steps.size());
+    std::vector<argument> args;
+    args.reserve(16);
+    for(std::size_t i = 0; i < plan.steps.size(); i++)
+    {
+        const auto& step = plan.steps[i];
+        results[i]       = trace(step.ins, [&] { return step.eval(ctx, results, params, args); });
+    }
+    std::vector<argument> outputs(plan.outputs.size());
+    std::transform(plan.outputs.begin(), plan.outputs.end(), outputs.begin(), [&](std::size_t j) {
+        return results[j];
+    });
+    return outputs;
+}
+
 template <class F>
 std::vector<argument> generic_eval(const module& p,
                                    context& ctx,
@@ -145,6 +176,9 @@ std::vector<argument> generic_eval(const module& p,
                                    F trace)
 {
     assert(p.validate() == p.end());
+    // Use the flat plan when the module has been finalized
+    if(const auto* plan = p.get_eval_plan())
+        return generic_eval(*plan, ctx, params, trace);
     std::unordered_map<instruction_ref, argument> results;
     results.reserve(p.size() * 2);
     std::vector<argument> values;
@@ -217,8 +251,28 @@ std::vector<argument> generic_eval(const program& p,
 }
 
 std::vector<argument> program::eval(parameter_map params) const
+{ return this->eval(this->impl->ctx, std::move(params)); }
+
+execution_context program::create_execution_context() const
+{
+    if(not this->is_compiled())
+        MIGRAPHX_THROW("Program must be compiled to create an execution context");
+    // Targets such as the gpu keep the scratch memory and streams in state
+    // shared by every copy of the context
+    if(not this->impl->ctx.concurrent_copies())
+        MIGRAPHX_THROW("Execution contexts are not supported on the " + this->impl->target_name +
+                       " target");
+    // Each context gets its own scratch memory
+    parameter_map bindings;
+    auto shapes = this->get_parameter_shapes();
+    auto it     = shapes.find("scratch");
+    if(it != shapes.end())
+        bindings[it->first] = make_target(this->impl->target_name).allocate(it->second);
+    return {*this, this->impl->ctx, std::move(bindings)};
+}
+
+std::vector<argument> program::eval(context& ctx, parameter_map params) const
 {
-    auto& ctx = this->impl->ctx;
 #ifndef NDEBUG
     auto sctx          = ctx;
     auto check_context = [&](auto f) {
@@ -233,7 +287,43 @@ std::vector<argument> program::eval(parameter_map params) const
 
     auto trace_level = value_of(MIGRAPHX_TRACE_EVAL{});
 
-    if(trace_level > 0)
+    if(auto* tf = get_trace_file())
+    {
+        const auto* mm = this->get_main_module();
+        std::unordered_map<instruction_ref, std::size_t> index;
+        for(auto ins : iterator_for(*mm))
+            index.emplace(ins, index.size());
+        auto tid = get_thread_trace_id();
+        std::vector<trace_event> events;
+        events.reserve(mm->size() + 1);
+        ctx.finish();
+        auto start  = std::chrono::steady_clock::now();
+        auto result = generic_eval(*this, ctx, std::move(params), [&](auto& ins, auto f) {
+            trace_event event;
+            event.name     = ins->name();
+            event.category = "instruction";
+            event.tid      = tid;
+            event.start    = std::chrono::steady_clock::now();
+            auto r         = check_context(f);
+            ctx.finish();
+            event.finish              = std::chrono::steady_clock::now();
+            event.args["instruction"] = "@" + std::to_string(index.at(ins));
+            event.args["shape"]       = to_string(ins->get_shape());
+            event.args["bytes"]       = ins->get_shape().bytes();
+            events.push_back(std::move(event));
+            return r;
+        });
+        trace_event event;
+        event.name     = "eval";
+        event.category = "program";
+        event.tid      = tid;
+        event.start    = start;
+        event.finish   = std::chrono::steady_clock::now();
+        events.push_back(std::move(event));
+        tf->write(events);
+        return result;
+    }
+    else if(trace_level > 0)
     {
         return generic_eval(*this, ctx, std::move(params), [&](auto& ins, auto f) {
             ctx.finish();
@@ -246,8 +336,88 @@ std::vector<argument> program::eval(parameter_map params) const
             return result;
         });
     }
+    else if(not this->impl->hooks.empty())
+    {
+        // The hooks run one instruction at a time, so the lanes of the plan
+        // are not used
+        using milliseconds = std::chrono::duration<double, std::milli>;
+        const auto& hooks  = this->impl->hooks;
+        bool has_after     = std::any_of(
+            hooks.begin(), hooks.end(), [](const auto& h) { return h.after != nullptr; });
+        bool has_outputs = std::any_of(
+            hooks.begin(), hooks.end(), [](const auto& h) { return h.after and h.outputs; });
+        // Results on targets such as the gpu are copied to the host before
+        // they are passed to the hooks
+        target t;
+        bool copy_outputs = has_outputs and this->is_compiled();
+        if(copy_outputs)
+            t = make_target(this->impl->target_name);
+        // The plan visits its steps in order, and each step has its info
+        // already built
+        const auto* plan = this->get_main_module()->get_eval_plan();
+        std::size_t step = 0;
+        instruction_info uncached;
+        return generic_eval(*this, ctx, std::move(params), [&](auto& ins, auto f) {
+            const instruction_info* cached = nullptr;
+            if(plan != nullptr)
+            {
+                const auto& s = plan->steps[step++];
+                if(s.kind == eval_step::compute)
+                    cached = &s.info;
+            }
+            else if(ins->name().front() != '@')
+            {
+                uncached.name         = ins->name();
+                uncached.input_shapes = to_shapes(ins->inputs());
+                uncached.output_shape = ins->get_shape();
+                cached                = &uncached;
+            }
+            // Builtins such as parameters and literals do not run the hooks
+            if(cached == nullptr)
+                return check_context(f);
+            for(auto&& h : hooks)
+            {
+                if(h.before)
+                    h.before(*cached);
+            }
+            // Only wait for the device to time the instruction when a hook
+            // runs after it
+            if(not has_after)
+                return check_context(f);
+            argument result;
+            instruction_info info = *cached;
+            ctx.finish();
+            info.time = time<milliseconds>([&] {
+                result = check_context(f);
+                ctx.finish();
+            });
+            argument output;
+            if(has_outputs)
+                output = copy_outputs ? t.copy_from(result) : result;
+            for(auto&& h : hooks)
+            {
+                if(not h.after)
+                    continue;
+                info.result = h.outputs ? output : argument{};
+                h.after(info);
+            }
+            return result;
+        });
+    }
     else
     {
+        // Run the lanes of the plan concurrently when the target scheduled
+        // instructions on more than one lane
+        const auto* plan = this->get_main_module()->get_eval_plan();
+        if(plan != nullptr and plan->lanes.size() > 1)
+        {
+            // The lanes use ctx from several threads, so the context is
+            // checked around the whole evaluation instead of each step
+            assert(is_shared(ctx, sctx));
+            auto result = eval_lanes(*plan, ctx, params);
+            assert(is_shared(ctx, sctx));
+            return result;
+        }
         return generic_eval(
             *this, ctx, std::move(params), [&](auto&, auto f) { return check_context(f); });
     }
@@ -300,71 +470,163 @@ void program::from_value(const value& v)
     this->finalize();
 }
 
-double common_average(const std::vector<double>& v)
+// Sampling is only stopped early once there are at least this many samples
+const std::size_t min_perf_samples = 10;
+
+struct sample_stats
+{
+    double mean          = 0;
+    double stddev        = 0;
+    double min           = 0;
+    double max           = 0;
+    double ci            = 0;
+    std::size_t samples  = 0;
+    std::size_t outliers = 0;
+};
+
+static double median(std::vector<double> v)
 {
-    std::size_t n = v.size() / 4;
-    double total  = std::accumulate(v.begin() + n, v.end() - n, 0.0);
-    return total / std::distance(v.begin() + n, v.end() - n);
+    assert(not v.empty());
+    auto mid = v.begin() + v.size() / 2;
+    std::nth_element(v.begin(), mid, v.end());
+    if(v.size() % 2 == 1)
+        return *mid;
+    return (*mid + *std::max_element(v.begin(), mid)) / 2.0;
+}
+
+static sample_stats compute_stats(std::vector<double> v, double outlier_threshold)
+{
+    sample_stats result;
+    if(v.empty())
+        return result;
+    if(outlier_threshold > 0 and v.size() > 2)
+    {
+        auto m = median(v);
+        std::vector<double> deviations(v.size());
+        std::transform(
+            v.begin(), v.end(), deviations.begin(), [&](double x) { return std::abs(x - m); });
+        auto mad = median(deviations);
+        if(mad > 0)
+        {
+            auto last       = std::remove_if(v.begin(), v.end(), [&](double x) {
+                return 0.6745 * std::abs(x - m) / mad > outlier_threshold;
+            });
+            result.outliers = std::distance(last, v.end());
+            v.erase(last, v.end());
+        }
+    }
+    auto n         = v.size();
+    result.samples = n;
+    result.mean    = std::accumulate(v.begin(), v.end(), 0.0) / n;
+    result.min     = *std::min_element(v.begin(), v.end());
+    result.max     = *std::max_element(v.begin(), v.end());
+    if(n > 1)
+    {
+        double sq     = std::accumulate(v.begin(), v.end(), 0.0, [&](double x, double y) {
+            return x + (y - result.mean) * (y - result.mean);
+        });
+        result.stddev = std::sqrt(sq / (n - 1));
+        result.ci     = 1.96 * result.stddev / std::sqrt(n);
+    }
+    return result;
 }
 
-void program::perf_report(std::ostream& os, std::size_t n, parameter_map params) const
+struct perf_timings
+{
+    double outlier_threshold = 0;
+    std::vector<double> total;
+    std::vector<double> overhead;
+    std::unordered_map<instruction_ref, std::vector<double>> ins;
+
+    sample_stats total_stats() const { return compute_stats(total, outlier_threshold); }
+    double total_time() const { return total_stats().mean; }
+    double overhead_time() const { return compute_stats(overhead, outlier_threshold).mean; }
+    sample_stats instruction_stats(instruction_ref i) const
+    { return compute_stats(ins.at(i), outlier_threshold); }
+    double instruction_time(instruction_ref i) const { return instruction_stats(i).mean; }
+    double total_instruction_time() const
+    {
+        return std::accumulate(ins.begin(), ins.end(), 0.0, [&](double x, auto&& p) {
+            return x + this->instruction_time(p.first);
+        });
+    }
+    std::unordered_map<std::string, double> op_times() const
+    {
+        std::unordered_map<std::string, double> result;
+        for(auto&& p : ins)
+            result[p.first->name()] += instruction_time(p.first);
+        return result;
+    }
+};
+
+static perf_timings perf_timings_for(const program& p,
+                                     context& ctx,
+                                     std::size_t n,
+                                     const parameter_map& params,
+                                     const perf_options& options)
 {
     using milliseconds = std::chrono::duration<double, std::milli>;
-    auto& ctx          = this->impl->ctx;
-    // Run once by itself
-    eval(params);
-    ctx.finish();
-    // Run and time entire program
-    std::vector<double> total_vec;
-    total_vec.reserve(n);
-    for(std::size_t i = 0; i < n; i++)
+    using seconds      = std::chrono::duration<double>;
+    perf_timings result;
+    result.outlier_threshold = options.outlier_threshold;
+    for(std::size_t i = 0; i < options.warmup; i++)
     {
-        total_vec.push_back(time<milliseconds>([&] {
-            eval(params);
-            ctx.finish();
-        }));
+        p.eval(params);
+        ctx.finish();
     }
-    std::sort(total_vec.begin(), total_vec.end());
-    std::unordered_map<instruction_ref, std::vector<double>> ins_vec;
-    // Fill the map
-    generic_eval(*this, ctx, params, [&](auto ins, auto) {
-        ins_vec[ins].reserve(n);
-        return argument{};
-    });
-    // Run and time each instruction
+    // Each sample runs the program three times: the entire program without
+    // waiting after each instruction, so the total is not inflated by the syncs
+    // needed to time the instructions, then each instruction, and then the
+    // implicit overhead. The time budget is checked against all of the runs.
+    auto start    = std::chrono::steady_clock::now();
+    auto& ins_vec = result.ins;
+    result.total.reserve(n);
+    result.overhead.reserve(n);
     for(std::size_t i = 0; i < n; i++)
     {
-        generic_eval(*this, ctx, params, [&](auto ins, auto f) {
-            argument result;
+        result.total.push_back(time<milliseconds>([&] {
+            p.eval(params);
+            ctx.finish();
+        }));
+        generic_eval(p, ctx, params, [&](auto ins, auto f) {
+            argument r;
             ins_vec[ins].push_back(time<milliseconds>([&] {
-                result = f();
+                r = f();
                 ctx.finish();
             }));
-            return result;
+            return r;
         });
+        result.overhead.push_back(time<milliseconds>([&] { p.dry_run(params); }));
+        if(result.total.size() < min_perf_samples)
+            continue;
+        auto elapsed =
+            std::chrono::duration_cast<seconds>(std::chrono::steady_clock::now() - start).count();
+        if(options.time_budget > 0 and elapsed >= options.time_budget)
+            break;
+        if(options.ci_width > 0)
+        {
+            auto stats = result.total_stats();
+            if(stats.ci <= options.ci_width * stats.mean)
+                break;
+        }
     }
-    for(auto&& p : ins_vec)
-        std::sort(p.second.begin(), p.second.end());
-    // Run and time implicit overhead
-    std::vector<double> overhead_vec;
-    overhead_vec.reserve(n);
-    for(std::size_t i = 0; i < n; i++)
-    {
-        overhead_vec.push_back(time<milliseconds>([&] { dry_run(params); }));
-    }
+    return result;
+}
 
-    double total_time             = common_average(total_vec);
-    double rate                   = 1000.0 / total_time;
-    double overhead_time          = common_average(overhead_vec);
-    double overhead_percent       = overhead_time * 100.0 / total_time;
-    double total_instruction_time = 0.0;
-    std::unordered_map<std::string, double> op_times;
-    for(auto&& p : ins_vec)
-    {
-        double avg = common_average(p.second);
-        op_times[p.first->name()] += avg;
-        total_instruction_time += avg;
-    }
+void program::perf_report(std::ostream& os,
+                          std::size_t n,
+                          parameter_map params,
+                          const perf_options& options) const
+{
+    auto timings = perf_timings_for(*this, this->impl->ctx, n, params, options);
+
+    auto total_stats                  = timings.total_stats();
+    double total_time                 = total_stats.mean;
+    double rate                       = 1000.0 / total_time;
+    double overhead_time              = timings.overhead_time();
+    double overhead_percent           = overhead_time * 100.0 / total_time;
+    double total_instruction_time     = timings.total_instruction_time();
+    auto op_times                     = timings.op_times();
     double calculate_overhead_time    = total_time - total_instruction_time;
     double calculate_overhead_percent = calculate_overhead_time * 100.0 / total_time;
 
@@ -375,7 +637,7 @@ void program::perf_report(std::ostream& os, std::size_t n, parameter_map params)
         if(ins->name() == "@return")
             return;
 
-        double avg     = common_average(ins_vec[ins]);
+        double avg     = timings.instruction_time(ins);
         double percent = std::ceil(100.0 * avg / total_instruction_time);
         os << ": " << avg << "ms, " << percent << "%";
         os << std::endl;
@@ -400,7 +662,11 @@ void program::perf_report(std::ostream& os, std::size_t n, parameter_map params)
     os << std::endl;
 
     os << "Rate: " << rate << "/sec" << std::endl;
-    os << "Total time: " << total_time << "ms" << std::endl;
+    os << "Total time: " << total_time << "ms"
+       << " +/- " << total_stats.ci << "ms" << std::endl;
+    os << "Total time stddev: " << total_stats.stddev << "ms" << std::endl;
+    os << "Samples: " << total_stats.samples << ", " << total_stats.outliers << " outliers"
+       << std::endl;
     os << "Total instructions time: " << total_instruction_time << "ms" << std::endl;
     os << "Overhead time: " << overhead_time << "ms"
        << ", " << calculate_overhead_time << "ms" << std::endl;
@@ -408,6 +674,66 @@ void program::perf_report(std::ostream& os, std::size_t n, parameter_map params)
        << ", " << std::round(calculate_overhead_percent) << "%" << std::endl;
 }
 
+static value stats_to_value(const sample_stats& s)
+{
+    return {{"time", s.mean},
+            {"mean", s.mean},
+            {"min", s.min},
+            {"max", s.max},
+            {"stddev", s.stddev},
+            {"variance", s.stddev * s.stddev},
+            {"ci", s.ci},
+            {"samples", s.samples},
+            {"outliers", s.outliers}};
+}
+
+value program::perf_report_data(std::size_t n,
+                                parameter_map params,
+                                const perf_options& options) const
+{
+    auto timings = perf_timings_for(*this, this->impl->ctx, n, params, options);
+
+    double total_time             = timings.total_time();
+    double total_instruction_time = timings.total_instruction_time();
+
+    value instructions = value::array{};
+    this->print([&](auto ins, auto names) {
+        if(ins->name() == "@return")
+            return;
+        auto v    = stats_to_value(timings.instruction_stats(ins));
+        v["name"] = names.at(ins);
+        v["op"]   = ins->name();
+        instructions.push_back(v);
+    });
+
+    value operators = value::object{};
+    for(auto&& p : timings.op_times())
+        operators[p.first] = p.second;
+
+    value result                       = value::object{};
+    result["rate"]                     = 1000.0 / total_time;
+    result["total_time"]               = total_time;
+    result["total_instructions_time"]  = total_instruction_time;
+    result["overhead_time"]            = timings.overhead_time();
+    result["calculated_overhead_time"] = total_time - total_instruction_time;
+    result["total"]                    = stats_to_value(timings.total_stats());
+    result["instructions"]             = instructions;
+    result["operators"]                = operators;
+    return result;
+}
+
+memory_report program::get_memory_report() const
+{
+    memory_report result;
+    for(auto&& p : this->impl->modules)
+    {
+        auto usage = get_memory_usage(p.second);
+        result.total += usage;
+        result.modules[p.first] = usage;
+    }
+    return result;
+}
+
 void program::debug_print() const { std::cout << *this << std::endl; }
 void program::debug_print(instruction_ref ins) const
 {
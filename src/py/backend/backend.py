@@ -9,10 +9,17 @@ import sys
 if sys.version_info < (3, 0):
     sys.exit()
 
+import collections
+import copy
+import hashlib
+import json
+import os
+import threading
 from onnx import ModelProto
 from onnx.checker import check_model
 from onnx.backend.base import Backend
 import migraphx
+import numpy as np
 from onnx_migraphx.backend_rep import MIGraphXBackendRep
 
 
@@ -20,14 +27,146 @@ def get_device():
     return ("CPU", "GPU")
 
 
+class SessionOptions(object):
+    """
+    Options used by :meth:`MIGraphXBackend.prepare` to compile a model.
+    The fields can also be passed directly as keyword arguments to
+    `prepare`.
+
+    :param fp16: quantize the model to fp16 before compiling
+    :param int8_calibration: list of input dicts used to quantize
+        the model to int8, None disables int8 quantization
+    :param fast_math: use faster approximate math functions
+    :param offload_copy: copy inputs and outputs to and from the device
+    :param cache_dir: directory to store compiled programs, None uses
+        the directory set with :meth:`MIGraphXBackend.set_cache_dir`
+    :param batch_sizes: list of batch sizes to compile a program for
+        on demand, None compiles the model for its own input shapes
+    """
+    def __init__(self, **kwargs):
+        self.fp16 = False
+        self.int8_calibration = None
+        self.fast_math = True
+        self.offload_copy = True
+        self.cache_dir = None
+        self.batch_sizes = None
+        for k, v in kwargs.items():
+            if not hasattr(self, k):
+                raise TypeError("Unknown session option '{}'".format(k))
+            setattr(self, k, v)
+
+    def compile_key(self):
+        """
+        Returns the options that affect the compiled program.
+        """
+        key = {
+            "fp16": self.fp16,
+            "fast_math": self.fast_math,
+            "offload_copy": self.offload_copy
+        }
+        if self.int8_calibration is not None:
+            h = hashlib.sha256()
+            for data in self.int8_calibration:
+                for name in sorted(data):
+                    h.update(name.encode())
+                    h.update(np.ascontiguousarray(data[name]).tobytes())
+            key["int8"] = h.hexdigest()
+        return key
+
+
 class MIGraphXBackend(Backend):
     _device = "GPU"
-    _input_names = []
     _prog_string = ""
+    _cache = collections.OrderedDict()
+    _cache_size = 16
+    _cache_dir = None
+    _cache_lock = threading.Lock()
 
     @classmethod
     def set_device(cls, device):
         cls._device = device
+
+    @classmethod
+    def set_cache_size(cls, size):
+        """
+        Set the number of compiled programs kept in memory.
+        A size of zero disables the in-memory cache.
+        """
+        with cls._cache_lock:
+            cls._cache_size = size
+            while len(cls._cache) > max(size, 0):
+                cls._cache.popitem(last=False)
+
+    @classmethod
+    def set_cache_dir(cls, cache_dir):
+        """
+        Set a directory to store compiled programs so they can be
+        reused across processes. None disables the on-disk cache.
+        """
+        if cache_dir is not None and not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        cls._cache_dir = cache_dir
+
+    @classmethod
+    def clear_cache(cls):
+        with cls._cache_lock:
+            cls._cache.clear()
+
+    @classmethod
+    def _cache_key(cls, model, device, options):
+        h = hashlib.sha256()
+        h.update(model)
+        h.update(device.encode())
+        h.update(json.dumps(options, sort_keys=True).encode())
+        return h.hexdigest()
+
+    @classmethod
+    def _cache_get(cls, key, cache_dir=None):
+        with cls._cache_lock:
+            if key in cls._cache:
+                cls._cache.move_to_end(key)
+                return cls._cache[key]
+        cache_dir = cache_dir or cls._cache_dir
+        if cache_dir is None:
+            return None
+        prog_file = os.path.join(cache_dir, key + ".mxr")
+        names_file = os.path.join(cache_dir, key + ".json")
+        if not os.path.isfile(prog_file) or not os.path.isfile(names_file):
+            return None
+        with open(names_file) as f:
+            input_names = json.load(f)
+        entry = (migraphx.load(prog_file), input_names)
+        cls._cache_put(key, entry)
+        return entry
+
+    @classmethod
+    def _cache_put(cls, key, entry):
+        with cls._cache_lock:
+            if cls._cache_size <= 0:
+                return
+            cls._cache[key] = entry
+            cls._cache.move_to_end(key)
+            while len(cls._cache) > cls._cache_size:
+                cls._cache.popitem(last=False)
+
+    @classmethod
+    def _cache_save(cls, key, entry, cache_dir=None):
+        cache_dir = cache_dir or cls._cache_dir
+        if cache_dir is None:
+            return
+        if not os.path.isdir(cache_dir):
+            os.makedirs(cache_dir)
+        prog, input_names = entry
+        prog_file = os.path.join(cache_dir, key + ".mxr")
+        names_file = os.path.join(cache_dir, key + ".json")
+        # Write to temporary files first so other processes never
+        # see a partially written entry
+        suffix = ".{}.tmp".format(os.getpid())
+        migraphx.save(prog, prog_file + suffix)
+        with open(names_file + suffix, "w") as f:
+            json.dump(input_names, f)
+        os.replace(prog_file + suffix, prog_file)
+        os.replace(names_file + suffix, names_file)
     """
     Implements
     `ONNX's backend API <https://github.com/onnx/onnx/blob/master/docs/ImplementingAnOnnxBackend.md>`_
@@ -39,6 +178,43 @@ class MIGraphXBackend(Backend):
     Note: This is not the official Python API.
     """  # noqa: E501
 
+    @classmethod
+    def _compile_model(cls, model, device, options, map_input_dims=None):
+        compile_key = options.compile_key()
+        if map_input_dims:
+            compile_key["map_input_dims"] = map_input_dims
+        key = cls._cache_key(model, device, compile_key)
+        entry = cls._cache_get(key, options.cache_dir)
+        if entry is None:
+            dims = map_input_dims or {}
+            inf = migraphx.parse_onnx_buffer(model, map_input_dims=dims)
+            cls._prog_string = str("\nProgram =\n{}".format(inf))
+            input_names = inf.get_parameter_names()
+            t = migraphx.get_target(device.lower())
+            if options.fp16:
+                migraphx.quantize_fp16(inf)
+            if options.int8_calibration is not None:
+                calibration = [{
+                    name: migraphx.argument(np.ascontiguousarray(value))
+                    for name, value in data.items()
+                } for data in options.int8_calibration]
+                migraphx.quantize_int8(inf, t, calibration)
+            inf.compile(t,
+                        offload_copy=options.offload_copy,
+                        fast_math=options.fast_math)
+            cls._prog_string = cls._prog_string + str(
+                "\nCompiled program =\n{}".format(inf))
+            entry = (inf, input_names)
+            cls._cache_put(key, entry)
+            cls._cache_save(key, entry, options.cache_dir)
+        else:
+            cls._prog_string = str("\nCompiled program =\n{}".format(entry[0]))
+        # The cached program is never handed out, every caller gets its own
+        # copy so reps prepared from the same model do not share a program
+        # and its context when they run concurrently
+        prog, input_names = entry
+        return (prog.clone(), input_names)
+
     @classmethod
     def get_program(cls):
         return cls._prog_string
@@ -74,30 +250,43 @@ class MIGraphXBackend(Backend):
         :param device: requested device for the computation,
             None means the default one which depends on
             the compilation settings
-        :param kwargs: see :class:`onnxruntime.SessionOptions`
+        :param kwargs: `options` can be set to a :class:`SessionOptions`,
+            any other keyword that matches a field of
+            :class:`SessionOptions` overrides that field
         :return: :class:`migraphx.program`
         """
         if isinstance(model, MIGraphXBackendRep):
             return model
         elif isinstance(model, migraphx.program):
-            return MIGraphXBackendRep(model, cls._input_names)
+            return MIGraphXBackendRep(model, model.get_parameter_names())
         elif isinstance(model, (str, bytes)):
+            options = copy.copy(kwargs.get("options") or SessionOptions())
             for k, v in kwargs.items():
-                if hasattr(options, k):
+                if k != "options" and hasattr(options, k):
                     setattr(options, k, v)
             if device is not None and not cls.supports_device(device):
                 raise RuntimeError(
                     "Incompatible device expected '{0}', got '{1}'".format(
                         device, get_device()))
-            inf = migraphx.parse_onnx_buffer(model)
-            cls._prog_string = str("\nProgram =\n{}".format(inf))
             device = cls._device
-            cls._input_names = inf.get_parameter_names()
-            inf.compile(migraphx.get_target(device.lower()))
-            cls._prog_string = cls._prog_string + str(
-                "\nCompiled program =\n{}".format(inf))
+            if isinstance(model, str):
+                model = model.encode()
+            if options.batch_sizes:
+                shapes = migraphx.parse_onnx_buffer(
+                    model).get_parameter_shapes()
+
+                def compile_batch(batch):
+                    dims = {
+                        name: [batch] + s.lens()[1:]
+                        for name, s in shapes.items()
+                    }
+                    return cls._compile_model(model, device, options, dims)
+
+                return MIGraphXBackendRep(None, None, options.batch_sizes,
+                                          compile_batch)
 
-            return cls.prepare(inf, device, **kwargs)
+            return MIGraphXBackendRep(
+                *cls._compile_model(model, device, options))
         else:
             # type: ModelProto
             check_model(model)
@@ -9,6 +9,9 @@ import sys
 if sys.version_info < (3, 0):
     sys.exit()
 
+import bisect
+import concurrent.futures
+import threading
 import migraphx
 from onnx.backend.base import BackendRep
 import numpy as np
@@ -20,12 +23,108 @@ class MIGraphXBackendRep(BackendRep):
     Computes the prediction for a pipeline converted into
     an :class:`onnxruntime.InferenceSession` node.
     """
-    def __init__(self, prog, input_names):
+    def __init__(self, prog, input_names, batch_sizes=None,
+                 compile_batch=None):
         """
         :param session: :class:`migraphx.program`
+        :param batch_sizes: batch sizes to compile the model for,
+            None disables batch bucketing
+        :param compile_batch: function taking a batch size and returning
+            the compiled program and its input names for that batch
         """
         self._program = prog
         self._input_names = input_names
+        self._batch_sizes = sorted(set(batch_sizes or []))
+        self._compile_batch = compile_batch
+        self._buckets = {}
+        self._lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "compiles": 0,
+            "samples": 0,
+            "padded_samples": 0,
+            "bucket_requests": {b: 0
+                                for b in self._batch_sizes}
+        }
+        if self._batch_sizes and self._compile_batch is None:
+            raise RuntimeError("Batch bucketing requires a compile function")
+
+    def get_stats(self):
+        """
+        Returns the statistics for batch bucketing. The hit rate is
+        the fraction of bucketed runs that used an already compiled
+        program and the padding waste is the fraction of the computed
+        samples that were padding.
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["bucket_requests"] = dict(self._stats["bucket_requests"])
+        requests = stats["requests"]
+        computed = stats["samples"] + stats["padded_samples"]
+        stats["hit_rate"] = 1.0 - float(
+            stats["compiles"]) / requests if requests > 0 else 0.0
+        stats["padding_waste"] = float(
+            stats["padded_samples"]) / computed if computed > 0 else 0.0
+        return stats
+
+    def _get_bucket(self, batch):
+        with self._lock:
+            self._stats["requests"] += 1
+            self._stats["bucket_requests"][batch] += 1
+            future = self._buckets.get(batch)
+            compile = future is None
+            if compile:
+                self._stats["compiles"] += 1
+                future = concurrent.futures.Future()
+                self._buckets[batch] = future
+        # Compile outside of the lock so runs with other batch sizes are
+        # not blocked, runs with the same batch size wait on the future
+        if compile:
+            try:
+                future.set_result(self._compile_batch(batch))
+            except BaseException as e:
+                # Let the next run retry the compile
+                with self._lock:
+                    del self._buckets[batch]
+                future.set_exception(e)
+        return future.result()
+
+    def _run_bucketed(self, inputs):
+        n = inputs[0].shape[0]
+        outs = None
+        start = 0
+        while start < n:
+            # Pick the smallest bucket that fits the remaining samples,
+            # otherwise split the request into chunks of the largest bucket
+            i = bisect.bisect_left(self._batch_sizes, n - start)
+            batch = self._batch_sizes[min(i, len(self._batch_sizes) - 1)]
+            count = min(batch, n - start)
+            prog, input_names = self._get_bucket(batch)
+            inps = {}
+            for name, inp in zip(input_names, inputs):
+                chunk = np.ascontiguousarray(inp[start:start + count])
+                if count < batch:
+                    pad = np.zeros((batch - count, ) + chunk.shape[1:],
+                                   dtype=chunk.dtype)
+                    chunk = np.concatenate([chunk, pad])
+                inps[name] = migraphx.argument(chunk)
+            results = [np.array(out) for out in prog.run(inps)]
+            results = [
+                r[:count] if r.ndim > 0 and r.shape[0] == batch else r
+                for r in results
+            ]
+            with self._lock:
+                self._stats["samples"] += count
+                self._stats["padded_samples"] += batch - count
+            if outs is None:
+                outs = [[r] for r in results]
+            else:
+                for out, r in zip(outs, results):
+                    out.append(r)
+            start += count
+        return [
+            np.concatenate(out) if len(out) > 1 else out[0] for out in outs
+        ]
 
     def run(self, inputs, **kwargs):  # type: (Any, **Any) -> Tuple[Any, ...]
         """
@@ -33,6 +132,11 @@ class MIGraphXBackendRep(BackendRep):
         See :meth:`migraphx.program.run`.
         """
 
+        if self._batch_sizes:
+            if not isinstance(inputs, list):
+                inputs = [inputs]
+            return self._run_bucketed([np.asarray(inp) for inp in inputs])
+
         if isinstance(inputs, list):
             inps = {}
             for i, name in enumerate(self._input_names):
@@ -2,6 +2,10 @@
 #include <pybind11/pybind11.h>
 #include <pybind11/stl.h>
 #include <pybind11/numpy.h>
+#include <condition_variable>
+#include <deque>
+#include <mutex>
+#include <thread>
 #include <migraphx/program.hpp>
 #include <migraphx/quantization.hpp>
 #include <migraphx/generate.hpp>
@@ -14,6 +18,7 @@
 #include <migraphx/register_target.hpp>
 #include <migraphx/json.hpp>
 #include <migraphx/make_op.hpp>
+#include <migraphx/ranges.hpp>
 
 #ifdef HAVE_GPU
 #include <migraphx/gpu/hip.hpp>
@@ -168,6 +173,17 @@ py::buffer_info to_buffer_info(T& x)
     return b;
 }
 
+py::array to_numpy(const py::object& self, bool copy)
+{
+    auto& x              = self.cast<migraphx::argument&>();
+    py::buffer_info info = to_buffer_info(x);
+    py::dtype dt(info);
+    // Without a base object the data is copied into a new array
+    if(copy)
+        return py::array(dt, info.shape, info.strides, info.ptr);
+    return py::array(dt, info.shape, info.strides, info.ptr, self);
+}
+
 migraphx::shape to_shape(const py::buffer_info& info)
 {
     migraphx::shape::type_t t;
@@ -208,6 +224,505 @@ migraphx::shape to_shape(const py::buffer_info& info)
     }
 }
 
+// Data structures from the DLPack specification (https://github.com/dmlc/dlpack)
+namespace dlpack {
+
+enum device_type : std::int32_t
+{
+    cpu       = 1,
+    cuda_host = 3,
+    rocm      = 10,
+    rocm_host = 11
+};
+
+enum type_code : std::uint8_t
+{
+    int_code   = 0,
+    uint_code  = 1,
+    float_code = 2,
+    bool_code  = 6
+};
+
+struct device
+{
+    std::int32_t device_type;
+    std::int32_t device_id;
+};
+
+struct data_type
+{
+    std::uint8_t code;
+    std::uint8_t bits;
+    std::uint16_t lanes;
+};
+
+struct tensor
+{
+    void* data;
+    device dev;
+    std::int32_t ndim;
+    data_type dtype;
+    std::int64_t* shape;
+    std::int64_t* strides;
+    std::uint64_t byte_offset;
+};
+
+struct managed_tensor
+{
+    tensor dl_tensor;
+    void* manager_ctx;
+    void (*deleter)(managed_tensor* self);
+};
+
+} // namespace dlpack
+
+template <class T>
+dlpack::data_type to_dlpack_type(migraphx::shape::type_t t, T)
+{
+    dlpack::data_type result{dlpack::uint_code, sizeof(T) * 8, 1};
+    if(t == migraphx::shape::bool_type)
+        result.code = dlpack::bool_code;
+    else if(t == migraphx::shape::half_type or std::is_floating_point<T>{})
+        result.code = dlpack::float_code;
+    else if(std::is_signed<T>{})
+        result.code = dlpack::int_code;
+    return result;
+}
+
+dlpack::device get_dlpack_device(const migraphx::argument& x)
+{
+#ifdef HAVE_GPU
+    // Arguments from allocate_gpu or to_gpu are in device memory
+    if(not x.empty())
+    {
+        auto id = migraphx::gpu::get_memory_device(x.data());
+        if(id >= 0)
+            return {dlpack::rocm, id};
+    }
+#endif
+    (void)x;
+    return {dlpack::cpu, 0};
+}
+
+struct dlpack_export
+{
+    migraphx::argument arg;
+    std::vector<std::int64_t> lens;
+    std::vector<std::int64_t> strides;
+    dlpack::managed_tensor managed;
+};
+
+py::object to_dlpack(const migraphx::argument& x)
+{
+    auto e        = std::make_unique<dlpack_export>();
+    const auto& s = x.get_shape();
+    e->arg        = x;
+    e->lens.assign(s.lens().begin(), s.lens().end());
+    e->strides.assign(s.strides().begin(), s.strides().end());
+    auto& t = e->managed.dl_tensor;
+    t.data  = x.data();
+    t.dev   = get_dlpack_device(x);
+    t.ndim  = static_cast<std::int32_t>(e->lens.size());
+    s.visit_type([&](auto as) { t.dtype = to_dlpack_type(s.type(), as()); });
+    t.shape                = e->lens.data();
+    t.strides              = e->strides.data();
+    t.byte_offset          = 0;
+    e->managed.manager_ctx = e.get();
+    e->managed.deleter     = [](dlpack::managed_tensor* self) {
+        delete static_cast<dlpack_export*>(self->manager_ctx); // NOLINT
+    };
+    auto* capsule = PyCapsule_New(&e->managed, "dltensor", [](PyObject* c) {
+        // The capsule is renamed once the tensor is consumed, after which the
+        // consumer is responsible for calling the deleter
+        if(PyCapsule_IsValid(c, "dltensor") == 0)
+            return;
+        auto* m = static_cast<dlpack::managed_tensor*>(PyCapsule_GetPointer(c, "dltensor"));
+        m->deleter(m);
+    });
+    if(capsule == nullptr)
+        throw py::error_already_set();
+    e.release();
+    return py::reinterpret_steal<py::object>(capsule);
+}
+
+migraphx::argument from_dlpack(py::object x)
+{
+    if(py::hasattr(x, "__dlpack__"))
+        x = x.attr("__dlpack__")();
+    if(PyCapsule_IsValid(x.ptr(), "dltensor") == 0)
+        MIGRAPHX_THROW("MIGRAPHX PYTHON: Expected an unused DLPack capsule");
+    auto* m = static_cast<dlpack::managed_tensor*>(PyCapsule_GetPointer(x.ptr(), "dltensor"));
+    // Only take ownership once the capsule is renamed, otherwise the capsule
+    // still calls the deleter when it is destroyed
+    if(PyCapsule_SetName(x.ptr(), "used_dltensor") != 0)
+        throw py::error_already_set();
+    std::shared_ptr<dlpack::managed_tensor> managed(m, [](dlpack::managed_tensor* self) {
+        if(self->deleter != nullptr)
+            self->deleter(self);
+    });
+
+    const auto& t = m->dl_tensor;
+    switch(t.dev.device_type)
+    {
+    case dlpack::cpu:
+    case dlpack::cuda_host:
+    case dlpack::rocm_host: break;
+#ifdef HAVE_GPU
+    case dlpack::rocm: break;
+#endif
+    default:
+        MIGRAPHX_THROW("MIGRAPHX PYTHON: Unsupported DLPack device " +
+                       std::to_string(t.dev.device_type));
+    }
+    if(t.dtype.lanes != 1)
+        MIGRAPHX_THROW("MIGRAPHX PYTHON: Vector types are not supported for DLPack");
+
+    migraphx::shape::type_t type = migraphx::shape::float_type;
+    bool found                   = false;
+    visit_types([&](auto as) {
+        auto dtype = to_dlpack_type(as.type_enum(), as());
+        if(dtype.code == t.dtype.code and dtype.bits == t.dtype.bits)
+        {
+            type  = as.type_enum();
+            found = true;
+        }
+    });
+    if(not found)
+        MIGRAPHX_THROW("MIGRAPHX PYTHON: Unsupported DLPack data type " +
+                       std::to_string(t.dtype.code) + ":" + std::to_string(t.dtype.bits));
+
+    std::vector<std::size_t> lens(t.shape, t.shape + t.ndim);
+    std::vector<std::size_t> strides(t.ndim);
+    if(t.strides == nullptr)
+    {
+        std::size_t stride = 1;
+        for(auto i = t.ndim; i > 0; i--)
+        {
+            strides[i - 1] = stride;
+            stride *= lens[i - 1];
+        }
+    }
+    else
+    {
+        if(std::any_of(t.strides, t.strides + t.ndim, [](auto i) { return i < 0; }))
+            MIGRAPHX_THROW("MIGRAPHX PYTHON: Negative strides are not supported for DLPack");
+        strides.assign(t.strides, t.strides + t.ndim);
+    }
+
+    migraphx::shape s = lens.empty() ? migraphx::shape{type} : migraphx::shape{type, lens, strides};
+    // The argument holds on to the managed tensor so the memory stays alive
+    return {s, [managed] {
+                return static_cast<char*>(managed->dl_tensor.data) + managed->dl_tensor.byte_offset;
+            }};
+}
+
+migraphx::parameter_map to_parameter_map(const py::dict& params)
+{
+    migraphx::parameter_map pm;
+    for(auto x : params)
+    {
+        std::string key      = x.first.cast<std::string>();
+        py::buffer b         = x.second.cast<py::buffer>();
+        py::buffer_info info = b.request();
+        pm[key]              = migraphx::argument(to_shape(info), info.ptr);
+    }
+    return pm;
+}
+
+void copy_output(const migraphx::argument& result, const migraphx::argument& output)
+{
+    if(result.get_shape().lens() != output.get_shape().lens())
+        MIGRAPHX_THROW("MIGRAPHX PYTHON: Output buffer has shape " +
+                       migraphx::to_string(output.get_shape()) + " but expected " +
+                       migraphx::to_string(result.get_shape()));
+    migraphx::visit_all(result, output)([&](auto input, auto out) {
+        std::copy(input.begin(), input.end(), out.begin());
+    });
+}
+
+struct parameter_binding
+{
+    struct slot
+    {
+        std::string name;
+        migraphx::shape s;
+        migraphx::argument* arg = nullptr;
+        // The layout of the last buffer that was bound, so the shape only
+        // needs to be recomputed when it changes
+        std::string format;
+        decltype(py::buffer_info::shape) lens;
+        decltype(py::buffer_info::strides) strides;
+    };
+
+    parameter_binding(const migraphx::program& p, std::vector<std::string> names) : prog(&p)
+    {
+        auto param_shapes = p.get_parameter_shapes();
+        if(names.empty())
+            names = p.get_parameter_names();
+        for(auto&& name : names)
+        {
+            if(not migraphx::contains(param_shapes, name))
+                MIGRAPHX_THROW("MIGRAPHX PYTHON: Parameter not found: " + name);
+            if(migraphx::contains(params, name))
+                MIGRAPHX_THROW("MIGRAPHX PYTHON: Parameter bound twice: " + name);
+            slot x;
+            x.name = name;
+            x.s    = param_shapes.at(name);
+            x.arg  = &params[name];
+            slots.push_back(x);
+        }
+    }
+
+    // The slots point into params, so the binding can be moved but not copied
+    parameter_binding(const parameter_binding&) = delete;
+    parameter_binding(parameter_binding&&)      = default;
+
+    std::vector<std::string> get_names() const
+    {
+        std::vector<std::string> result;
+        std::transform(slots.begin(), slots.end(), std::back_inserter(result), [](auto&& x) {
+            return x.name;
+        });
+        return result;
+    }
+
+    void bind(slot& x, const py::buffer_info& info)
+    {
+        if(info.format != x.format or info.shape != x.lens or info.strides != x.strides)
+        {
+            auto s = to_shape(info);
+            if(s != x.s)
+                MIGRAPHX_THROW("MIGRAPHX PYTHON: Incorrect shape {" + migraphx::to_string(s) +
+                               "} for parameter: " + x.name);
+            x.format  = info.format;
+            x.lens    = info.shape;
+            x.strides = info.strides;
+        }
+        *x.arg = migraphx::argument(x.s, info.ptr);
+    }
+
+    std::vector<migraphx::argument> run(const py::args& args)
+    {
+        if(args.size() != slots.size())
+            MIGRAPHX_THROW("MIGRAPHX PYTHON: Expected " + std::to_string(slots.size()) +
+                           " parameters but got " + std::to_string(args.size()));
+        for(std::size_t i = 0; i < slots.size(); i++)
+        {
+            py::buffer b         = args[i].cast<py::buffer>();
+            py::buffer_info info = b.request();
+            bind(slots[i], info);
+        }
+        py::gil_scoped_release nogil;
+        return prog->eval(params);
+    }
+
+    private:
+    const migraphx::program* prog;
+    std::vector<slot> slots;
+    migraphx::parameter_map params;
+};
+
+struct program_executor
+{
+    struct task
+    {
+        migraphx::parameter_map params;
+        // Keeps the input buffers alive until the task has run, even if the
+        // caller changes the dict afterwards
+        py::tuple inputs;
+        py::object future;
+    };
+
+    // The workers share the state with the executor, since a worker that
+    // destroys the executor from a callback can not be joined and finishes
+    // the remaining tasks on its own
+    struct state
+    {
+        explicit state(const migraphx::program& p, std::size_t queue_size)
+            : prog(p), max_queue(queue_size)
+        {
+        }
+
+        std::unique_ptr<task> pop()
+        {
+            std::unique_lock<std::mutex> lock(mutex);
+            pop_cv.wait(lock, [&] { return stopped or not queue.empty(); });
+            if(queue.empty())
+                return nullptr;
+            auto t = std::move(queue.front());
+            queue.pop_front();
+            lock.unlock();
+            push_cv.notify_one();
+            return t;
+        }
+
+        template <class F>
+        void work(F eval)
+        {
+            while(auto t = pop())
+            {
+                {
+                    py::gil_scoped_acquire gil;
+                    bool running = false;
+                    try
+                    {
+                        running = t->future.attr("set_running_or_notify_cancel")().cast<bool>();
+                    }
+                    catch(const py::error_already_set&)
+                    {
+                        // The future is in an unexpected state, so skip the task
+                    }
+                    if(not running)
+                    {
+                        t.reset();
+                        continue;
+                    }
+                }
+                std::vector<migraphx::argument> results;
+                std::string error;
+                try
+                {
+                    results = eval(t->params);
+                }
+                catch(const std::exception& e)
+                {
+                    error = e.what();
+                    if(error.empty())
+                        error = "Unknown error";
+                }
+                py::gil_scoped_acquire gil;
+                // An exception can not escape the worker thread, and setting the
+                // result can raise, for example when the future is already done
+                try
+                {
+                    if(error.empty())
+                        t->future.attr("set_result")(py::cast(results));
+                    else
+                        t->future.attr("set_exception")(
+                            py::reinterpret_borrow<py::object>(PyExc_RuntimeError)(error));
+                }
+                catch(const py::error_already_set&)
+                {
+                }
+                catch(const std::exception&)
+                {
+                }
+                // Release the python objects while the GIL is held
+                t.reset();
+            }
+        }
+
+        migraphx::program prog;
+        std::size_t max_queue = 0;
+        std::deque<std::unique_ptr<task>> queue;
+        std::mutex mutex;
+        std::condition_variable push_cv;
+        std::condition_variable pop_cv;
+        bool stopped = false;
+    };
+
+    program_executor(const migraphx::program& p, std::size_t workers, std::size_t queue_size)
+        : s(std::make_shared<state>(p, queue_size)),
+          future_type(py::module::import("concurrent.futures").attr("Future"))
+    {
+        if(workers == 0)
+            MIGRAPHX_THROW("MIGRAPHX PYTHON: Executor needs at least one worker");
+        for(std::size_t i = 0; i < workers; i++)
+        {
+            // Compiled programs share their weights across the workers, which
+            // needs a target that supports execution contexts
+            if(p.is_compiled() and workers > 1)
+                threads.emplace_back([st = s, ctx = s->prog.create_execution_context()]() mutable {
+                    st->work([&](const auto& params) {
+                        // The results can point into the scratch memory of the
+                        // context, which the next task on this worker reuses
+                        auto results = ctx.eval(params);
+                        for(auto& r : results)
+                        {
+                            migraphx::argument copy{r.get_shape()};
+                            copy_output(r, copy);
+                            r = copy;
+                        }
+                        return results;
+                    });
+                });
+            else
+                threads.emplace_back([st = s] {
+                    st->work([&](const auto& params) { return st->prog.eval(params); });
+                });
+        }
+    }
+
+    program_executor(const program_executor&)            = delete;
+    program_executor& operator=(const program_executor&) = delete;
+
+    ~program_executor()
+    {
+        try
+        {
+            shutdown();
+        }
+        catch(...)
+        {
+        }
+    }
+
+    py::object run_async(const py::dict& params, bool block)
+    {
+        auto t      = std::make_unique<task>();
+        t->params   = to_parameter_map(params);
+        t->inputs   = py::tuple(params.attr("values")());
+        t->future   = future_type();
+        auto result = t->future;
+        {
+            py::gil_scoped_release nogil;
+            std::unique_lock<std::mutex> lock(s->mutex);
+            if(s->max_queue > 0 and block)
+                s->push_cv.wait(lock, [&] { return s->stopped or s->queue.size() < s->max_queue; });
+            if(s->stopped)
+                MIGRAPHX_THROW("MIGRAPHX PYTHON: Executor has been shut down");
+            if(s->max_queue > 0 and s->queue.size() >= s->max_queue)
+                MIGRAPHX_THROW("MIGRAPHX PYTHON: Executor queue is full");
+            s->queue.push_back(std::move(t));
+        }
+        s->pop_cv.notify_one();
+        return result;
+    }
+
+    std::size_t pending()
+    {
+        std::lock_guard<std::mutex> lock(s->mutex);
+        return s->queue.size();
+    }
+
+    void shutdown()
+    {
+        {
+            std::lock_guard<std::mutex> lock(s->mutex);
+            s->stopped = true;
+        }
+        s->push_cv.notify_all();
+        s->pop_cv.notify_all();
+        // The workers need the GIL to complete the remaining futures
+        py::gil_scoped_release nogil;
+        for(auto&& t : threads)
+        {
+            if(not t.joinable())
+                continue;
+            // Called from a callback of a future on one of the workers
+            if(t.get_id() == std::this_thread::get_id())
+                t.detach();
+            else
+                t.join();
+        }
+    }
+
+    private:
+    std::shared_ptr<state> s;
+    py::object future_type;
+    std::vector<std::thread> threads;
+};
+
 MIGRAPHX_PYBIND11_MODULE(migraphx, m)
 {
     py::class_<migraphx::shape>(m, "shape")
@@ -235,6 +750,16 @@ MIGRAPHX_PYBIND11_MODULE(migraphx, m)
                  new(&x) migraphx::argument(to_shape(info), info.ptr);
              })
         .def("get_shape", &migraphx::argument::get_shape)
+        .def("numpy", &to_numpy, py::arg("copy") = false)
+        .def(
+            "__dlpack__",
+            [](const migraphx::argument& x, const py::object&) { return to_dlpack(x); },
+            py::arg("stream") = py::none())
+        .def("__dlpack_device__",
+             [](const migraphx::argument& x) {
+                 auto dev = get_dlpack_device(x);
+                 return py::make_tuple(dev.device_type, dev.device_id);
+             })
         .def("tolist",
              [](migraphx::argument& x) {
                  py::list l{x.get_shape().elements()};
@@ -253,22 +778,74 @@ MIGRAPHX_PYBIND11_MODULE(migraphx, m)
         .def("__ne__", std::not_equal_to<migraphx::module>{})
         .def("__repr__", [](const migraphx::module& mm) { return migraphx::to_string(mm); });
 
-    py::class_<migraphx::program>(m, "program")
-        .def("clone", [](migraphx::program& p) { return *(new migraphx::program(p)); })
+    py::class_<parameter_binding>(m, "binding")
+        .def("names", &parameter_binding::get_names)
+        .def("run", &parameter_binding::run);
+
+    py::class_<program_executor>(m, "executor")
+        .def(py::init<const migraphx::program&, std::size_t, std::size_t>(),
+             py::arg("p"),
+             py::arg("workers")    = 1,
+             py::arg("queue_size") = 0)
+        .def("run_async", &program_executor::run_async, py::arg("params"), py::arg("block") = true)
+        .def("pending", &program_executor::pending)
+        .def("shutdown", &program_executor::shutdown);
+
+    py::class_<migraphx::instruction_info>(m, "instruction_info")
+        .def("name", [](const migraphx::instruction_info& i) { return i.name; })
+        .def("input_shapes", [](const migraphx::instruction_info& i) { return i.input_shapes; })
+        .def("output_shape", [](const migraphx::instruction_info& i) { return i.output_shape; })
+        .def("time", [](const migraphx::instruction_info& i) { return i.time; })
+        .def("result", [](const migraphx::instruction_info& i) -> py::object {
+            if(i.result.empty())
+                return py::none();
+            return py::cast(i.result);
+        });
+
+    py::class_<migraphx::execution_context>(m, "execution_context")
+        // The argument can refer to the memory of a python buffer
+        .def("bind",
+             &migraphx::execution_context::bind,
+             py::arg("name"),
+             py::arg("arg"),
+             py::keep_alive<1, 3>())
+        .def("run", [](migraphx::execution_context& ctx, py::dict params) {
+            auto pm = to_parameter_map(params);
+            py::gil_scoped_release nogil;
+            return ctx.eval(pm);
+        });
+
+    py::class_<migraphx::program>(m, "program", py::dynamic_attr())
+        .def("clone", [](migraphx::program& p) { return migraphx::program(p); })
         .def("get_parameter_names", &migraphx::program::get_parameter_names)
         .def("get_parameter_shapes", &migraphx::program::get_parameter_shapes)
         .def("get_output_shapes", &migraphx::program::get_output_shapes)
         .def(
             "compile",
-            [](migraphx::program& p, const migraphx::target& t, bool offload_copy, bool fast_math) {
+            [](migraphx::program& p,
+               const migraphx::target& t,
+               bool offload_copy,
+               bool fast_math,
+               bool profile) -> py::object {
                 migraphx::compile_options options;
                 options.offload_copy = offload_copy;
                 options.fast_math    = fast_math;
-                p.compile(t, options);
+                migraphx::pass_profile prof;
+                if(profile)
+                    options.profile = &prof;
+                {
+                    py::gil_scoped_release nogil;
+                    p.compile(t, options);
+                }
+                if(not profile)
+                    return py::none();
+                return py::module::import("json").attr("loads")(
+                    migraphx::to_json_string(prof.to_value()));
             },
             py::arg("t"),
             py::arg("offload_copy") = true,
-            py::arg("fast_math")    = true)
+            py::arg("fast_math")    = true,
+            py::arg("profile")      = false)
         .def("get_main_module",
              [](migraphx::program& p) {
                  auto* mm = p.get_main_module();
@@ -276,16 +853,132 @@ MIGRAPHX_PYBIND11_MODULE(migraphx, m)
              })
         .def("run",
              [](migraphx::program& p, py::dict params) {
-                 migraphx::parameter_map pm;
-                 for(auto x : params)
-                 {
-                     std::string key      = x.first.cast<std::string>();
-                     py::buffer b         = x.second.cast<py::buffer>();
-                     py::buffer_info info = b.request();
-                     pm[key]              = migraphx::argument(to_shape(info), info.ptr);
-                 }
+                 auto pm = to_parameter_map(params);
+                 // The buffers are owned by params which is kept alive for the
+                 // duration of the call, so the GIL is not needed during eval
+                 py::gil_scoped_release nogil;
                  return p.eval(pm);
              })
+        .def(
+            "run_async",
+            [](py::object self, const py::dict& params) {
+                // The default executor is created on first use and then kept
+                // with the program
+                if(not py::hasattr(self, "_executor"))
+                    self.attr("_executor") = py::cast(std::make_unique<program_executor>(
+                        self.cast<const migraphx::program&>(), 1, 0));
+                return self.attr("_executor").cast<program_executor&>().run_async(params, true);
+            },
+            py::arg("params"))
+        .def(
+            "run_into",
+            [](migraphx::program& p, py::dict params, py::list outputs) {
+                auto pm = to_parameter_map(params);
+                std::vector<migraphx::argument> outs;
+                for(auto x : outputs)
+                {
+                    py::buffer b         = x.cast<py::buffer>();
+                    py::buffer_info info = b.request(true);
+                    outs.emplace_back(to_shape(info), info.ptr);
+                }
+                py::gil_scoped_release nogil;
+                auto results = p.eval(pm);
+                if(results.size() != outs.size())
+                    MIGRAPHX_THROW("MIGRAPHX PYTHON: Expected " + std::to_string(results.size()) +
+                                   " output buffers but got " + std::to_string(outs.size()));
+                for(std::size_t i = 0; i < results.size(); i++)
+                    copy_output(results[i], outs[i]);
+            },
+            py::arg("params"),
+            py::arg("outputs"))
+        .def(
+            "bind",
+            [](const migraphx::program& p, std::vector<std::string> names) {
+                return parameter_binding{p, std::move(names)};
+            },
+            py::arg("names") = std::vector<std::string>{},
+            py::keep_alive<0, 1>())
+        .def(
+            "perf_report_data",
+            [](const migraphx::program& p,
+               py::dict params,
+               std::size_t n,
+               std::size_t warmup,
+               double time_budget,
+               double ci_width,
+               double outlier_threshold) {
+                auto pm = to_parameter_map(params);
+                for(auto&& x : p.get_parameter_shapes())
+                {
+                    if(not migraphx::contains(pm, x.first))
+                        pm[x.first] = migraphx::generate_argument(x.second);
+                }
+                migraphx::perf_options options;
+                options.warmup            = warmup;
+                options.time_budget       = time_budget;
+                options.ci_width          = ci_width;
+                options.outlier_threshold = outlier_threshold;
+                migraphx::value v;
+                {
+                    py::gil_scoped_release nogil;
+                    v = p.perf_report_data(n, pm, options);
+                }
+                return py::module::import("json").attr("loads")(migraphx::to_json_string(v));
+            },
+            py::arg("params")            = py::dict{},
+            py::arg("n")                 = 100,
+            py::arg("warmup")            = 1,
+            py::arg("time_budget")       = 0.0,
+            py::arg("ci_width")          = 0.0,
+            py::arg("outlier_threshold") = 3.5)
+        .def(py::pickle(
+            [](const migraphx::program& p) {
+                auto buffer = migraphx::save_buffer(p);
+                return py::bytes(buffer.data(), buffer.size());
+            },
+            [](const py::bytes& b) {
+                std::string buffer = b;
+                return migraphx::load_buffer(buffer.data(), buffer.size());
+            }))
+        .def("memory_report",
+             [](const migraphx::program& p) {
+                 auto v = p.get_memory_report().to_value();
+                 return py::module::import("json").attr("loads")(migraphx::to_json_string(v));
+             })
+        .def("create_execution_context",
+             &migraphx::program::create_execution_context,
+             py::keep_alive<0, 1>())
+        .def(
+            "add_eval_hook",
+            [](migraphx::program& p,
+               const py::object& before,
+               const py::object& after,
+               bool outputs) {
+                // The program can be run and copied without the GIL, so it is taken back
+                // to call or release the python function
+                auto wrap = [](const py::object& f)
+                    -> std::function<void(const migraphx::instruction_info&)> {
+                    if(f.is_none())
+                        return nullptr;
+                    std::shared_ptr<py::object> pf(new py::object(f), [](py::object* x) {
+                        py::gil_scoped_acquire gil;
+                        delete x;
+                    });
+                    return [pf](const migraphx::instruction_info& info) {
+                        py::gil_scoped_acquire gil;
+                        (*pf)(info);
+                    };
+                };
+                migraphx::eval_hook h;
+                h.before  = wrap(before);
+                h.after   = wrap(after);
+                h.outputs = outputs;
+                p.add_eval_hook(h);
+            },
+            py::arg("before")  = py::none(),
+            py::arg("after")   = py::none(),
+            py::arg("outputs") = false)
+        .def("clear_eval_hooks", &migraphx::program::clear_eval_hooks)
         .def("sort", &migraphx::program::sort)
         .def("print", [](const migraphx::program& p) { std::cout << p << std::endl; })
         .def("__eq__", std::equal_to<migraphx::program>{})
@@ -382,6 +1075,50 @@ MIGRAPHX_PYBIND11_MODULE(migraphx, m)
           py::arg("filename"),
           py::arg("format") = "msgpack");
 
+    m.def("to_numpy",
+          [](const py::list& args, bool copy) {
+              py::list result;
+              for(auto&& x : args)
+                  result.append(to_numpy(py::reinterpret_borrow<py::object>(x), copy));
+              return result;
+          },
+          "Convert a list of arguments to numpy arrays",
+          py::arg("args"),
+          py::arg("copy") = false);
+
+    m.def("from_dlpack",
+          &from_dlpack,
+          "Create an argument that shares the memory of a DLPack tensor",
+          py::arg("x"));
+
+    m.def("load_buffer",
+          [](const py::buffer& b, const std::string& format) {
+              py::buffer_info info = b.request();
+              migraphx::file_options options;
+              options.format = format;
+              py::gil_scoped_release nogil;
+              return migraphx::load_buffer(
+                  static_cast<const char*>(info.ptr), info.size * info.itemsize, options);
+          },
+          "Load MIGraphX program from a buffer",
+          py::arg("buffer"),
+          py::arg("format") = "msgpack");
+
+    m.def("save_buffer",
+          [](const migraphx::program& p, const std::string& format) {
+              migraphx::file_options options;
+              options.format = format;
+              std::vector<char> buffer;
+              {
+                  py::gil_scoped_release nogil;
+                  buffer = migraphx::save_buffer(p, options);
+              }
+              return py::bytes(buffer.data(), buffer.size());
+          },
+          "Save MIGraphX program to bytes",
+          py::arg("p"),
+          py::arg("format") = "msgpack");
+
     m.def("get_target", &migraphx::make_target);
     m.def("generate_argument", &migraphx::generate_argument, py::arg("s"), py::arg("seed") = 0);
     m.def("quantize_fp16",
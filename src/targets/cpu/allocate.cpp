@@ -2,13 +2,49 @@
 #include <migraphx/check_shapes.hpp>
 #include <migraphx/argument.hpp>
 #include <migraphx/context.hpp>
+#include <migraphx/cpu/allocate.hpp>
 #include <migraphx/cpu/context.hpp>
 #include <migraphx/register_op.hpp>
+#include <atomic>
+#include <memory>
 
 namespace migraphx {
 inline namespace MIGRAPHX_INLINE_NS {
 namespace cpu {
 
+static std::atomic<std::size_t>& allocation_count()
+{
+    static std::atomic<std::size_t> n{0};
+    return n;
+}
+
+static std::atomic<std::size_t>& allocation_bytes()
+{
+    static std::atomic<std::size_t> n{0};
+    return n;
+}
+
+argument allocate_argument(const shape& s)
+{
+    auto bytes        = s.bytes();
+    std::size_t space = bytes + allocation_alignment - 1;
+    auto buffer       = make_shared_array<char>(space);
+    void* p           = buffer.get();
+    std::align(allocation_alignment, bytes, p, space);
+    auto* data = static_cast<char*>(p);
+    allocation_count()++;
+    allocation_bytes() += bytes;
+    return {s, [buffer, data] { return data; }};
+}
+
+allocation_counters get_allocation_counters()
+{
+    allocation_counters result;
+    result.allocations = allocation_count();
+    result.bytes       = allocation_bytes();
+    return result;
+}
+
 struct cpu_allocate : auto_register_op<cpu_allocate>
 {
     shape s;
@@ -26,10 +62,7 @@ struct cpu_allocate : auto_register_op<cpu_allocate>
         return s;
     }
     argument compute(context&, const shape& output_shape, const std::vector<argument>&) const
-    {
-        argument result{output_shape};
-        return result;
-    }
+    { return allocate_argument(output_shape); }
 };
 
 } // namespace cpu
@@ -1,4 +1,6 @@
 #include <migraphx/cpu/dnnl.hpp>
+#include <migraphx/cpu/context.hpp>
+#include <migraphx/context.hpp>
 
 namespace migraphx {
 inline namespace MIGRAPHX_INLINE_NS {
@@ -6,10 +8,20 @@ namespace cpu {
 
 dnnl_context& get_dnnl_context()
 {
-    static dnnl_context ctx{}; // NOLINT
+    static dnnl::engine engine{dnnl::engine::kind::cpu, 0}; // NOLINT
+    // Each thread uses its own stream so primitives can run concurrently
+    thread_local dnnl_context ctx{engine}; // NOLINT
     return ctx;
 }
 
+void dnnl_execute(migraphx::context& ctx,
+                  const dnnl::primitive& prim,
+                  const std::unordered_map<int, dnnl::memory>& m)
+{
+    any_cast<cpu::context>(ctx).intra_op_execute(
+        [&] { prim.execute(get_dnnl_context().stream, m); });
+}
+
 #ifdef __clang__
 #pragma clang diagnostic push
 #pragma clang diagnostic ignored "-Wswitch-enum"
@@ -0,0 +1,36 @@
+#ifndef MIGRAPHX_GUARD_AMDMIGRAPHX_CPU_ALLOCATE_HPP
+#define MIGRAPHX_GUARD_AMDMIGRAPHX_CPU_ALLOCATE_HPP
+
+#include <migraphx/config.hpp>
+#include <migraphx/argument.hpp>
+#include <cstddef>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+namespace cpu {
+
+// Alignment of the buffers allocated by the cpu target, which is enough for
+// avx512 loads and the dnnl primitives
+constexpr std::size_t allocation_alignment = 64;
+
+struct allocation_counters
+{
+    // Number of buffers allocated
+    std::size_t allocations = 0;
+    // Total bytes of the buffers allocated
+    std::size_t bytes = 0;
+};
+
+// Allocate an aligned buffer for the shape
+argument allocate_argument(const shape& s);
+
+// Counters of every buffer allocated by the cpu target since the process
+// started, which can be compared before and after an eval to check that the
+// scratch memory is reused
+allocation_counters get_allocation_counters();
+
+} // namespace cpu
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
+
+#endif
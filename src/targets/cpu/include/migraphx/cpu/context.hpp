@@ -5,19 +5,59 @@
 #include <migraphx/cpu/dnnl.hpp>
 #include <migraphx/cpu/parallel.hpp>
 #include <migraphx/par_for.hpp>
+#include <migraphx/env.hpp>
+#include <migraphx/value.hpp>
+#include <algorithm>
 
 namespace migraphx {
 inline namespace MIGRAPHX_INLINE_NS {
 namespace cpu {
 
+MIGRAPHX_DECLARE_ENV_VAR(MIGRAPHX_CPU_INTER_OP_THREADS)
+MIGRAPHX_DECLARE_ENV_VAR(MIGRAPHX_CPU_INTRA_OP_THREADS)
+
 struct context
 {
+    context(std::size_t inter = value_of(MIGRAPHX_CPU_INTER_OP_THREADS{}, 1),
+            std::size_t intra = value_of(MIGRAPHX_CPU_INTRA_OP_THREADS{}, 0))
+        : inter_op_threads(std::max<std::size_t>(inter, 1)), intra_op_threads(intra)
+    {
+    }
+
+    // Number of instructions that can run concurrently
+    std::size_t inter_op_threads = 1;
+    // Number of threads each instruction can use, 0 splits the threads
+    // evenly between the concurrent instructions
+    std::size_t intra_op_threads = 0;
+
+    std::size_t get_intra_op_threads() const
+    {
+        if(intra_op_threads > 0)
+            return intra_op_threads;
+        return std::max<std::size_t>(cpu::max_threads() / inter_op_threads, 1);
+    }
+
     void finish() const {}
 
+    // Copies only share the thread settings, so each copy can run a program
+    bool concurrent_copies() const { return true; }
+
+    // Run f with the threads used by the parallel regions it starts limited
+    // to the intra-op threads
+    template <class F>
+    void intra_op_execute(F f) const
+    {
+        if(inter_op_threads == 1 and intra_op_threads == 0)
+            f();
+        else
+            cpu::with_max_threads(get_intra_op_threads(), f);
+    }
+
     template <class F>
     void bulk_execute(std::size_t n, std::size_t min_grain, F f)
     {
-        cpu::parallel_for(n, min_grain, f);
+        const auto threadsize = std::min<std::size_t>(get_intra_op_threads(), n / min_grain);
+        cpu::parallel_for_impl(n, threadsize, f);
     }
 
     template <class F>
@@ -25,6 +65,23 @@ struct context
     {
         this->bulk_execute(n, 256, f);
     }
+
+    value to_value() const
+    {
+        value result;
+        result["inter_op_threads"] = inter_op_threads;
+        result["intra_op_threads"] = intra_op_threads;
+        return result;
+    }
+
+    void from_value(const value& v)
+    {
+        // Programs saved before the thread settings were added keep the defaults
+        if(v.contains("inter_op_threads"))
+            inter_op_threads = v.at("inter_op_threads").to<std::size_t>();
+        if(v.contains("intra_op_threads"))
+            intra_op_threads = v.at("intra_op_threads").to<std::size_t>();
+    }
 };
 
 } // namespace cpu
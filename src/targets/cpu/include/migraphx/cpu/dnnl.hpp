@@ -19,6 +19,7 @@ struct dnnl_context
     dnnl::engine engine;
     dnnl::stream stream;
     dnnl_context() : engine(dnnl::engine::kind::cpu, 0), stream(engine) {}
+    dnnl_context(const dnnl::engine& e) : engine(e), stream(engine) {}
 };
 
 dnnl_context& get_dnnl_context();
@@ -41,6 +42,11 @@ dnnl::memory to_dnnl_memory(const argument& a);
 
 dnnl::algorithm to_dnnl_algo(const std::string& name);
 
+// Execute the primitive with the intra-op threads of the cpu context
+void dnnl_execute(migraphx::context& ctx,
+                  const dnnl::primitive& prim,
+                  const std::unordered_map<int, dnnl::memory>& m);
+
 template <class Derived, class Primitive>
 struct dnnl_op : auto_register_op<Derived>
 {
@@ -128,7 +134,7 @@ struct dnnl_op : auto_register_op<Derived>
         auto md          = to_memory_desc(output_shape, inputs);
         auto prim        = get_primitive(md);
         auto arg_lookup  = self.arg_map(inputs.size());
-        execute          = [=](context&, const std::vector<argument>& args) {
+        execute          = [=](context& ctx, const std::vector<argument>& args) {
 #ifndef NDEBUG
             // Check that the memory descriptors have not changed
             auto debug_args = args;
@@ -149,7 +155,7 @@ struct dnnl_op : auto_register_op<Derived>
             m[DNNL_ARG_DST] = to_dnnl_memory(md.at(DNNL_ARG_DST), args.back());
             for(int i = 0; i < args.size() - 1; i++)
                 m[arg_lookup[i]] = to_dnnl_memory(md.at(arg_lookup[i]), args[i]);
-            prim.execute(get_dnnl_context().stream, m);
+            dnnl_execute(ctx, prim, m);
             return args.back();
         };
     }
@@ -4,6 +4,7 @@
 // #define MIGRAPHX_DISABLE_OMP
 
 #include <migraphx/config.hpp>
+#include <cmath>
 #ifdef MIGRAPHX_DISABLE_OMP
 #include <migraphx/par_for.hpp>
 #else
@@ -45,6 +46,10 @@ void parallel_for_impl(std::size_t n, std::size_t threadsize, F f)
         assert(work >= n);
     }
 }
+
+template <class F>
+void with_max_threads(std::size_t, F f)
+{ f(); }
 #else
 
 inline std::size_t max_threads() { return omp_get_max_threads(); }
@@ -67,6 +72,20 @@ void parallel_for_impl(std::size_t n, std::size_t threadsize, F f)
         }
     }
 }
+
+// Limit the threads of the parallel regions started by f on this thread to n
+template <class F>
+void with_max_threads(std::size_t n, F f)
+{
+    struct restore_threads
+    {
+        int threads;
+        ~restore_threads() { omp_set_num_threads(threads); }
+    };
+    restore_threads r{omp_get_max_threads()};
+    omp_set_num_threads(n);
+    f();
+}
 #endif
 template <class F>
 void parallel_for(std::size_t n, std::size_t min_grain, F f)
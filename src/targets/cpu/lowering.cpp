@@ -62,11 +62,16 @@ struct cpu_im2col
     }
 
     static std::string name() { return "cpu::im2col"; }
-    shape compute_shape(const std::vector<shape>& inputs) const { return op.compute_shape(inputs); }
+    shape compute_shape(std::vector<shape> inputs) const
+    {
+        // Compensate for allocation
+        inputs.pop_back();
+        return op.compute_shape(inputs);
+    }
 
-    argument compute(context&, const shape& output_shape, std::vector<argument> args) const
+    argument compute(context&, const shape&, std::vector<argument> args) const
     {
-        argument result{output_shape};
+        argument result    = args.back();
         auto input_shape   = args[0].get_shape();
         auto weights_shape = args[1].get_shape();
         visit_all(result, args[0])([&](auto col, auto input) {
@@ -111,6 +116,9 @@ struct cpu_im2col
         });
         return result;
     }
+
+    std::ptrdiff_t output_alias(const std::vector<shape>& shapes) const
+    { return shapes.size() - 1; }
 };
 MIGRAPHX_REGISTER_OP(cpu_im2col)
 
@@ -158,11 +166,16 @@ struct cpu_pad
     }
 
     std::string name() const { return "cpu::pad"; }
-    shape compute_shape(const std::vector<shape>& inputs) const { return op.compute_shape(inputs); }
+    shape compute_shape(std::vector<shape> inputs) const
+    {
+        // Compensate for allocation
+        inputs.pop_back();
+        return op.compute_shape(inputs);
+    }
     argument compute(context&, const shape& output_shape, std::vector<argument> args) const
     {
         assert(output_shape.standard());
-        argument result{output_shape};
+        argument result = args.back();
         result.visit([&](auto output) {
             using type = typename decltype(output)::value_type;
             std::fill(output.begin(), output.end(), pad_clamp<type>(op.value));
@@ -181,6 +194,9 @@ struct cpu_pad
 
         return result;
     }
+
+    std::ptrdiff_t output_alias(const std::vector<shape>& shapes) const
+    { return shapes.size() - 1; }
 };
 MIGRAPHX_REGISTER_OP(cpu_pad)
 
@@ -215,14 +231,14 @@ struct cpu_unary2 : auto_register_op<cpu_unary2<Op>>
     std::string name() const { return op.name(); }
     shape compute_shape(const std::vector<shape>& inputs) const
     {
-        check_shapes{inputs, *this}.has(1);
+        check_shapes{inputs, *this}.has(2);
         auto s = inputs.at(0);
         return {s.type(), s.lens()};
     }
 
-    argument compute(context&, const shape& output_shape, std::vector<argument> args) const
+    argument compute(context&, const shape&, std::vector<argument> args) const
     {
-        argument result{output_shape};
+        argument result = args.back();
         visit_all(result, args[0])([&](auto output, auto input) {
             assert(input.get_shape().standard());
             std::transform(input.begin(), input.end(), output.begin(), op.fcn());
@@ -230,6 +246,9 @@ struct cpu_unary2 : auto_register_op<cpu_unary2<Op>>
 
         return result;
     }
+
+    std::ptrdiff_t output_alias(const std::vector<shape>& shapes) const
+    { return shapes.size() - 1; }
 };
 template struct cpu_unary2<leaky_relu_op>;
 
@@ -247,12 +266,14 @@ struct cpu_rnn_var_sl_last_output
 
     shape compute_shape(std::vector<shape> inputs) const
     {
+        // Compensate for allocation
+        inputs.pop_back();
         return op.compute_shape(std::move(inputs));
     }
 
     argument compute(const shape& output_shape, std::vector<argument> args) const
     {
-        argument result{output_shape};
+        argument result    = args.back();
         auto out_comp_lens = args[0].get_shape().lens();
         out_comp_lens[0]   = 1;
         shape out_comp_s{output_shape.type(), out_comp_lens};
@@ -277,6 +298,9 @@ struct cpu_rnn_var_sl_last_output
 
         return result;
     }
+
+    std::ptrdiff_t output_alias(const std::vector<shape>& shapes) const
+    { return shapes.size() - 1; }
 };
 MIGRAPHX_REGISTER_OP(cpu_rnn_var_sl_last_output)
 
@@ -379,10 +403,10 @@ struct cpu_apply
         extend_op("softmax", "dnnl::softmax");
         extend_op("sub", "cpu::sub");
 
-        extend_op("im2col", "cpu::im2col", false);
-        extend_op("leaky_relu", "cpu::leaky_relu", false);
-        extend_op("pad", "cpu::pad", false);
-        extend_op("rnn_var_sl_last_output", "cpu::rnn_var_sl_last_output", false);
+        extend_op("im2col", "cpu::im2col");
+        extend_op("leaky_relu", "cpu::leaky_relu");
+        extend_op("pad", "cpu::pad");
+        extend_op("rnn_var_sl_last_output", "cpu::rnn_var_sl_last_output");
     }
 
     void apply()
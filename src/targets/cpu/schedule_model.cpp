@@ -0,0 +1,83 @@
+#include <migraphx/cpu/schedule_model.hpp>
+#include <migraphx/cpu/context.hpp>
+#include <migraphx/register_op.hpp>
+#include <migraphx/module.hpp>
+#include <migraphx/instruction.hpp>
+#include <migraphx/operation.hpp>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+namespace cpu {
+
+// Instructions after this run on the thread of the stream, until the next
+// set_stream. The stream attribute is used by the eval plan to assign the
+// instructions to its lanes.
+struct set_stream
+{
+    std::size_t stream = 0;
+    template <class Self, class F>
+    static auto reflect(Self& self, F f)
+    { return pack(f(self.stream, "stream")); }
+    std::string name() const { return "cpu::set_stream"; }
+    value attributes() const { return {{"stream", stream}}; }
+    shape compute_shape(const std::vector<shape>&) const { return {}; }
+
+    argument compute(context&, const shape&, const std::vector<argument>&) const { return {}; }
+};
+
+MIGRAPHX_REGISTER_OP(set_stream)
+
+std::size_t schedule_model::concurrency() const { return threads; }
+void schedule_model::sched(module& p, instruction_ref ins, std::size_t n) const
+{
+    auto last_stream = std::find_if(std::make_reverse_iterator(ins),
+                                    std::make_reverse_iterator(p.begin()),
+                                    [&](auto&& i) { return i.name() == "cpu::set_stream"; });
+    if(last_stream != std::make_reverse_iterator(p.begin()))
+    {
+        auto&& op = any_cast<set_stream>(last_stream->get_operator());
+        // If the same stream was set earlier then skip
+        if(op.stream == n)
+            return;
+    }
+    else if(n == 0)
+    {
+        // Instructions start on the first stream
+        return;
+    }
+    p.insert_instruction(ins, set_stream{n});
+}
+
+// The executor waits for the inputs from other streams before running an
+// instruction, so no events are needed
+void schedule_model::wait(module&, instruction_ref, std::size_t) const {}
+void schedule_model::record(module&, instruction_ref, std::size_t) const {}
+
+static std::unordered_map<std::string, std::size_t> create_weight_map()
+{
+    return {{"cpu::allocate", 0},
+            {"cpu::literal", 0},
+            {"dnnl::convolution", 8},
+            {"dnnl::deconvolution", 8},
+            {"dnnl::pooling", 4},
+            {"dnnl::dot", 4}};
+}
+
+static const std::unordered_map<std::string, std::size_t>& weight_map()
+{
+    static const std::unordered_map<std::string, std::size_t> m = create_weight_map();
+    return m;
+}
+
+std::size_t schedule_model::weight(const operation& op) const
+{
+    if(weight_map().count(op.name()) == 0)
+    {
+        return 2;
+    }
+    return weight_map().at(op.name());
+}
+
+} // namespace cpu
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
@@ -23,12 +23,16 @@
 #include <migraphx/simplify_algebra.hpp>
 #include <migraphx/simplify_reshapes.hpp>
 #include <migraphx/cpu/write_literals.hpp>
+#include <migraphx/cpu/allocate.hpp>
 #include <migraphx/cpu/allocation_model.hpp>
+#include <migraphx/cpu/context.hpp>
+#include <migraphx/cpu/schedule_model.hpp>
 #include <migraphx/cpu/target.hpp>
 #include <migraphx/cpu/lowering.hpp>
 #include <migraphx/pass.hpp>
 #include <migraphx/generate.hpp>
 #include <migraphx/normalize_ops.hpp>
+#include <algorithm>
 
 namespace migraphx {
 inline namespace MIGRAPHX_INLINE_NS {
@@ -36,8 +40,9 @@ namespace cpu {
 
 std::string target::name() const { return "cpu"; }
 
-std::vector<pass> target::get_passes(migraphx::context&, const compile_options&) const
+std::vector<pass> target::get_passes(migraphx::context& gctx, const compile_options&) const
 {
+    auto& ctx = any_cast<context>(gctx);
     std::set<shape::type_t> unsupported_types(shape::types().begin(), shape::types().end());
     unsupported_types.erase(shape::type_t::float_type);
     return {normalize_ops{},
@@ -69,11 +74,17 @@ std::vector<pass> target::get_passes(migraphx::context&, const compile_options&)
             dead_code_elimination{},
             write_literals{},
             dead_code_elimination{},
-            memory_coloring{"cpu::allocate"},
+            schedule{cpu::schedule_model{ctx.inter_op_threads}, ctx.inter_op_threads > 1},
+            memory_coloring{"cpu::allocate", false, allocation_alignment},
             dead_code_elimination{}};
 }
 
-argument target::allocate(const shape& s) const { return fill_argument(s, 0); }
+argument target::allocate(const shape& s) const
+{
+    auto result = allocate_argument(s);
+    std::fill_n(result.data(), s.bytes(), 0);
+    return result;
+}
 
 MIGRAPHX_REGISTER_TARGET(target);
 
@@ -132,6 +132,20 @@ argument from_gpu(const argument& arg)
     return result;
 }
 
+int get_memory_device(const void* ptr)
+{
+    hipPointerAttribute_t attr;
+    if(hipPointerGetAttributes(&attr, ptr) != hipSuccess)
+    {
+        // The memory was not allocated by hip, so clear the error
+        (void)hipGetLastError();
+        return -1;
+    }
+    if(attr.memoryType != hipMemoryTypeDevice)
+        return -1;
+    return attr.device;
+}
+
 void set_device(std::size_t id)
 {
     auto status = hipSetDevice(id);
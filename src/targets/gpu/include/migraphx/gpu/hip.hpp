@@ -24,6 +24,9 @@ argument from_gpu(const argument& arg);
 
 void set_device(std::size_t id);
 
+// The device that owns the memory, or -1 for memory on the host
+int get_memory_device(const void* ptr);
+
 void gpu_sync();
 
 void gpu_copy(context& ctx, const argument& src, const argument& dst);
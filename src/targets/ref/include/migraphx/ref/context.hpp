@@ -10,6 +10,7 @@ namespace ref {
 struct context
 {
     void finish() const {}
+    bool concurrent_copies() const { return true; }
 };
 
 } // namespace ref
@@ -1,5 +1,5 @@
-#ifndef MIGRAPHX_GUARD_MIGRAPHLIB_CPU_TARGET_HPP
-#define MIGRAPHX_GUARD_MIGRAPHLIB_CPU_TARGET_HPP
+#ifndef MIGRAPHX_GUARD_MIGRAPHLIB_REF_TARGET_HPP
+#define MIGRAPHX_GUARD_MIGRAPHLIB_REF_TARGET_HPP
 
 #include <migraphx/program.hpp>
 #include <migraphx/register_target.hpp>
@@ -0,0 +1,76 @@
+#include <migraphx/trace_file.hpp>
+#include <migraphx/env.hpp>
+#include <migraphx/errors.hpp>
+#include <migraphx/json.hpp>
+#include <atomic>
+#include <memory>
+#include <unistd.h>
+
+namespace migraphx {
+inline namespace MIGRAPHX_INLINE_NS {
+
+MIGRAPHX_DECLARE_ENV_VAR(MIGRAPHX_TRACE_FILE)
+
+trace_file::trace_file(const std::string& filename)
+    : os(filename), epoch(std::chrono::steady_clock::now()), pid(getpid())
+{
+    if(not os)
+        MIGRAPHX_THROW("Failed to open trace file: " + filename);
+    // The closing bracket is optional in the trace event format, so the file
+    // is valid after every write even if the process is terminated
+    os << "[" << std::endl;
+}
+
+void trace_file::write(const std::vector<trace_event>& events)
+{
+    using microseconds = std::chrono::duration<double, std::micro>;
+    std::lock_guard<std::mutex> lock(m);
+    for(auto&& event : events)
+    {
+        value v   = value::object{};
+        v["name"] = event.name;
+        v["cat"]  = event.category;
+        v["ph"]   = "X";
+        v["ts"]   = std::chrono::duration_cast<microseconds>(event.start - epoch).count();
+        v["dur"]  = std::chrono::duration_cast<microseconds>(event.finish - event.start).count();
+        v["pid"]  = pid;
+        v["tid"]  = event.tid;
+        v["args"] = event.args;
+        os << to_json_string(v) << "," << std::endl;
+    }
+    os.flush();
+}
+
+trace_file::~trace_file() { os << "{}]" << std::endl; }
+
+static std::unique_ptr<trace_file>& trace_file_ptr()
+{
+    static std::unique_ptr<trace_file> ptr = [] {
+        auto filename = string_value_of(MIGRAPHX_TRACE_FILE{});
+        if(filename.empty())
+            return std::unique_ptr<trace_file>{};
+        return std::make_unique<trace_file>(filename);
+    }();
+    return ptr;
+}
+
+void set_trace_file(const std::string& filename)
+{
+    auto& ptr = trace_file_ptr();
+    if(filename.empty())
+        ptr = nullptr;
+    else
+        ptr = std::make_unique<trace_file>(filename);
+}
+
+trace_file* get_trace_file() { return trace_file_ptr().get(); }
+
+std::size_t get_thread_trace_id()
+{
+    static std::atomic<std::size_t> next{0};
+    thread_local const std::size_t id = next++;
+    return id;
+}
+
+} // namespace MIGRAPHX_INLINE_NS
+} // namespace migraphx
@@ -163,4 +163,88 @@ TEST_CASE(get_main_module)
     p.print();
 }
 
+TEST_CASE(memory_report)
+{
+    auto p = migraphx::parse_onnx("conv_relu_maxpool_test.onnx");
+    p.compile(migraphx::target("ref"));
+    auto report        = p.get_memory_report();
+    size_t param_bytes = 0;
+    auto param_shapes  = p.get_parameter_shapes();
+    for(auto&& name : param_shapes.names())
+        param_bytes += param_shapes[name].bytes();
+    EXPECT(report.parameter_bytes() == param_bytes);
+    EXPECT(report.output_bytes() == p.get_output_shapes().front().bytes());
+    EXPECT(report.peak_bytes() >= report.output_bytes());
+    EXPECT(report.scratch_bytes() == 0);
+}
+
+TEST_CASE(execution_context)
+{
+    auto p = migraphx::parse_onnx("conv_relu_maxpool_test.onnx");
+    p.compile(migraphx::target("ref"));
+    migraphx::program_parameters pp;
+    auto param_shapes = p.get_parameter_shapes();
+    auto names        = param_shapes.names();
+    for(auto&& name : names)
+        pp.add(name, migraphx::argument::generate(param_shapes[name]));
+    auto expected = p.eval(pp);
+
+    auto ctx1 = p.create_execution_context();
+    auto ctx2 = p.create_execution_context();
+    auto out1 = ctx1.eval(pp);
+    // Bind all but the first parameter, so only one needs to be passed for each run
+    migraphx::program_parameters first;
+    for(auto&& name : names)
+    {
+        auto arg = migraphx::argument::generate(param_shapes[name]);
+        if(name == names.front())
+            first.add(name, arg);
+        else
+            ctx2.bind(name, arg);
+    }
+    auto out2 = ctx2.eval(first);
+    EXPECT(bool{out1.front() == expected.front()});
+    EXPECT(bool{out2.front() == expected.front()});
+}
+
+struct hook_data
+{
+    std::vector<std::string> names;
+    std::size_t results = 0;
+};
+
+void record_name(const migraphx_instruction_info* p, void* data)
+{
+    migraphx::instruction_info info{p};
+    static_cast<hook_data*>(data)->names.push_back(info.name());
+}
+
+void record_result(const migraphx_instruction_info* p, void* data)
+{
+    migraphx::instruction_info info{p};
+    if(info.has_result() and info.result().get_shape() == info.output_shape())
+        static_cast<hook_data*>(data)->results++;
+}
+
+TEST_CASE(eval_hook)
+{
+    auto p = migraphx::parse_onnx("conv_relu_maxpool_test.onnx");
+    p.compile(migraphx::target("ref"));
+    migraphx::program_parameters pp;
+    auto param_shapes = p.get_parameter_shapes();
+    for(auto&& name : param_shapes.names())
+        pp.add(name, migraphx::argument::generate(param_shapes[name]));
+
+    hook_data data;
+    p.add_eval_hook(&record_name, &record_result, &data, true);
+    p.eval(pp);
+    EXPECT(not data.names.empty());
+    EXPECT(data.results == data.names.size());
+
+    p.clear_eval_hooks();
+    auto n = data.names.size();
+    p.eval(pp);
+    EXPECT(data.names.size() == n);
+}
+
 int main(int argc, const char* argv[]) { test::run(argc, argv); }
@@ -0,0 +1,79 @@
+#include <migraphx/cpu/allocate.hpp>
+#include <migraphx/cpu/target.hpp>
+#include <migraphx/execution_context.hpp>
+#include <migraphx/generate.hpp>
+#include <migraphx/instruction.hpp>
+#include <migraphx/make_op.hpp>
+#include <migraphx/program.hpp>
+#include <migraphx/ref/target.hpp>
+#include <algorithm>
+#include <cstdint>
+#include <test.hpp>
+
+migraphx::program create_program()
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+    migraphx::shape s{migraphx::shape::float_type, {2, 3, 4, 4}};
+    auto x    = mm->add_parameter("x", s);
+    auto relu = mm->add_instruction(migraphx::make_op("leaky_relu", {{"alpha", 0.1}}), x);
+    auto pad =
+        mm->add_instruction(migraphx::make_op("pad", {{"pads", {0, 0, 1, 1, 0, 0, 1, 1}}}), relu);
+    mm->add_instruction(migraphx::make_op("leaky_relu", {{"alpha", 0.2}}), pad);
+    return p;
+}
+
+bool is_aligned(const migraphx::argument& a)
+{ return reinterpret_cast<std::uintptr_t>(a.data()) % migraphx::cpu::allocation_alignment == 0; }
+
+TEST_CASE(allocate_aligned)
+{
+    for(std::size_t n : {1, 3, 17, 1024})
+    {
+        auto before = migraphx::cpu::get_allocation_counters();
+        migraphx::shape s{migraphx::shape::int8_type, {n}};
+        auto a     = migraphx::cpu::allocate_argument(s);
+        auto after = migraphx::cpu::get_allocation_counters();
+        EXPECT(is_aligned(a));
+        EXPECT(after.allocations == before.allocations + 1);
+        EXPECT(after.bytes == before.bytes + n);
+    }
+}
+
+TEST_CASE(scratch_reused)
+{
+    auto p = create_program();
+    p.compile(migraphx::cpu::target{});
+    auto ctx = p.create_execution_context();
+    EXPECT(is_aligned(ctx.get_bindings().at("scratch")));
+    // Every buffer placed in the scratch memory is aligned as well
+    const auto* mm = p.get_main_module();
+    EXPECT(
+        std::any_of(mm->begin(), mm->end(), [](const auto& ins) { return ins.name() == "load"; }));
+    EXPECT(std::all_of(mm->begin(), mm->end(), [](const auto& ins) {
+        if(ins.name() != "load")
+            return true;
+        auto offset = ins.get_operator().to_value().at("offset").template to<std::size_t>();
+        return offset % migraphx::cpu::allocation_alignment == 0;
+    }));
+
+    auto x = migraphx::generate_argument(p.get_parameter_shape("x"));
+    migraphx::cpu::target t;
+    ctx.bind("output", t.allocate(p.get_parameter_shape("output")));
+    auto result = ctx.eval({{"x", x}}).back();
+
+    auto expected_p = create_program();
+    expected_p.compile(migraphx::ref::target{});
+    auto expected = expected_p.eval({{"x", x}}).back();
+    EXPECT(result == expected);
+
+    // The intermediate results are loaded from the scratch memory of the context
+    auto before = migraphx::cpu::get_allocation_counters();
+    for(int i = 0; i < 3; i++)
+        ctx.eval({{"x", x}});
+    auto after = migraphx::cpu::get_allocation_counters();
+    EXPECT(after.allocations == before.allocations);
+    EXPECT(after.bytes == before.bytes);
+}
+
+int main(int argc, const char* argv[]) { test::run(argc, argv); }
@@ -0,0 +1,92 @@
+#include <migraphx/cpu/target.hpp>
+#include <migraphx/execution_context.hpp>
+#include <migraphx/generate.hpp>
+#include <migraphx/make_op.hpp>
+#include <migraphx/program.hpp>
+#include <migraphx/ref/target.hpp>
+#include <algorithm>
+#include <iterator>
+#include <thread>
+#include <test.hpp>
+
+migraphx::program create_program()
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+    migraphx::shape s{migraphx::shape::float_type, {2, 3, 4, 4}};
+    auto x    = mm->add_parameter("x", s);
+    auto y    = mm->add_parameter("y", s);
+    auto add  = mm->add_instruction(migraphx::make_op("add"), x, y);
+    auto relu = mm->add_instruction(migraphx::make_op("leaky_relu", {{"alpha", 0.1}}), add);
+    auto pad =
+        mm->add_instruction(migraphx::make_op("pad", {{"pads", {0, 0, 1, 1, 0, 0, 1, 1}}}), relu);
+    mm->add_instruction(migraphx::make_op("leaky_relu", {{"alpha", 0.2}}), pad);
+    return p;
+}
+
+TEST_CASE(uncompiled)
+{
+    auto p = create_program();
+    EXPECT(test::throws([&] { p.create_execution_context(); }));
+}
+
+TEST_CASE(own_scratch)
+{
+    auto p = create_program();
+    p.compile(migraphx::cpu::target{});
+    auto ctx1 = p.create_execution_context();
+    auto ctx2 = p.create_execution_context();
+    EXPECT(ctx1.get_bindings().at("scratch").get_shape() == p.get_parameter_shape("scratch"));
+    EXPECT(ctx1.get_bindings().at("scratch").data() != ctx2.get_bindings().at("scratch").data());
+}
+
+TEST_CASE(concurrent_eval)
+{
+    const std::size_t n = 4;
+    auto p              = create_program();
+    p.compile(migraphx::cpu::target{});
+    auto expected_p = create_program();
+    expected_p.compile(migraphx::ref::target{});
+
+    // Every parameter is passed to each context, including one scratch buffer
+    // shared by all of them which the contexts must not use
+    auto shapes  = p.get_parameter_shapes();
+    auto scratch = migraphx::generate_argument(shapes.at("scratch"));
+    std::vector<migraphx::parameter_map> params(n);
+    std::vector<migraphx::argument> expected(n);
+    for(std::size_t i = 0; i < n; i++)
+    {
+        for(auto&& x : shapes)
+            params[i][x.first] = migraphx::generate_argument(x.second, i);
+        params[i]["scratch"] = scratch;
+        expected[i] = expected_p.eval({{"x", params[i]["x"]}, {"y", params[i]["y"]}}).back();
+    }
+
+    std::vector<migraphx::execution_context> ctxs;
+    std::generate_n(std::back_inserter(ctxs), n, [&] { return p.create_execution_context(); });
+    std::vector<std::size_t> failures(n, 0);
+    std::vector<std::thread> threads;
+    for(std::size_t i = 0; i < n; i++)
+    {
+        threads.emplace_back([&, i] {
+            for(int j = 0; j < 20; j++)
+            {
+                if(ctxs[i].eval(params[i]).back() != expected[i])
+                    failures[i]++;
+            }
+        });
+    }
+    for(auto&& t : threads)
+        t.join();
+    EXPECT(std::all_of(failures.begin(), failures.end(), [](auto f) { return f == 0; }));
+
+    // Bound parameters are overridden by the parameters passed to eval
+    auto ctx = p.create_execution_context();
+    ctx.bind("x", params[1]["x"]);
+    ctx.bind("y", params[1]["y"]);
+    ctx.bind("output", params[1]["output"]);
+    EXPECT(ctx.eval().back() == expected[1]);
+    EXPECT(ctx.eval({{"x", params[0]["x"]}, {"y", params[0]["y"]}}).back() == expected[0]);
+}
+
+int main(int argc, const char* argv[]) { test::run(argc, argv); }
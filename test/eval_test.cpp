@@ -1,6 +1,7 @@
 
 #include <migraphx/program.hpp>
 #include <migraphx/iterator_for.hpp>
+#include <migraphx/eval_plan.hpp>
 #include <migraphx/instruction.hpp>
 #include <migraphx/stringutils.hpp>
 #include <migraphx/compile_options.hpp>
@@ -424,6 +425,156 @@ TEST_CASE(reverse_target_test)
     EXPECT(test::throws<migraphx::exception>([&] { p.compile(reverse_target{}); }));
 }
 
+TEST_CASE(eval_plan_test)
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+    auto x   = mm->add_parameter("x", {migraphx::shape::int32_type});
+    auto one = mm->add_literal(1);
+    auto sum = mm->add_instruction(sum_op{}, x, one);
+    mm->add_instruction(sum_op{}, sum, one);
+    EXPECT(mm->get_eval_plan() == nullptr);
+    p.compile(id_target{});
+    const auto* plan = mm->get_eval_plan();
+    EXPECT(plan != nullptr);
+    EXPECT(plan->steps.size() == mm->size());
+    EXPECT(plan->outputs == std::vector<std::size_t>{3});
+    auto result = p.eval({{"x", migraphx::literal{2}.get_argument()}}).back();
+    EXPECT(result == migraphx::literal{4});
+
+    // Changing the module discards the plan
+    mm->add_instruction(sum_op{}, std::prev(mm->end()), x);
+    EXPECT(mm->get_eval_plan() == nullptr);
+    result = p.eval({{"x", migraphx::literal{2}.get_argument()}}).back();
+    EXPECT(result == migraphx::literal{6});
+}
+
+TEST_CASE(eval_plan_copy_test)
+{
+    migraphx::program p1;
+    auto* mm1 = p1.get_main_module();
+    auto one  = mm1->add_literal(1);
+    auto two  = mm1->add_literal(2);
+    auto sum  = mm1->add_instruction(sum_op{}, one, two);
+    mm1->add_return({sum, two});
+    p1.compile(id_target{});
+    auto p2        = p1;
+    const auto* mm = p2.get_main_module();
+    EXPECT(mm->get_eval_plan() != nullptr);
+    EXPECT(mm->get_eval_plan() != p1.get_main_module()->get_eval_plan());
+    auto results = p2.eval({});
+    EXPECT(results.size() == 2);
+    EXPECT(results[0] == migraphx::literal{3});
+    EXPECT(results[1] == migraphx::literal{2});
+}
+
+struct lane_op
+{
+    std::size_t stream = 0;
+    template <class Self, class F>
+    static auto reflect(Self& self, F f)
+    { return migraphx::pack(f(self.stream, "stream")); }
+    std::string name() const { return "lane"; }
+    migraphx::value attributes() const { return {{"stream", stream}}; }
+    migraphx::argument compute(const migraphx::shape&, const std::vector<migraphx::argument>&) const
+    { return {}; }
+    migraphx::shape compute_shape(const std::vector<migraphx::shape>&) const { return {}; }
+};
+
+struct throw_op
+{
+    std::string name() const { return "throw"; }
+    migraphx::argument compute(const migraphx::shape&, const std::vector<migraphx::argument>&) const
+    { MIGRAPHX_THROW("throw_op"); }
+    migraphx::shape compute_shape(std::vector<migraphx::shape> inputs) const
+    { return inputs.front(); }
+};
+
+TEST_CASE(eval_plan_lanes_test)
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+    auto one = mm->add_literal(1);
+    auto two = mm->add_literal(2);
+    mm->add_instruction(lane_op{1});
+    auto a = mm->add_instruction(sum_op{}, one, two);
+    mm->add_instruction(lane_op{0});
+    auto b = mm->add_instruction(sum_op{}, two, two);
+    mm->add_instruction(sum_op{}, a, b);
+    p.compile(id_target{});
+    const auto* plan = mm->get_eval_plan();
+    EXPECT(plan != nullptr);
+    EXPECT(plan->lanes.size() == 2);
+    EXPECT(plan->steps.back().lane == 0);
+    EXPECT(plan->steps.back().waits == 1);
+    for(int i = 0; i < 10; i++)
+    {
+        auto result = p.eval({}).back();
+        EXPECT(result == migraphx::literal{7});
+    }
+}
+
+TEST_CASE(eval_plan_lanes_throw_test)
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+    auto one = mm->add_literal(1);
+    mm->add_instruction(lane_op{1});
+    auto a = mm->add_instruction(throw_op{}, one);
+    mm->add_instruction(lane_op{0});
+    auto b = mm->add_instruction(sum_op{}, one, one);
+    mm->add_instruction(sum_op{}, a, b);
+    p.compile(id_target{});
+    EXPECT(test::throws<migraphx::exception>([&] { p.eval({}); }, "throw_op"));
+}
+
+TEST_CASE(eval_hook_test)
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+    auto x   = mm->add_parameter("x", {migraphx::shape::int32_type});
+    auto one = mm->add_literal(1);
+    auto sum = mm->add_instruction(sum_op{}, x, one);
+    mm->add_instruction(sum_op{}, sum, one);
+    p.compile(id_target{});
+
+    std::vector<std::string> before;
+    std::vector<migraphx::argument> results;
+    migraphx::eval_hook h;
+    h.before = [&](const migraphx::instruction_info& info) {
+        EXPECT(info.input_shapes.size() == 2);
+        EXPECT(info.output_shape == migraphx::shape{migraphx::shape::int32_type});
+        EXPECT(info.time == 0);
+        before.push_back(info.name);
+    };
+    h.after = [&](const migraphx::instruction_info& info) {
+        EXPECT(info.time >= 0);
+        results.push_back(info.result);
+    };
+    h.outputs = true;
+    p.add_eval_hook(h);
+    // The results are not passed to hooks that dont ask for them
+    std::size_t empty_results = 0;
+    migraphx::eval_hook h2;
+    h2.after = [&](const migraphx::instruction_info& info) {
+        if(info.result.empty())
+            empty_results++;
+    };
+    p.add_eval_hook(h2);
+
+    auto result = p.eval({{"x", migraphx::literal{2}.get_argument()}}).back();
+    EXPECT(result == migraphx::literal{4});
+    EXPECT(before == std::vector<std::string>{"sum", "sum"});
+    EXPECT(results.size() == 2);
+    EXPECT(results.front() == migraphx::literal{3});
+    EXPECT(results.back() == migraphx::literal{4});
+    EXPECT(empty_results == 2);
+
+    p.clear_eval_hooks();
+    p.eval({{"x", migraphx::literal{2}.get_argument()}});
+    EXPECT(before.size() == 2);
+}
+
 // Check that the program doesnt modify the context directly, and only the operators modify the
 // context
 TEST_CASE(eval_context1)
@@ -649,4 +649,25 @@ TEST_CASE(literal_test)
     CHECK(lit == result);
 }
 
+TEST_CASE(alignment)
+{
+    migraphx::module m;
+
+    auto a1 = add_alloc(m, {migraphx::shape::int8_type, {3}});
+    auto m1 = m.add_instruction(pass_op{}, a1);
+    auto a2 = add_alloc(m, {migraphx::shape::int8_type, {5}});
+    auto m2 = m.add_instruction(pass_op{}, a2, m1);
+    auto a3 = add_alloc(m, {migraphx::shape::float_type, {7}});
+    m.add_instruction(pass_op{}, a3, m2, m1);
+    migraphx::run_passes(m, {migraphx::memory_coloring{"allocate", true, 64}});
+    CHECK(no_allocate(m));
+    // The three allocations are live at the same time so each one needs its own 64 bytes
+    CHECK(m.get_parameter_shape("scratch").bytes() > 128);
+    CHECK(std::all_of(m.begin(), m.end(), [](const migraphx::instruction& ins) {
+        if(ins.name() != "load")
+            return true;
+        return ins.get_operator().to_value().at("offset").to<std::size_t>() % 64 == 0;
+    }));
+}
+
 int main(int argc, const char* argv[]) { test::run(argc, argv); }
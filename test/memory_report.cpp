@@ -0,0 +1,46 @@
+#include <migraphx/memory_report.hpp>
+#include <migraphx/program.hpp>
+#include <migraphx/ref/target.hpp>
+#include <migraphx/make_op.hpp>
+
+#include "test.hpp"
+
+TEST_CASE(memory_report_ref)
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+    migraphx::shape s{migraphx::shape::float_type, {4, 4}};
+    auto x   = mm->add_parameter("x", s);
+    auto one = mm->add_literal(migraphx::literal{s, std::vector<float>(16, 1)});
+    auto a   = mm->add_instruction(migraphx::make_op("add"), x, one);
+    auto b   = mm->add_instruction(migraphx::make_op("mul"), a, one);
+    mm->add_instruction(migraphx::make_op("relu"), b);
+    p.compile(migraphx::ref::target{});
+
+    auto report = p.get_memory_report();
+    EXPECT(report.total.literal_bytes == s.bytes());
+    EXPECT(report.total.parameter_bytes == s.bytes());
+    EXPECT(report.total.output_bytes == s.bytes());
+    EXPECT(report.total.scratch_bytes == 0);
+    // Each result is only needed by the next instruction
+    EXPECT(report.total.peak_bytes == 2 * s.bytes());
+    EXPECT(report.modules.count("main") == 1);
+
+    auto v = report.to_value();
+    EXPECT(v.at("op_bytes").size() == 3);
+    EXPECT(v.at("modules").contains("main"));
+}
+
+TEST_CASE(memory_report_scratch)
+{
+    migraphx::module m;
+    migraphx::shape s{migraphx::shape::float_type, {8}};
+    m.add_parameter("scratch", migraphx::shape{migraphx::shape::int8_type, {64}});
+    m.add_parameter("x", s);
+    auto usage = migraphx::get_memory_usage(m);
+    EXPECT(usage.scratch_bytes == 64);
+    EXPECT(usage.parameter_bytes == s.bytes());
+    EXPECT(usage.peak_bytes == 64);
+}
+
+int main(int argc, const char* argv[]) { test::run(argc, argv); }
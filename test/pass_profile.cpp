@@ -0,0 +1,52 @@
+#include <migraphx/dead_code_elimination.hpp>
+#include <migraphx/pass_manager.hpp>
+#include <migraphx/pass_profile.hpp>
+#include <migraphx/program.hpp>
+#include <migraphx/ref/target.hpp>
+#include <migraphx/make_op.hpp>
+
+#include <test.hpp>
+
+TEST_CASE(pass_profile_entries)
+{
+    migraphx::module m;
+    m.add_literal(3);
+    auto one = m.add_literal(1);
+    auto two = m.add_literal(2);
+    m.add_instruction(migraphx::make_op("add"), one, two);
+    auto count = m.size();
+
+    migraphx::pass_profile prof;
+    migraphx::run_passes(
+        m, {migraphx::dead_code_elimination{}, migraphx::dead_code_elimination{}}, {}, &prof);
+    EXPECT(prof.entries.size() == 2);
+    EXPECT(prof.entries[0].pass == "dead_code_elimination");
+    EXPECT(prof.entries[0].instructions_before == count);
+    EXPECT(prof.entries[0].instructions_after == count - 1);
+    EXPECT(prof.entries[1].instructions_before == count - 1);
+    EXPECT(prof.entries[1].instructions_after == count - 1);
+
+    auto v       = prof.to_value();
+    auto summary = v.at("summary").at("dead_code_elimination");
+    EXPECT(summary.at("runs").to<int>() == 2);
+    EXPECT(summary.at("instructions_delta").to<int>() == -1);
+    EXPECT(v.at("passes").size() == 2);
+}
+
+TEST_CASE(pass_profile_compile)
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+    auto one = mm->add_literal(1);
+    auto two = mm->add_literal(2);
+    mm->add_instruction(migraphx::make_op("add"), one, two);
+
+    migraphx::pass_profile prof;
+    migraphx::compile_options options;
+    options.profile = &prof;
+    p.compile(migraphx::ref::target{}, options);
+    EXPECT(not prof.entries.empty());
+    EXPECT(prof.total_time() >= 0);
+}
+
+int main(int argc, const char* argv[]) { test::run(argc, argv); }
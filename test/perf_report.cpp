@@ -27,4 +27,55 @@ TEST_CASE(perf_report)
     EXPECT(not migraphx::contains(output, "fast"));
 }
 
+TEST_CASE(perf_report_data)
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+
+    auto one = mm->add_literal(1);
+    auto two = mm->add_literal(2);
+    mm->add_instruction(migraphx::make_op("add"), one, two);
+    p.compile(migraphx::ref::target{});
+    auto v = p.perf_report_data(2, {});
+
+    EXPECT(v.contains("rate"));
+    EXPECT(v.contains("total_time"));
+    EXPECT(v.contains("overhead_time"));
+    EXPECT(v.at("instructions").size() == 3);
+    for(auto&& ins : v.at("instructions"))
+    {
+        EXPECT(ins.at("min").to<double>() <= ins.at("max").to<double>());
+        EXPECT(ins.at("stddev").to<double>() >= 0);
+    }
+    EXPECT(v.at("operators").contains("@literal"));
+}
+
+TEST_CASE(perf_report_options)
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+
+    auto one = mm->add_literal(1);
+    auto two = mm->add_literal(2);
+    mm->add_instruction(migraphx::make_op("add"), one, two);
+    p.compile(migraphx::ref::target{});
+
+    migraphx::perf_options options;
+    options.warmup            = 0;
+    options.outlier_threshold = 0;
+    auto all                  = p.perf_report_data(20, {}, options).at("total");
+    EXPECT(all.at("samples").to<std::size_t>() == 20);
+    EXPECT(all.at("outliers").to<std::size_t>() == 0);
+    EXPECT(all.at("ci").to<double>() >= 0);
+
+    // A wide confidence interval stops sampling early
+    options.ci_width = 1000;
+    auto v           = p.perf_report_data(100, {}, options);
+    auto early       = v.at("total");
+    EXPECT(early.at("samples").to<std::size_t>() < 100);
+    // The instructions are timed in the same samples as the total
+    for(auto&& ins : v.at("instructions"))
+        EXPECT(ins.at("samples").to<std::size_t>() == early.at("samples").to<std::size_t>());
+}
+
 int main(int argc, const char* argv[]) { test::run(argc, argv); }
@@ -0,0 +1,223 @@
+import sys
+if sys.version_info < (3, 0):
+    sys.exit()
+
+import os
+import shutil
+import tempfile
+import threading
+import migraphx
+import numpy as np
+from onnx_migraphx.backend import MIGraphXBackend, SessionOptions
+from onnx_migraphx.backend_rep import MIGraphXBackendRep
+
+
+def read_model(name):
+    with open(name, "rb") as f:
+        return f.read()
+
+
+def create_program():
+    p = migraphx.parse_onnx("leaky_relu_test.onnx")
+    p.compile(migraphx.get_target("ref"))
+    return p
+
+
+def test_cache_eviction():
+    MIGraphXBackend.clear_cache()
+    MIGraphXBackend.set_cache_size(2)
+    for key in ["a", "b", "c"]:
+        MIGraphXBackend._cache_put(key, (create_program(), ["0"]))
+    assert MIGraphXBackend._cache_get("a") is None
+    assert MIGraphXBackend._cache_get("b") is not None
+    # "b" was used last so "c" is evicted first
+    MIGraphXBackend._cache_put("d", (create_program(), ["0"]))
+    assert MIGraphXBackend._cache_get("c") is None
+    assert MIGraphXBackend._cache_get("b") is not None
+    assert MIGraphXBackend._cache_get("d") is not None
+
+    MIGraphXBackend.set_cache_size(1)
+    assert len(MIGraphXBackend._cache) == 1
+    MIGraphXBackend.set_cache_size(0)
+    MIGraphXBackend._cache_put("e", (create_program(), ["0"]))
+    assert MIGraphXBackend._cache_get("e") is None
+    MIGraphXBackend.set_cache_size(16)
+
+
+def test_cache_key():
+    model = read_model("leaky_relu_test.onnx")
+    options = SessionOptions().compile_key()
+    key = MIGraphXBackend._cache_key(model, "GPU", options)
+    assert key == MIGraphXBackend._cache_key(model, "GPU", dict(options))
+    assert key != MIGraphXBackend._cache_key(model, "CPU", options)
+    assert key != MIGraphXBackend._cache_key(model + b" ", "GPU", options)
+    for k, v in [("fp16", True), ("fast_math", False),
+                 ("offload_copy", False)]:
+        changed = SessionOptions(**{k: v}).compile_key()
+        assert key != MIGraphXBackend._cache_key(model, "GPU", changed)
+
+
+def test_cache_disk():
+    cache_dir = tempfile.mkdtemp()
+    try:
+        MIGraphXBackend.clear_cache()
+        p = create_program()
+        MIGraphXBackend._cache_save("key", (p, ["0"]), cache_dir)
+        assert os.path.isfile(os.path.join(cache_dir, "key.mxr"))
+        assert os.path.isfile(os.path.join(cache_dir, "key.json"))
+        assert not [f for f in os.listdir(cache_dir) if f.endswith(".tmp")]
+
+        assert MIGraphXBackend._cache_get("missing", cache_dir) is None
+        loaded, input_names = MIGraphXBackend._cache_get("key", cache_dir)
+        assert input_names == ["0"]
+        assert loaded == p
+        # Loading from disk also fills the in-memory cache
+        shutil.rmtree(cache_dir)
+        assert MIGraphXBackend._cache_get("key") is not None
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        MIGraphXBackend.clear_cache()
+
+
+def test_prepare_cached():
+    model = read_model("leaky_relu_test.onnx")
+    MIGraphXBackend.clear_cache()
+    x = np.array([-1.0, 0.0, 2.0], dtype=np.float32)
+    rep1 = MIGraphXBackend.prepare(model)
+    rep2 = MIGraphXBackend.prepare(model)
+    assert len(MIGraphXBackend._cache) == 1
+    # Every rep gets its own copy of the cached program
+    assert rep1._program is not rep2._program
+    np.testing.assert_allclose(rep1.run([x])[0], rep2.run([x])[0])
+    MIGraphXBackend.clear_cache()
+
+
+def leaky_relu(x):
+    return np.where(x > 0, x, x * np.float32(0.01))
+
+
+def compile_batch(batch):
+    p = migraphx.parse_onnx("leaky_relu_test.onnx",
+                            map_input_dims={"0": [batch]})
+    p.compile(migraphx.get_target("ref"))
+    return (p, p.get_parameter_names())
+
+
+def test_buckets():
+    compiled = []
+
+    def compile(batch):
+        compiled.append(batch)
+        return compile_batch(batch)
+
+    rep = MIGraphXBackendRep(None, None, [4, 2], compile)
+    # The smallest bucket that fits is padded and the padding is sliced off
+    x = np.arange(-1, 2, dtype=np.float32)
+    r = rep.run([x])[0]
+    assert r.shape == (3, )
+    np.testing.assert_allclose(r, leaky_relu(x))
+    assert compiled == [4]
+
+    # Larger requests are split into chunks of the largest bucket
+    x = np.arange(-2, 3, dtype=np.float32)
+    r = rep.run([x])[0]
+    assert r.shape == (5, )
+    np.testing.assert_allclose(r, leaky_relu(x))
+    assert compiled == [4, 2]
+
+    x = np.arange(-1, 1, dtype=np.float32)
+    np.testing.assert_allclose(rep.run(x)[0], leaky_relu(x))
+    assert compiled == [4, 2]
+
+    stats = rep.get_stats()
+    assert stats["requests"] == 4
+    assert stats["compiles"] == 2
+    assert stats["samples"] == 10
+    assert stats["padded_samples"] == 2
+    assert stats["bucket_requests"] == {2: 2, 4: 2}
+    assert stats["hit_rate"] == 0.5
+    assert stats["padding_waste"] == 2.0 / 12.0
+
+
+def test_buckets_compile_concurrently():
+    compiling = threading.Event()
+    done = threading.Event()
+
+    def compile(batch):
+        if batch == 4:
+            compiling.set()
+            done.wait(60)
+        return compile_batch(batch)
+
+    rep = MIGraphXBackendRep(None, None, [2, 4], compile)
+    x = np.arange(-2, 2, dtype=np.float32)
+    t = threading.Thread(target=rep.run, args=([x], ))
+    t.start()
+    compiling.wait(60)
+    # A run with another batch size does not wait for the compile
+    np.testing.assert_allclose(rep.run([x[:2]])[0], leaky_relu(x[:2]))
+    assert not done.is_set()
+    done.set()
+    t.join()
+    np.testing.assert_allclose(rep.run([x])[0], leaky_relu(x))
+    assert rep.get_stats()["compiles"] == 2
+
+
+def test_session_options():
+    options = SessionOptions(fp16=True, batch_sizes=[1, 2])
+    assert options.fp16
+    assert options.batch_sizes == [1, 2]
+    assert options.fast_math
+    try:
+        SessionOptions(fp32=True)
+        assert False
+    except TypeError:
+        pass
+
+    # Only the options that change the compiled program are in the key
+    key = SessionOptions().compile_key()
+    assert key == SessionOptions(cache_dir="dir",
+                                 batch_sizes=[1]).compile_key()
+    assert "int8" not in key
+    data = [{"0": np.arange(3, dtype=np.float32)}]
+    int8_key = SessionOptions(int8_calibration=data).compile_key()
+    assert int8_key["int8"] == SessionOptions(
+        int8_calibration=[dict(d) for d in data]).compile_key()["int8"]
+    other = [{"0": np.arange(1, 4, dtype=np.float32)}]
+    assert int8_key["int8"] != SessionOptions(
+        int8_calibration=other).compile_key()["int8"]
+
+
+def test_prepare_options():
+    model = read_model("leaky_relu_test.onnx")
+    MIGraphXBackend.clear_cache()
+    rep = MIGraphXBackend.prepare(model)
+    assert "half_type" not in str(rep._program)
+    assert len(rep._program.get_parameter_shapes()) == 1
+
+    # Keyword arguments override the fields of the options
+    options = SessionOptions()
+    rep = MIGraphXBackend.prepare(model, options=options, fp16=True)
+    assert not options.fp16
+    assert "half_type" in str(rep._program)
+    assert len(MIGraphXBackend._cache) == 2
+
+    rep = MIGraphXBackend.prepare(model,
+                                  options=SessionOptions(offload_copy=False))
+    assert len(rep._program.get_parameter_shapes()) > 1
+    assert len(MIGraphXBackend._cache) == 3
+
+    # Options that do not change the program reuse the cached program
+    MIGraphXBackend.prepare(model, cache_dir=None, fast_math=True)
+    assert len(MIGraphXBackend._cache) == 3
+    MIGraphXBackend.clear_cache()
+
+
+test_cache_eviction()
+test_cache_key()
+test_cache_disk()
+test_prepare_cached()
+test_buckets()
+test_buckets_compile_concurrently()
+test_session_options()
+test_prepare_options()
@@ -1,4 +1,4 @@
-import migraphx, array, sys
+import migraphx, array, sys, threading
 
 
 def test_conv_relu():
@@ -53,6 +53,216 @@ def test_add_scalar():
     print(r)
 
 
+def test_run_threads():
+    p = migraphx.parse_onnx("conv_relu_maxpool_test.onnx")
+    p.compile(migraphx.get_target("ref"))
+    params = {}
+    for key, value in p.get_parameter_shapes().items():
+        params[key] = migraphx.generate_argument(value)
+    expected = p.run(params)[-1]
+
+    results = [None] * 4
+
+    def run(i, prog):
+        results[i] = prog.run(params)[-1]
+
+    threads = [
+        threading.Thread(target=run, args=(i, p.clone()))
+        for i in range(len(results))
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    for r in results:
+        assert r == expected
+
+
+def test_execution_context():
+    p = migraphx.parse_onnx("conv_relu_maxpool_test.onnx")
+    p.compile(migraphx.get_target("ref"))
+    params = {}
+    for key, value in p.get_parameter_shapes().items():
+        params[key] = migraphx.generate_argument(value)
+    expected = p.run(params)[-1]
+
+    ctx = p.create_execution_context()
+    assert ctx.run(params)[-1] == expected
+    for key, value in params.items():
+        ctx.bind(key, value)
+    assert ctx.run({})[-1] == expected
+
+
+def test_run_into():
+    p = migraphx.parse_onnx("add_scalar_test.onnx")
+    p.compile(migraphx.get_target("ref"))
+
+    params = {}
+    params["0"] = migraphx.argument(
+        create_buffer("B", list(range(120)), [2, 3, 4, 5]))
+    params["1"] = migraphx.argument(create_buffer("B", [1], ()))
+    expected = p.run(params)[-1]
+
+    out = bytearray(expected.get_shape().bytes())
+    buffer = memoryview(out).cast("B", expected.get_shape().lens())
+    p.run_into(params, [buffer])
+    assert migraphx.argument(buffer) == expected
+
+
+def test_bind():
+    p = migraphx.parse_onnx("add_scalar_test.onnx")
+    p.compile(migraphx.get_target("ref"))
+
+    arg0 = create_buffer("B", list(range(120)), [2, 3, 4, 5])
+    arg1 = create_buffer("B", [1], ())
+    expected = p.run({"0": arg0, "1": arg1})[-1]
+
+    b = p.bind(["0", "1"])
+    assert b.names() == ["0", "1"]
+    for i in range(3):
+        r = b.run(arg0, arg1)[-1]
+        assert r == expected
+
+
+def test_run_async():
+    p = migraphx.parse_onnx("conv_relu_maxpool_test.onnx")
+    p.compile(migraphx.get_target("ref"))
+    params = {}
+    for key, value in p.get_parameter_shapes().items():
+        params[key] = migraphx.generate_argument(value)
+    expected = p.run(params)[-1]
+
+    e = migraphx.executor(p, workers=2, queue_size=2)
+    futures = [e.run_async(params) for i in range(8)]
+    for f in futures:
+        assert f.result()[-1] == expected
+
+    # The inputs are kept alive after they are removed from the dict
+    inputs = {
+        key: migraphx.generate_argument(value)
+        for key, value in p.get_parameter_shapes().items()
+    }
+    f = e.run_async(inputs)
+    inputs.clear()
+    assert f.result()[-1] == expected
+    e.shutdown()
+
+    # The program has a default executor
+    assert p.run_async(params).result()[-1] == expected
+
+    # The executor can be shut down and released from a callback that runs
+    # on one of its workers
+    e = migraphx.executor(p, workers=2)
+    done = threading.Event()
+    executors = [e]
+
+    def release(f):
+        executors.pop().shutdown()
+        done.set()
+
+    # Keep the GIL until the callback is added, so the task can not finish
+    # before that
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(60)
+    f = e.run_async(params)
+    f.add_done_callback(release)
+    sys.setswitchinterval(interval)
+    del e
+    assert done.wait(60)
+    assert f.result()[-1] == expected
+
+
+def test_dlpack():
+    data = bytearray(array.array("f", [1, 2, 3, 4]).tobytes())
+    m = memoryview(data).cast("f")
+    a = migraphx.argument(m)
+    b = migraphx.from_dlpack(a)
+    assert a == b
+    assert b.__dlpack_device__() == (1, 0)
+    assert b.get_shape().lens() == [4]
+    m[0] = 5
+    assert b.tolist() == [5, 2, 3, 4]
+
+
+def test_numpy():
+    try:
+        import numpy as np
+    except ImportError:
+        return
+
+    a = migraphx.argument(np.arange(6, dtype=np.float16).reshape(2, 3))
+    v = a.numpy()
+    assert v.dtype == np.float16
+    assert v.tolist() == [[0, 1, 2], [3, 4, 5]]
+    assert not v.flags.owndata
+
+    t = migraphx.argument(np.arange(6, dtype=np.float32).reshape(2, 3).T)
+    assert t.numpy(copy=True).tolist() == [[0, 3], [1, 4], [2, 5]]
+
+    b = migraphx.argument(np.array([True, False]))
+    assert migraphx.to_numpy([b])[0].dtype == np.bool_
+
+
+def test_compile_profile():
+    p = migraphx.parse_onnx("conv_relu_maxpool_test.onnx")
+    prof = p.compile(migraphx.get_target("ref"), profile=True)
+    assert len(prof["passes"]) > 0
+    assert prof["summary"]["dead_code_elimination"]["runs"] > 1
+    assert prof["total_time"] >= 0
+
+
+def test_perf_report_data():
+    p = migraphx.parse_onnx("conv_relu_maxpool_test.onnx")
+    p.compile(migraphx.get_target("ref"))
+    r = p.perf_report_data(n=2)
+    assert r["rate"] > 0
+    assert len(r["instructions"]) > 0
+    for ins in r["instructions"]:
+        assert ins["min"] <= ins["max"]
+    assert sum(r["operators"].values()) > 0
+
+
+def test_memory_report():
+    p = migraphx.parse_onnx("conv_relu_maxpool_test.onnx")
+    p.compile(migraphx.get_target("ref"))
+    r = p.memory_report()
+    params = p.get_parameter_shapes()
+    assert r["parameter_bytes"] == sum(s.bytes() for s in params.values())
+    assert r["peak_bytes"] >= r["output_bytes"]
+    assert "main" in r["modules"]
+
+
+def test_eval_hook():
+    p = migraphx.parse_onnx("conv_relu_maxpool_test.onnx")
+    p.compile(migraphx.get_target("ref"))
+    params = {}
+    for key, value in p.get_parameter_shapes().items():
+        params[key] = migraphx.generate_argument(value)
+
+    names = []
+    results = []
+
+    def before(info):
+        assert info.time() == 0
+        assert info.result() is None
+        names.append(info.name())
+
+    def after(info):
+        assert info.time() >= 0
+        assert info.result().get_shape() == info.output_shape()
+        results.append(info.result().tolist())
+
+    p.add_eval_hook(before=before, after=after, outputs=True)
+    r = p.run(params)[-1]
+    assert len(names) > 0
+    assert len(results) == len(names)
+    assert results[-1] == r.tolist()
+
+    p.clear_eval_hooks()
+    p.run(params)
+    assert len(results) == len(names)
+
+
 def test_module():
     p = migraphx.parse_onnx("add_scalar_test.onnx")
     mm = p.get_main_module()
@@ -61,6 +271,17 @@ def test_module():
 
 
 test_conv_relu()
+test_run_threads()
+test_execution_context()
+test_run_async()
+test_perf_report_data()
+test_compile_profile()
+test_memory_report()
+test_eval_hook()
 test_module()
 if sys.version_info >= (3, 0):
     test_add_scalar()
+    test_run_into()
+    test_bind()
+    test_dlpack()
+    test_numpy()
@@ -0,0 +1,35 @@
+import migraphx
+
+
+def create_program(target):
+    p = migraphx.parse_onnx("leaky_relu_test.onnx")
+    p.compile(migraphx.get_target(target))
+    return p
+
+
+def test_run_async_inputs():
+    p = create_program("cpu")
+    ref = create_program("ref")
+    inputs = []
+    for i in range(8):
+        # The scratch memory is passed too, but every worker uses its own
+        inputs.append({
+            key: migraphx.generate_argument(value, i)
+            for key, value in p.get_parameter_shapes().items()
+        })
+    expected = [
+        ref.run({key: params[key]
+                 for key in ref.get_parameter_names()})[-1]
+        for params in inputs
+    ]
+
+    # Every worker reuses its scratch memory, so each task is checked
+    # against its own inputs after all of them have run
+    e = migraphx.executor(p, workers=2)
+    futures = [e.run_async(params) for params in inputs]
+    for f, r in zip(futures, expected):
+        assert f.result()[-1] == r
+    e.shutdown()
+
+
+test_run_async_inputs()
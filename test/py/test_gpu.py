@@ -72,7 +72,38 @@ def test_fp16_imagescaler():
     print(r)
 
 
+def test_eval_hook_outputs():
+    p = migraphx.parse_onnx("conv_relu_maxpool_test.onnx")
+    p.compile(migraphx.get_target("gpu"))
+    params = {}
+    for key, value in p.get_parameter_shapes().items():
+        params[key] = migraphx.generate_argument(value)
+
+    results = []
+
+    def after(info):
+        # The outputs are copied from the device, so they can be read here
+        results.append(np.array(info.result()))
+
+    p.add_eval_hook(after=after, outputs=True)
+    r = p.run(params)[-1]
+    assert len(results) > 0
+    assert np.array_equal(results[-1], np.array(r))
+
+
+def test_dlpack_device():
+    x = migraphx.argument(np.arange(4, dtype=np.float32))
+    assert x.__dlpack_device__() == (1, 0)
+    # The device memory is reported as ROCm memory in both directions
+    d = migraphx.to_gpu(x)
+    assert d.__dlpack_device__()[0] == 10
+    assert migraphx.from_dlpack(d).__dlpack_device__() == d.__dlpack_device__()
+    assert migraphx.from_gpu(migraphx.from_dlpack(d)) == x
+
+
 test_conv_relu()
 test_sub_uint64()
 test_neg_int64()
 test_fp16_imagescaler()
+test_eval_hook_outputs()
+test_dlpack_device()
@@ -1,4 +1,4 @@
-import migraphx, tempfile
+import migraphx, tempfile, pickle
 
 
 def test_conv_relu(format):
@@ -18,5 +18,22 @@ def test_conv_relu(format):
         assert p1.sort() == p2.sort()
 
 
+def test_buffer(format):
+    p1 = migraphx.parse_onnx("conv_relu_maxpool_test.onnx")
+    b = migraphx.save_buffer(p1, format=format)
+    p2 = migraphx.load_buffer(b, format=format)
+    assert p1.sort() == p2.sort()
+
+
+def test_pickle():
+    p1 = migraphx.parse_onnx("conv_relu_maxpool_test.onnx")
+    p1.compile(migraphx.get_target("ref"))
+    p2 = pickle.loads(pickle.dumps(p1))
+    assert p1.sort() == p2.sort()
+
+
 test_conv_relu('msgpack')
 test_conv_relu('json')
+test_buffer('msgpack')
+test_buffer('json')
+test_pickle()
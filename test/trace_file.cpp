@@ -0,0 +1,53 @@
+#include <migraphx/trace_file.hpp>
+#include <migraphx/program.hpp>
+#include <migraphx/ref/target.hpp>
+#include <migraphx/file_buffer.hpp>
+#include <migraphx/json.hpp>
+#include <migraphx/make_op.hpp>
+#include <migraphx/tmp_dir.hpp>
+
+#include "test.hpp"
+
+TEST_CASE(trace_file)
+{
+    migraphx::program p;
+    auto* mm = p.get_main_module();
+
+    auto one = mm->add_literal(1);
+    auto two = mm->add_literal(2);
+    mm->add_instruction(migraphx::make_op("add"), one, two);
+    p.compile(migraphx::ref::target{});
+
+    migraphx::tmp_dir td;
+    auto filename = (td.path / "trace.json").string();
+    migraphx::set_trace_file(filename);
+    p.eval({});
+    p.eval({});
+    migraphx::set_trace_file("");
+
+    auto buffer              = migraphx::read_buffer(filename);
+    auto events              = migraphx::from_json_string(buffer.data(), buffer.size());
+    std::size_t instructions = 0;
+    std::size_t evals        = 0;
+    for(auto&& event : events)
+    {
+        if(not event.contains("cat"))
+            continue;
+        EXPECT(event.at("ph").to<std::string>() == "X");
+        EXPECT(event.at("dur").to<double>() >= 0);
+        auto cat = event.at("cat").to<std::string>();
+        if(cat == "instruction")
+        {
+            instructions++;
+            EXPECT(event.at("args").contains("bytes"));
+        }
+        else if(cat == "program")
+        {
+            evals++;
+        }
+    }
+    EXPECT(evals == 2);
+    EXPECT(instructions == 2 * mm->size());
+}
+
+int main(int argc, const char* argv[]) { test::run(argc, argv); }
@@ -162,8 +162,35 @@ bool equal(const T& x, const T& y)
 
 std::vector<argument> run(program& p, const parameter_map& params) { return p.eval(params); }
 
+std::vector<argument> run(execution_context& ctx, const parameter_map& params)
+{
+    return ctx.eval(params);
+}
+
 std::vector<shape> get_output_shapes(program& p) { return p.get_output_shapes(); }
 
+void add_eval_hook(program& p,
+                   migraphx_instruction_callback before,
+                   migraphx_instruction_callback after,
+                   void* data,
+                   bool outputs)
+{
+    // The info is passed as a reference to the handle, the same as other const references
+    auto wrap =
+        [=](migraphx_instruction_callback f) -> std::function<void(const instruction_info&)> {
+        if(f == nullptr)
+            return nullptr;
+        return [=](const instruction_info& info) {
+            f(reinterpret_cast<const migraphx_instruction_info*>(&info), data);
+        };
+    };
+    eval_hook h;
+    h.before  = wrap(before);
+    h.after   = wrap(after);
+    h.outputs = outputs;
+    p.add_eval_hook(h);
+}
+
 void print_program(const program& p) { std::cout << p << std::endl; }
 
 void print_module(const module& m) { std::cout << m << std::endl; }
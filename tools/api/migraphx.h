@@ -60,6 +60,10 @@ typedef struct
     const char* format;
 } migraphx_file_options;
 
+/// Callback that runs before or after an instruction when a program is evaluated
+typedef void (*migraphx_instruction_callback)(const struct migraphx_instruction_info* info,
+                                              void* data);
+
 <% generate_c_header() %>
 
 #ifdef __cplusplus
@@ -22,6 +22,9 @@ struct context
 {
     /// Wait for any tasks in the context to complete
     void finish() const;
+    /// Whether copies of the context can evaluate a program at the same time,
+    /// which is only possible when the copies do not share any state
+    bool concurrent_copies() const;
 };
 
 #else
@@ -35,11 +38,21 @@ value to_value_context(const T&)
 template <class T>
 void from_value_context(T&, const value&){}
 
+template <class T>
+bool concurrent_copies_context(const T&)
+{
+    return false;
+}
+
 <%
  interface('context',
            virtual('to_value', returns = 'value', const = True, default = 'to_value_context'),
            virtual('from_value', v = 'const value&', default = 'from_value_context'),
-           virtual('finish', returns = 'void', const = True)) %>
+           virtual('finish', returns = 'void', const = True),
+           virtual('concurrent_copies',
+                   returns = 'bool',
+                   const = True,
+                   default = 'concurrent_copies_context')) %>
 
     inline void migraphx_to_value(value& v, const context& ctx)
 {